@@ -0,0 +1,182 @@
+"""
+Concurrent throughput of the sync and async feedback pipelines.
+
+The Azure SDK clients are replaced with local fakes that only wait for a fixed
+latency, so the numbers show how many requests each pipeline can keep in flight
+rather than how fast the real services are.
+
+Usage (from the api directory):
+    python -m benchmarks.async_pipeline --requests 400 --concurrency 200
+"""
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from typing import Callable, List
+from unittest.mock import patch
+
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_DEPLOYMENT", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_MODEL", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_API_VERSION", "2024-10-21")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "http://localhost")
+os.environ.setdefault("AZURE_OPENAI_TEMPERATURE", "0.7")
+os.environ.setdefault("AZURE_OPENAI_MAX_TOKENS", "50")
+os.environ.setdefault("AZURE_OPENAI_SYSTEM_PROMPT", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_ENDPOINT", "http://localhost")
+os.environ.setdefault("AZURE_AI_SERVICES_REGION", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_AUDIO_PATH", tempfile.mkdtemp())
+os.environ.setdefault("PROMPT_FILE", "prompts")
+os.environ.setdefault("RESILIENCE_ENABLED", "false")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from langchain.schema import AIMessage  # noqa: E402
+from azure.cognitiveservices.speech import ResultReason  # noqa: E402
+
+from src.actions import GenerateFeedbackResponse  # noqa: E402
+from src.clients import (  # noqa: E402
+    azure_openai_client,
+    azure_text_analytics_client,
+)
+from src.dtos import Feedback, SentimentResponse  # noqa: E402
+
+
+class FakeSentiment:
+    sentiment = "positive"
+
+
+class FakeTextAnalytics:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def analyze_sentiment(self, documents: List[str]):
+        time.sleep(self.latency)
+        return [FakeSentiment() for _ in documents]
+
+
+class FakeAsyncTextAnalytics:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def analyze_sentiment(self, documents: List[str]):
+        await asyncio.sleep(self.latency)
+        return [FakeSentiment() for _ in documents]
+
+
+class FakeChatModel:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def invoke(self, messages):
+        time.sleep(self.latency)
+        return AIMessage(content="Thank you for your feedback!")
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(self.latency)
+        return AIMessage(content="Thank you for your feedback!")
+
+
+class FakeResult:
+    reason = ResultReason.SynthesizingAudioCompleted
+    audio_data = b"audio"
+
+
+class FakeSignal:
+    def __init__(self):
+        self.callbacks: List[Callable] = []
+
+    def connect(self, callback: Callable):
+        self.callbacks.append(callback)
+
+    def disconnect_all(self):
+        self.callbacks.clear()
+
+    def fire(self):
+        for callback in self.callbacks:
+            callback(None)
+
+
+class FakeResultFuture:
+    def get(self):
+        return FakeResult()
+
+
+class FakeSynthesizer:
+    """Speech service fake: the async call completes on the SDK's own thread."""
+
+    latency = 0.0
+
+    def __init__(self, speech_config=None, audio_config=None):
+        self.synthesis_completed = FakeSignal()
+        self.synthesis_canceled = FakeSignal()
+
+    def speak_ssml(self, ssml: str):
+        time.sleep(self.latency)
+        return FakeResult()
+
+    def speak_ssml_async(self, ssml: str):
+        threading.Timer(self.latency, self.synthesis_completed.fire).start()
+        return FakeResultFuture()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/sync")
+    def sync_feedback(feedback: Feedback) -> SentimentResponse:
+        return GenerateFeedbackResponse()(feedback)
+
+    @app.post("/async")
+    async def async_feedback(feedback: Feedback) -> SentimentResponse:
+        return await GenerateFeedbackResponse().call_async(feedback)
+
+    return app
+
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def send():
+            async with semaphore:
+                response = await client.post(path, json={"feedback": "Great product!"})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send() for _ in range(requests)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.1,
+                        help="Latency of each fake service call, in seconds.")
+    args = parser.parse_args()
+
+    FakeSynthesizer.latency = args.latency
+    app = build_app()
+
+    with patch.object(azure_text_analytics_client, "client", FakeTextAnalytics(args.latency)), \
+            patch.object(azure_text_analytics_client, "async_client", FakeAsyncTextAnalytics(args.latency)), \
+            patch.object(azure_openai_client, "client", FakeChatModel(args.latency)), \
+            patch("src.clients.azure_speech_synthesis.SpeechSynthesizer", FakeSynthesizer):
+        print(
+            f"{args.requests} requests, concurrency {args.concurrency}, "
+            f"{args.latency * 1000:.0f} ms per service call"
+        )
+        for path in ("/sync", "/async"):
+            elapsed = asyncio.run(run(app, path, args.requests, args.concurrency))
+            print(
+                f"{path:<7} {elapsed:7.2f} s  {args.requests / elapsed:8.1f} req/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Per-request cost of building the LLM prompt.
+
+Compares parsing prompts.yaml on every request, as `Prompt()` used to, with the
+compiled prompt registry that only checks the file modification time.
+
+Usage (from the api directory):
+    python -m benchmarks.prompt_registry --iterations 10000
+"""
+import os
+import time
+import argparse
+from typing import Callable
+
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_DEPLOYMENT", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_MODEL", "benchmark")
+os.environ.setdefault("AZURE_OPENAI_API_VERSION", "2024-10-21")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "http://localhost")
+os.environ.setdefault("AZURE_OPENAI_TEMPERATURE", "0.7")
+os.environ.setdefault("AZURE_OPENAI_MAX_TOKENS", "50")
+os.environ.setdefault("AZURE_OPENAI_SYSTEM_PROMPT", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_ENDPOINT", "http://localhost")
+os.environ.setdefault("AZURE_AI_SERVICES_REGION", "benchmark")
+os.environ.setdefault("AZURE_AI_SERVICES_AUDIO_PATH", "audio")
+os.environ.setdefault("PROMPT_FILE", "prompts")
+
+import yaml  # noqa: E402
+
+from src.utils import Prompt, PromptRegistry  # noqa: E402
+
+
+def parse_every_time(path: str) -> Callable[[str, str], str]:
+    def prompt(sentiment: str, feedback_text: str) -> str:
+        with open(path, "r") as file:
+            prompts = yaml.safe_load(file)["llm_prompts"]
+        return prompts.get(sentiment, prompts["NEUTRAL"]).format(feedback_text=feedback_text)
+
+    return prompt
+
+
+def registry(path: str) -> Callable[[str, str], str]:
+    return Prompt(PromptRegistry(path=path))
+
+
+def measure(prompt: Callable[[str, str], str], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        prompt("POSITIVE", "Great product!")
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--path", default="prompts.yaml")
+    args = parser.parse_args()
+
+    print(f"{args.iterations} prompts from {args.path}")
+    for name, build in (("parse every time", parse_every_time), ("registry", registry)):
+        elapsed = measure(build(args.path), args.iterations)
+        print(f"{name:<17} {elapsed * 1e6:9.1f} us/prompt")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,20 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src import api_settings
 from src.clients import (
     azure_openai_client,
     azure_text_analytics_client,
     azure_speech_synthesis_client,
 )
-from src.dtos import Feedback, SentimentResponse
-from src.utils import Prompt
+from src.dtos import (
+    Feedback,
+    SentimentResponse,
+    FeedbackBatchResult,
+    FeedbackBatchResponse,
+)
+from src.storage import audio_links
+from src.utils import Prompt, SentenceSplitter
 
 
 class GenerateFeedbackResponse:
@@ -13,11 +23,197 @@ class GenerateFeedbackResponse:
         feedback_response = azure_openai_client(
             Prompt()(sentiment, feedback.feedback)
         )
-        audio_file = azure_speech_synthesis_client(feedback_response, sentiment)
+        audio_file = azure_speech_synthesis_client(
+            feedback_response, sentiment, feedback.audio_format
+        )
+
+        return SentimentResponse(
+            feedback=feedback.feedback,
+            response=feedback_response,
+            sentiment=sentiment,
+            audio=audio_file,
+            audio_url=audio_links.url(audio_file),
+        )
+
+    async def call_async(self, feedback: Feedback) -> SentimentResponse:
+        sentiment = await azure_text_analytics_client.analyze_sentiment_async(
+            feedback.feedback
+        )
+        feedback_response = await azure_openai_client.call_async(
+            Prompt()(sentiment, feedback.feedback)
+        )
+        audio_file = await azure_speech_synthesis_client.call_async(
+            feedback_response, sentiment, feedback.audio_format
+        )
 
         return SentimentResponse(
             feedback=feedback.feedback,
             response=feedback_response,
             sentiment=sentiment,
             audio=audio_file,
+            audio_url=audio_links.url(audio_file),
+        )
+
+    async def stream_async(
+        self, feedback: Feedback
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        sentiment = await azure_text_analytics_client.analyze_sentiment_async(
+            feedback.feedback
         )
+        yield "sentiment", {"sentiment": sentiment}
+
+        tokens = []
+        async for token in azure_openai_client.stream_async(
+            Prompt()(sentiment, feedback.feedback)
+        ):
+            tokens.append(token)
+            yield "token", {"token": token}
+
+        feedback_response = "".join(tokens).strip()
+        audio_file = await azure_speech_synthesis_client.call_async(
+            feedback_response, sentiment, feedback.audio_format
+        )
+
+        yield "audio", {
+            "response": feedback_response,
+            "audio": audio_file,
+            "audio_url": audio_links.url(audio_file),
+        }
+
+    async def speech_async(
+        self, feedback: Feedback, audio_format: Optional[str] = None
+    ) -> Tuple[str, AsyncIterator[bytes]]:
+        """
+        Answer the feedback as a pipelined audio stream.
+
+        Each sentence of the streamed LLM response is sent to speech synthesis as
+        soon as it is complete, while the rest of the response is still being
+        generated. The audio of every sentence is streamed in order.
+
+        Args:
+            feedback (Feedback): The user feedback.
+            audio_format (Optional[str]): The audio profile, overriding the one in
+                the feedback.
+
+        Returns:
+            Tuple[str, AsyncIterator[bytes]]: The sentiment and the audio chunks.
+        """
+        sentiment = await azure_text_analytics_client.analyze_sentiment_async(
+            feedback.feedback
+        )
+
+        return sentiment, self._pipeline_speech(
+            feedback.feedback, sentiment, audio_format or feedback.audio_format
+        )
+
+    async def _pipeline_speech(
+        self, feedback_text: str, sentiment: str, audio_format: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize each sentence of the streamed response eagerly, yielding the audio in order.
+
+        Args:
+            feedback_text (str): The user feedback text.
+            sentiment (str): The feedback sentiment.
+            audio_format (Optional[str]): The audio profile, the default one if None.
+
+        Yields:
+            bytes: The next chunk of audio.
+        """
+        segments: asyncio.Queue[Optional[asyncio.Queue] | Exception] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(
+            api_settings.azure_ai_services.speech_max_concurrency
+        )
+        tasks: List[asyncio.Task] = []
+
+        async def synthesize(sentence: str, audio: asyncio.Queue) -> None:
+            try:
+                async with semaphore:
+                    async for chunk in azure_speech_synthesis_client.stream_async(
+                        sentence, sentiment, audio_format
+                    ):
+                        audio.put_nowait(chunk)
+                audio.put_nowait(None)
+            except Exception as e:
+                audio.put_nowait(e)
+
+        def start(sentence: str) -> None:
+            audio: asyncio.Queue[Optional[bytes] | Exception] = asyncio.Queue()
+            tasks.append(asyncio.create_task(synthesize(sentence, audio)))
+            segments.put_nowait(audio)
+
+        async def split() -> None:
+            try:
+                splitter = SentenceSplitter()
+                async for token in azure_openai_client.stream_async(
+                    Prompt()(sentiment, feedback_text)
+                ):
+                    for sentence in splitter.feed(token):
+                        start(sentence)
+
+                if (sentence := splitter.flush()) is not None:
+                    start(sentence)
+                segments.put_nowait(None)
+            except Exception as e:
+                segments.put_nowait(e)
+
+        tasks.append(asyncio.create_task(split()))
+
+        try:
+            while (segment := await segments.get()) is not None:
+                if isinstance(segment, Exception):
+                    raise segment
+
+                while (chunk := await segment.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def batch_async(self, feedbacks: List[Feedback]) -> FeedbackBatchResponse:
+        results = [FeedbackBatchResult(feedback=feedback.feedback) for feedback in feedbacks]
+
+        sentiments = await azure_text_analytics_client.analyze_sentiment_batch_async(
+            [result.feedback for result in results]
+        )
+        analyzed = []
+        for result, feedback, sentiment in zip(results, feedbacks, sentiments):
+            if isinstance(sentiment, Exception):
+                result.error = str(sentiment)
+            else:
+                result.sentiment = sentiment
+                analyzed.append((result, feedback))
+
+        prompt = Prompt()
+        responses = await azure_openai_client.batch_async(
+            [prompt(result.sentiment, result.feedback) for result, _ in analyzed]
+        )
+        answered = []
+        for (result, feedback), response in zip(analyzed, responses):
+            if isinstance(response, Exception):
+                result.error = str(response)
+            else:
+                result.response = response
+                answered.append((result, feedback))
+
+        semaphore = asyncio.Semaphore(
+            api_settings.azure_ai_services.speech_max_concurrency
+        )
+
+        async def synthesize(result: FeedbackBatchResult, feedback: Feedback) -> None:
+            async with semaphore:
+                try:
+                    result.audio = await azure_speech_synthesis_client.call_async(
+                        result.response, result.sentiment, feedback.audio_format
+                    )
+                    result.audio_url = audio_links.url(result.audio)
+                except Exception as e:
+                    result.error = str(e)
+
+        await asyncio.gather(
+            *(synthesize(result, feedback) for result, feedback in answered)
+        )
+
+        return FeedbackBatchResponse(results=results)
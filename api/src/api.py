@@ -1,15 +1,52 @@
-from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, RedirectResponse
+
+from src.clients import azure_speech_synthesis_client, health_monitor
+from src.storage import audio_retention
+from src.utils import DependencyUnavailableError, prompt_registry
 
 from src.controllers.post_feedback import router as post_feedback
 from src.controllers.get_audio import router as get_audio
 from src.controllers.get_health import router as get_health
+from src.controllers.get_jobs import router as get_jobs
+from src.controllers.get_metrics import router as get_metrics
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Load the prompts, pre-open the pooled speech synthesizer connections and
+    start the background health probes and audio retention sweep before serving
+    requests.
+    """
+    prompt_registry.load()
+
+    if azure_speech_synthesis_client.pool is not None:
+        await asyncio.to_thread(azure_speech_synthesis_client.pool.warm_up)
+
+    health_monitor.start()
+
+    if audio_retention is not None:
+        audio_retention.start()
+
+    yield
+
+    health_monitor.stop()
+
+    if audio_retention is not None:
+        audio_retention.stop()
+
 
 api = FastAPI(
     title="SentioVoice API",
     description="An API for sentiment analysis, LLM response generation, and speech synthesis.",
     version="0.1.0",
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
+    lifespan=lifespan,
 )
 
 
@@ -25,8 +62,29 @@ def root():
     return RedirectResponse(url="/docs")
 
 
+@api.exception_handler(DependencyUnavailableError)
+async def dependency_unavailable(
+    _: Request, error: DependencyUnavailableError
+) -> JSONResponse:
+    """
+    Report a dependency failing fast as a temporary unavailability.
+
+    Returns:
+        JSONResponse: 503 with a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(error)},
+        headers={"Retry-After": str(max(1, round(error.retry_after)))},
+    )
+
+
 api.include_router(post_feedback)
 
 api.include_router(get_audio)
 
 api.include_router(get_health)
+
+api.include_router(get_jobs)
+
+api.include_router(get_metrics)
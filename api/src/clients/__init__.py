@@ -1,3 +1,4 @@
 from .azure_openai import azure_openai_client
 from .azure_text_analytics import azure_text_analytics_client
 from .azure_speech_synthesis import azure_speech_synthesis_client
+from .health import health_monitor
@@ -0,0 +1,73 @@
+from typing import Dict, NamedTuple, Optional
+
+from azure.cognitiveservices.speech import SpeechSynthesisOutputFormat
+
+
+class AudioFormat(NamedTuple):
+    """
+    A synthesized audio profile.
+
+    Attributes:
+        output_format (SpeechSynthesisOutputFormat): The Speech SDK output format.
+        extension (str): The audio file extension.
+        media_type (str): The audio media type.
+        streamable (bool): Whether the audio of consecutive syntheses can be
+            concatenated into a single playable stream.
+    """
+
+    output_format: SpeechSynthesisOutputFormat
+    extension: str
+    media_type: str
+    streamable: bool = True
+
+
+AUDIO_FORMATS: Dict[str, AudioFormat] = {
+    "mp3-high": AudioFormat(
+        SpeechSynthesisOutputFormat.Audio48Khz192KBitRateMonoMp3, "mp3", "audio/mpeg"
+    ),
+    "mp3-low": AudioFormat(
+        SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3, "mp3", "audio/mpeg"
+    ),
+    "opus": AudioFormat(
+        SpeechSynthesisOutputFormat.Ogg24Khz16BitMonoOpus, "ogg", "audio/ogg"
+    ),
+    "pcm": AudioFormat(
+        SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm, "wav", "audio/wav", streamable=False
+    ),
+}
+
+MEDIA_TYPES: Dict[str, str] = {
+    audio_format.extension: audio_format.media_type
+    for audio_format in AUDIO_FORMATS.values()
+}
+
+
+def get_audio_format_for_accept(accept: Optional[str], default: str) -> Optional[str]:
+    """
+    Pick the audio profile matching an `Accept` header.
+
+    Media ranges are tried in order, ignoring quality values; `audio/mpeg` maps to
+    the default profile if it is an MP3 one, and to `mp3-high` otherwise.
+
+    Args:
+        accept (Optional[str]): The `Accept` header value.
+        default (str): The default audio profile.
+
+    Returns:
+        Optional[str]: The audio profile, the default one if any media type is
+            accepted, or None if no supported media type is accepted.
+    """
+    if not accept:
+        return default
+
+    for media_range in accept.split(","):
+        media_type = media_range.split(";", 1)[0].strip().lower()
+
+        if media_type in ("*/*", "audio/*", AUDIO_FORMATS[default].media_type):
+            return default
+
+        for name, audio_format in AUDIO_FORMATS.items():
+            if audio_format.media_type == media_type:
+                return name
+
+    return None
@@ -1,5 +1,7 @@
+import json
+import hashlib
 import logging
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from langchain.schema import SystemMessage, HumanMessage, AIMessage
 from langchain_openai import AzureChatOpenAI
@@ -7,6 +9,14 @@ from langchain_openai import AzureChatOpenAI
 from src import api_settings
 from src.settings.azure_openai import AzureOpenAI
 from src.clients.client_errors import AzureOpenAIClientError
+from src.settings.resilience import Resilience
+from src.utils import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DependencyGuard,
+    Hedger,
+    ResponseCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +27,11 @@ class AzureOpenAIClient:
 
     Attributes:
         client (AzureChatOpenAI): An instance of the AzureChatOpenAI client.
+        cache (Optional[ResponseCache]): Cached responses, if enabled.
+        guard (DependencyGuard): Circuit breaker and concurrency limit around the API calls.
+        hedger (Optional[Hedger]): Hedges slow asynchronous calls, if enabled.
+        hedge_client (AzureChatOpenAI): Client for hedge calls, on the secondary
+            deployment if one is set.
     """
 
     def __init__(self):
@@ -29,6 +44,10 @@ class AzureOpenAIClient:
         self.client: AzureChatOpenAI = self._get_openai_client(
             api_settings.azure_openai
         )
+        self.cache: Optional[ResponseCache] = self._get_cache(api_settings.azure_openai)
+        self.guard: DependencyGuard = self._get_guard(api_settings.resilience)
+        self.hedger: Optional[Hedger[AIMessage]] = self._get_hedger(api_settings.azure_openai)
+        self.hedge_client: AzureChatOpenAI = self._get_hedge_client(api_settings.azure_openai)
 
     def __call__(self, prompt: str) -> str:
         """
@@ -40,33 +59,349 @@ class AzureOpenAIClient:
         Returns:
             str: The API response content after stripping any leading/trailing whitespace.
         """
-        messages: List = [
-            SystemMessage(content=api_settings.azure_openai.system_prompt),
-            HumanMessage(content=prompt),
+        content = self._get_cached(prompt)
+        if content is not None:
+            return content
+
+        with self.guard():
+            try:
+                response: AIMessage = self.client.invoke(self._get_messages(prompt))
+                content = response.content.strip()
+            except Exception as e:
+                error_message = f"LLM response generation failed: {e}"
+                logger.error(error_message)
+                raise AzureOpenAIClientError(error_message)
+
+        self._set_cached(prompt, content)
+
+        return content
+
+    async def call_async(self, prompt: str) -> str:
+        """
+        Send a prompt to the Azure OpenAI API without blocking the event loop.
+
+        If hedging is enabled and the call is slower than usual, an identical call is
+        sent, to the secondary deployment if set, and the first response wins.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            str: The API response content after stripping any leading/trailing whitespace.
+        """
+        content = await self._get_cached_async(prompt)
+        if content is not None:
+            return content
+
+        with self.guard():
+            try:
+                response: AIMessage = await self._invoke_async(prompt)
+                content = response.content.strip()
+            except Exception as e:
+                error_message = f"LLM response generation failed: {e}"
+                logger.error(error_message)
+                raise AzureOpenAIClientError(error_message)
+
+        await self._set_cached_async(prompt, content)
+
+        return content
+
+    async def _invoke_async(self, prompt: str) -> AIMessage:
+        """
+        Invoke the model, hedging the call if enabled.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            AIMessage: The model response.
+        """
+        messages = self._get_messages(prompt)
+
+        if self.hedger is None:
+            return await self.client.ainvoke(messages)
+
+        return await self.hedger(
+            lambda: self.client.ainvoke(messages),
+            lambda: self.hedge_client.ainvoke(messages),
+        )
+
+    async def stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Send a prompt to the Azure OpenAI API and yield the response tokens as they arrive.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Yields:
+            str: The next piece of the response content.
+        """
+        content = await self._get_cached_async(prompt)
+        if content is not None:
+            yield content
+            return
+
+        chunks = []
+        with self.guard(measure_latency=False):
+            try:
+                async for chunk in self.client.astream(self._get_messages(prompt)):
+                    if chunk.content:
+                        chunks.append(chunk.content)
+                        yield chunk.content
+            except Exception as e:
+                error_message = f"LLM response generation failed: {e}"
+                logger.error(error_message)
+                raise AzureOpenAIClientError(error_message)
+
+        await self._set_cached_async(prompt, "".join(chunks).strip())
+
+    async def batch_async(self, prompts: List[str]) -> List[str | AzureOpenAIClientError]:
+        """
+        Send several prompts to the Azure OpenAI API using the client's batch support.
+
+        Args:
+            prompts (List[str]): The user's prompt messages.
+
+        Returns:
+            List[str | AzureOpenAIClientError]: The response content of each prompt, or
+                the error raised for it, in the same order as the input.
+        """
+        results: List[str | AzureOpenAIClientError | None] = [
+            await self._get_cached_async(prompt) for prompt in prompts
         ]
+        missing = [i for i, result in enumerate(results) if result is None]
 
-        try:
-            response: AIMessage = self.client.invoke(messages)
+        responses: List[AIMessage | Exception] = []
+        if missing:
+            try:
+                with self.guard():
+                    responses = await self.client.abatch(
+                        [self._get_messages(prompts[i]) for i in missing],
+                        config={"max_concurrency": api_settings.azure_openai.max_concurrency},
+                        return_exceptions=True,
+                    )
+                    # A batch that failed throughout counts as a failed call
+                    if all(isinstance(response, Exception) for response in responses):
+                        raise responses[0]
+            except Exception as e:
+                # An open circuit or a failed batch fails each prompt, not the request
+                responses = responses or [e for _ in missing]
+
+        for i, response in zip(missing, responses):
+            if isinstance(response, Exception):
+                error_message = f"LLM response generation failed: {response}"
+                logger.error(error_message)
+                results[i] = AzureOpenAIClientError(error_message)
+            else:
+                results[i] = response.content.strip()
+                await self._set_cached_async(prompts[i], results[i])
+
+        return results
+
+    def ping(self, timeout: float) -> None:
+        """
+        Check that the Azure OpenAI endpoint is reachable and accepts the API key.
 
-            return response.content.strip()
+        Args:
+            timeout (float): Seconds to wait for the service.
+        """
+        try:
+            self.client.root_client.models.list(timeout=timeout)
         except Exception as e:
-            error_message = f"LLM response generation failed: {e}"
+            error_message = f"Azure OpenAI health check failed: {e}"
             logger.error(error_message)
             raise AzureOpenAIClientError(error_message)
 
-    def _get_openai_client(self, settings: AzureOpenAI) -> AzureChatOpenAI:
+    def _get_messages(self, prompt: str) -> List:
+        """
+        Build the message list sent to the model.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            List: The system prompt followed by the user's prompt.
+        """
+        return [
+            SystemMessage(content=api_settings.azure_openai.system_prompt),
+            HumanMessage(content=prompt),
+        ]
+
+    def _get_cached(self, prompt: str) -> Optional[str]:
+        """
+        Get the cached response to a prompt.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            Optional[str]: The cached response, or None if not cached or caching is disabled.
+        """
+        if self.cache is None:
+            return None
+
+        return self.cache.get(self._get_cache_key(prompt))
+
+    def _set_cached(self, prompt: str, content: str) -> None:
+        """
+        Cache the response to a prompt, if caching is enabled.
+
+        Args:
+            prompt (str): The user's prompt message.
+            content (str): The response content.
+        """
+        if self.cache is not None:
+            self.cache.set(self._get_cache_key(prompt), content)
+
+    async def _get_cached_async(self, prompt: str) -> Optional[str]:
+        """
+        Get the cached response to a prompt without blocking the event loop.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            Optional[str]: The cached response, or None if not cached or caching is disabled.
+        """
+        if self.cache is None:
+            return None
+
+        return await self.cache.get_async(self._get_cache_key(prompt))
+
+    async def _set_cached_async(self, prompt: str, content: str) -> None:
+        """
+        Cache the response to a prompt without blocking the event loop, if enabled.
+
+        Args:
+            prompt (str): The user's prompt message.
+            content (str): The response content.
+        """
+        if self.cache is not None:
+            await self.cache.set_async(self._get_cache_key(prompt), content)
+
+    def _get_cache_key(self, prompt: str) -> str:
+        """
+        Hash every input that shapes the response.
+
+        The prompt is rendered from the prompt template, the sentiment and the feedback
+        text, so editing prompts.yaml or the system prompt yields new keys and the old
+        entries are simply never read again.
+
+        Args:
+            prompt (str): The user's prompt message.
+
+        Returns:
+            str: The cache key.
+        """
+        settings = api_settings.azure_openai
+        inputs = [
+            settings.deployment,
+            settings.temperature,
+            settings.max_tokens,
+            settings.system_prompt,
+            prompt,
+        ]
+        return hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()
+
+    def _get_cache(self, settings: AzureOpenAI) -> Optional[ResponseCache]:
+        """
+        Get the LLM response cache.
+
+        Args:
+            settings (AzureOpenAI): The settings object containing API configuration details.
+
+        Returns:
+            Optional[ResponseCache]: The cache, or None if caching is disabled.
+        """
+        if not settings.cache_enabled:
+            return None
+
+        return ResponseCache(
+            max_entries=settings.cache_max_entries,
+            ttl=settings.cache_ttl,
+            path=settings.cache_path,
+        )
+
+    def _get_guard(self, settings: Resilience) -> DependencyGuard:
+        """
+        Create the circuit breaker and concurrency limit around the API calls.
+
+        Args:
+            settings (Resilience): Resilience settings.
+
+        Returns:
+            DependencyGuard: The dependency guard.
+        """
+        return DependencyGuard(
+            name="Azure OpenAI",
+            breaker=CircuitBreaker(
+                failure_threshold=settings.failure_threshold,
+                reset_timeout=settings.reset_timeout,
+            ),
+            limiter=(
+                AdaptiveLimiter(
+                    initial_limit=settings.initial_limit,
+                    min_limit=settings.min_limit,
+                    max_limit=settings.max_limit,
+                    latency_target=settings.latency_target,
+                )
+                if settings.load_shedding
+                else None
+            ),
+            enabled=settings.enabled,
+        )
+
+    def _get_hedger(self, settings: AzureOpenAI) -> Optional[Hedger[AIMessage]]:
+        """
+        Get the hedger for slow calls.
+
+        Args:
+            settings (AzureOpenAI): The settings object containing API configuration details.
+
+        Returns:
+            Optional[Hedger[AIMessage]]: The hedger, or None if hedging is disabled.
+        """
+        if not settings.hedge_enabled:
+            return None
+
+        return Hedger(
+            percentile=settings.hedge_percentile,
+            max_rate=settings.hedge_max_rate,
+            initial_delay=settings.hedge_initial_delay,
+        )
+
+    def _get_hedge_client(self, settings: AzureOpenAI) -> AzureChatOpenAI:
+        """
+        Get the client used for hedge calls.
+
+        Args:
+            settings (AzureOpenAI): The settings object containing API configuration details.
+
+        Returns:
+            AzureChatOpenAI: A client on the secondary deployment if set, otherwise
+                the primary client.
+        """
+        if not settings.hedge_deployment:
+            return self.client
+
+        return self._get_openai_client(settings, deployment=settings.hedge_deployment)
+
+    def _get_openai_client(
+        self, settings: AzureOpenAI, deployment: Optional[str] = None
+    ) -> AzureChatOpenAI:
         """
         Instantiate and return an AzureChatOpenAI client using the provided settings.
 
         Args:
             settings (AzureOpenAI): The settings object containing API configuration details.
+            deployment (Optional[str]): Deployment overriding the configured one.
 
         Returns:
             AzureChatOpenAI: An instantiated AzureChatOpenAI client.
         """
         return AzureChatOpenAI(
             api_key=settings.api_key,
-            azure_deployment=settings.deployment,
+            azure_deployment=deployment or settings.deployment,
             model=settings.model,
             api_version=settings.api_version,
             azure_endpoint=settings.endpoint,
@@ -1,76 +1,799 @@
-import os
+import json
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid_extensions import uuid7str
 
 from azure.cognitiveservices.speech import (
+    Connection,
     SpeechSynthesizer,
     SpeechConfig,
     SpeechSynthesisOutputFormat,
-    AudioConfig,
     SpeechSynthesisResult,
+    SpeechSynthesisEventArgs,
     ResultReason,
 )
+from azure.cognitiveservices.speech.audio import (
+    AudioOutputConfig,
+    PushAudioOutputStream,
+    PushAudioOutputStreamCallback,
+)
 
 from src import api_settings
 from src.settings.azure_ai_services import AzureAIServices
+from src.clients.audio_formats import AUDIO_FORMATS, AudioFormat
 from src.clients.client_errors import AzureSpeechSynthesisClientError
+from src.clients.speech_synthesizer_pool import SpeechSynthesizerPool
+from src.settings.resilience import Resilience
+from src.storage import AudioStore, audio_store
+from src.utils import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DependencyGuard,
+    TTLCache,
+)
 
 logger = logging.getLogger(__name__)
 
+PENDING_AUDIO_MAX_ENTRIES = 10000
+PENDING_AUDIO_TTL = 600
+
+
+class _QueueWriter(PushAudioOutputStreamCallback):
+    """
+    Push stream callback handing the synthesized chunks over to an asyncio queue.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__()
+        self.loop = loop
+        self.queue = queue
+
+    def write(self, audio_buffer: memoryview) -> int:
+        chunk = audio_buffer.tobytes()
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, chunk)
+        return len(chunk)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedStream:
+    """
+    Chunks of one deferred synthesis, replayed to every concurrent reader.
+
+    Attributes:
+        chunks (List[bytes]): The audio synthesized so far.
+        done (bool): Whether the synthesis ended.
+        error (Optional[Exception]): The error that ended it, if any.
+        task (Optional[asyncio.Task]): The synthesis feeding the chunks.
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.done = False
+        self.error: Optional[Exception] = None
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def append(self, chunk: bytes) -> None:
+        """Add a chunk and wake up the readers."""
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        """End the stream, with an error if it failed, and wake up the readers."""
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def read(self) -> AsyncIterator[bytes]:
+        """
+        Yield every chunk, from the first one, as they are synthesized.
+
+        Raises:
+            Exception: The error that ended the synthesis, if any.
+        """
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+
+            if self.done:
+                break
+
+            await self._changed.wait()
+
+        if self.error is not None:
+            raise self.error
+
+    def _notify(self) -> None:
+        """Wake up the readers waiting for a change."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
 
 class AzureSpeechSynthesisClient:
     """
     Azure Speech Synthesis client.
 
     Attributes:
-        client: TextAnalyticsClient: Azure Text Analytics client
+        config (SpeechConfig): Azure AI Speech Config of the default audio profile
+        configs (Dict[str, SpeechConfig]): Azure AI Speech Config of each audio profile
+        voice (str): The neural voice used for every synthesis
+        audio_format (str): The default audio profile
+        output_format (SpeechSynthesisOutputFormat): The default synthesized audio format
+        voices (Dict[str, str]): Voice style for each sentiment
+        pending (TTLCache): Text, sentiment and audio profile of deferred syntheses, by file name
+        pool (Optional[SpeechSynthesizerPool]): Reused synthesizers of the default audio
+            profile, if pooling is enabled
+        guard (DependencyGuard): Circuit breaker and concurrency limit around the syntheses
+        store (AudioStore): Where the synthesized audio is saved
     """
 
-    def __init__(self):
-        self.config = self._get_speech_config(api_settings.azure_ai_services)
+    def __init__(self, store: Optional[AudioStore] = None):
+        self.voice = "en-US-AriaNeural"
+        self.audio_format = api_settings.azure_ai_services.audio_format
+        self.output_format = AUDIO_FORMATS[self.audio_format].output_format
+        self.configs = {
+            name: self._get_speech_config(
+                api_settings.azure_ai_services, audio_format.output_format
+            )
+            for name, audio_format in AUDIO_FORMATS.items()
+        }
+        self.config = self.configs[self.audio_format]
         self.voices = {
             "POSITIVE": "excited",
             "NEUTRAL": "default",
             "NEGATIVE": "empathetic"
         }
+        self.pending = TTLCache(
+            max_entries=PENDING_AUDIO_MAX_ENTRIES, ttl=PENDING_AUDIO_TTL
+        )
+        self.pool = self._get_pool(api_settings.azure_ai_services)
+        self.guard = self._get_guard(api_settings.resilience)
+        self.store = store or audio_store
+        self._in_flight: Dict[str, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._streams: Dict[str, _SharedStream] = {}
 
-    def __call__(self, text: str, sentiment: str = "NEUTRAL") -> str:
-        audio_path = api_settings.azure_ai_services.audio_path
+    def __call__(
+        self, text: str, sentiment: str = "NEUTRAL", audio_format: Optional[str] = None
+    ) -> str:
+        audio_format = audio_format or self.audio_format
 
-        os.makedirs(audio_path, exist_ok=True)
+        if api_settings.azure_ai_services.audio_streaming:
+            return self._defer_synthesis(text, sentiment, audio_format)
 
-        filename = f"{uuid7str()}.mp3"
-        file_path = os.path.join(audio_path, filename)
+        style = self._get_style(sentiment)
 
-        synthesizer = SpeechSynthesizer(
-            speech_config=self.config, audio_config=AudioConfig(filename=file_path)
-        )
+        if not api_settings.azure_ai_services.audio_content_addressed:
+            filename = self._get_unique_filename(audio_format)
+            self._save_audio(filename, self._synthesize(text, style, audio_format))
+            return filename
 
-        ssml = self._generate_ssml(
-            text,
-            self.voices.get(sentiment.upper(), self.voices["NEUTRAL"])
-        )
+        filename = self._get_content_filename(text, style, audio_format)
+        flight, owner = self._join_flight(filename)
+        if not owner:
+            return flight.result()
+
+        try:
+            if not self.store.exists(filename):
+                self._save_audio(filename, self._synthesize(text, style, audio_format))
+            if not flight.done():
+                flight.set_result(filename)
+        except Exception as e:
+            if not flight.done():
+                flight.set_exception(e)
+            raise
+        finally:
+            self._leave_flight(filename, flight)
+
+        return filename
+
+    async def call_async(
+        self, text: str, sentiment: str = "NEUTRAL", audio_format: Optional[str] = None
+    ) -> str:
+        """
+        Synthesize the text without blocking the event loop.
+
+        Args:
+            text (str): The text to synthesize.
+            sentiment (str): The sentiment used to pick the voice style.
+            audio_format (Optional[str]): The audio profile, the default one if None.
+
+        Returns:
+            str: The synthesized audio file name.
+        """
+        audio_format = audio_format or self.audio_format
+
+        if api_settings.azure_ai_services.audio_streaming:
+            return await asyncio.to_thread(
+                self._defer_synthesis, text, sentiment, audio_format
+            )
+
+        style = self._get_style(sentiment)
+
+        if not api_settings.azure_ai_services.audio_content_addressed:
+            filename = self._get_unique_filename(audio_format)
+            await self._save_audio_async(
+                filename, await self._synthesize_async(text, style, audio_format)
+            )
+            return filename
+
+        filename = self._get_content_filename(text, style, audio_format)
+        flight, owner = self._join_flight(filename)
+        if not owner:
+            # Shielded so a cancelled waiter does not cancel the shared flight
+            return await asyncio.shield(asyncio.wrap_future(flight))
+
+        try:
+            if not await asyncio.to_thread(self.store.exists, filename):
+                await self._save_audio_async(
+                    filename, await self._synthesize_async(text, style, audio_format)
+                )
+            if not flight.done():
+                flight.set_result(filename)
+        except Exception as e:
+            if not flight.done():
+                flight.set_exception(e)
+            raise
+        finally:
+            self._leave_flight(filename, flight)
+
+        return filename
+
+    async def stream_async(
+        self, text: str, sentiment: str = "NEUTRAL", audio_format: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize the text into a push audio stream, yielding the audio as it is produced.
+
+        Args:
+            text (str): The text to synthesize.
+            sentiment (str): The sentiment used to pick the voice style.
+            audio_format (Optional[str]): The audio profile, the default one if None.
+
+        Yields:
+            bytes: The next chunk of synthesized audio.
+        """
+        with self.guard(measure_latency=False):
+            loop = asyncio.get_running_loop()
+            chunks: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+
+            synthesizer = await asyncio.to_thread(
+                self._create_synthesizer,
+                audio_format,
+                AudioOutputConfig(stream=PushAudioOutputStream(_QueueWriter(loop, chunks))),
+            )
+            ssml = self._generate_ssml(text, self._get_style(sentiment))
+
+            synthesis = asyncio.ensure_future(self._speak_ssml_async(synthesizer, ssml))
+            synthesis.add_done_callback(lambda _: chunks.put_nowait(None))
+
+            try:
+                while (chunk := await chunks.get()) is not None:
+                    yield chunk
+
+                try:
+                    result: SpeechSynthesisResult = synthesis.result()
+                except Exception as e:
+                    error = f"Speech synthesis failed: {e}"
+                    logger.error(error)
+                    raise AzureSpeechSynthesisClientError(error)
+
+                self._check_result(result)
+            finally:
+                synthesis.cancel()
+
+    def open_stream(self, filename: str) -> Optional[AsyncIterator[bytes]]:
+        """
+        Start streaming a deferred synthesis.
+
+        Concurrent downloads share the synthesis in progress. It stays pending until
+        its audio is saved, so a later download streams it again instead of failing.
+        Pending syntheses are only known to this process, for PENDING_AUDIO_TTL seconds.
+
+        Args:
+            filename (str): The audio file name returned when the synthesis was deferred.
+
+        Returns:
+            Optional[AsyncIterator[bytes]]: The audio chunks, or None if no synthesis
+                is pending for this file name.
+        """
+        pending = self.pending.get(filename)
+        if pending is None:
+            return None
+
+        text, sentiment, audio_format = pending
+        return self._stream_pending(filename, text, sentiment, audio_format)
+
+    async def read_async(self, filename: str) -> bytes:
+        """
+        Read a synthesized audio file, finishing its synthesis first if deferred.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            bytes: The audio.
+
+        Raises:
+            AzureSpeechSynthesisClientError: If the file is neither stored nor pending.
+        """
+        audio = await asyncio.to_thread(self.store.get, filename)
+        if audio is not None:
+            return audio
+
+        stream = self.open_stream(filename)
+        if stream is None:
+            raise AzureSpeechSynthesisClientError(f"Audio file not found: {filename}")
+
+        return b"".join([chunk async for chunk in stream])
+
+    def ping(self, timeout: float) -> None:
+        """
+        Check that a connection to the Speech service can be opened.
+
+        Args:
+            timeout (float): Seconds to wait for the connection.
+        """
+        connected = threading.Event()
+        connection = Connection.from_speech_synthesizer(self._create_synthesizer())
+        connection.connected.connect(lambda _: connected.set())
 
         try:
-            result: SpeechSynthesisResult = synthesizer.speak_ssml(ssml)
+            connection.open(True)
+            if not connected.wait(timeout):
+                raise TimeoutError(f"no connection after {timeout} s")
         except Exception as e:
-            error = f"Speech synthesis failed: {e}"
+            error = f"Speech health check failed: {e}"
             logger.error(error)
             raise AzureSpeechSynthesisClientError(error)
+        finally:
+            connection.close()
+
+    async def _stream_pending(
+        self, filename: str, text: str, sentiment: str, audio_format: str
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a deferred synthesis, joining the one in progress for the file if any.
+
+        Concurrent downloads of a file, such as the range requests of an audio
+        player, share a single synthesis. It runs to completion, saving the audio if
+        enabled, even if its readers disconnect.
+
+        Args:
+            filename (str): The audio file name.
+            text (str): The text to synthesize.
+            sentiment (str): The sentiment used to pick the voice style.
+            audio_format (str): The audio profile.
+
+        Yields:
+            bytes: The next chunk of synthesized audio.
+        """
+        stream = self._streams.get(filename)
+        if stream is None:
+            stream = self._streams[filename] = _SharedStream()
+            stream.task = asyncio.ensure_future(
+                self._synthesize_pending(stream, filename, text, sentiment, audio_format)
+            )
+
+        async for chunk in stream.read():
+            yield chunk
+
+    async def _synthesize_pending(
+        self,
+        stream: _SharedStream,
+        filename: str,
+        text: str,
+        sentiment: str,
+        audio_format: str,
+    ) -> None:
+        """
+        Synthesize a deferred file into its shared stream, saving the audio once
+        complete if enabled. The synthesis stays pending until its audio is saved.
+
+        Args:
+            stream (_SharedStream): The stream read by the downloads.
+            filename (str): The audio file name.
+            text (str): The text to synthesize.
+            sentiment (str): The sentiment used to pick the voice style.
+            audio_format (str): The audio profile.
+        """
+        error = None
+        try:
+            async for chunk in self.stream_async(text, sentiment, audio_format):
+                stream.append(chunk)
+
+            if api_settings.azure_ai_services.audio_stream_save:
+                await self._save_audio_async(filename, b"".join(stream.chunks))
+        except Exception as e:
+            error = e
+        except BaseException:
+            error = AzureSpeechSynthesisClientError(f"Audio synthesis interrupted: {filename}")
+            raise
+        finally:
+            if self._streams.get(filename) is stream:
+                del self._streams[filename]
+            stream.close(error)
+
+    def _defer_synthesis(self, text: str, sentiment: str, audio_format: str) -> str:
+        """
+        Reserve the audio file name and leave the synthesis to the download.
+
+        Args:
+            text (str): The text to synthesize.
+            sentiment (str): The sentiment used to pick the voice style.
+            audio_format (str): The audio profile.
+
+        Returns:
+            str: The audio file name.
+        """
+        if api_settings.azure_ai_services.audio_content_addressed:
+            filename = self._get_content_filename(
+                text, self._get_style(sentiment), audio_format
+            )
+        else:
+            filename = self._get_unique_filename(audio_format)
+
+        if not self.store.exists(filename):
+            self.pending.set(filename, (text, sentiment, audio_format))
+
+        return filename
+
+    def _synthesize(self, text: str, style: str, audio_format: str) -> bytes:
+        """
+        Synthesize the text and return the audio.
+
+        Args:
+            text (str): The text to synthesize.
+            style (str): The voice style to apply.
+            audio_format (str): The audio profile.
+
+        Returns:
+            bytes: The synthesized audio.
+        """
+        ssml = self._generate_ssml(text, style)
+        with self.guard():
+            synthesizer = self._acquire_synthesizer(audio_format)
+
+            # Released in finally so a cancellation does not leak the pool slot
+            healthy = False
+            try:
+                result: SpeechSynthesisResult = synthesizer.speak_ssml(ssml)
+                healthy = result.reason == ResultReason.SynthesizingAudioCompleted
+            except Exception as e:
+                error = f"Speech synthesis failed: {e}"
+                logger.error(error)
+                raise AzureSpeechSynthesisClientError(error)
+            finally:
+                self._release_synthesizer(synthesizer, audio_format, healthy=healthy)
+
+            self._check_result(result)
+
+        return result.audio_data
+
+    async def _synthesize_async(self, text: str, style: str, audio_format: str) -> bytes:
+        """
+        Synthesize the text without blocking the event loop and return the audio.
 
+        Args:
+            text (str): The text to synthesize.
+            style (str): The voice style to apply.
+            audio_format (str): The audio profile.
+
+        Returns:
+            bytes: The synthesized audio.
+        """
+        ssml = self._generate_ssml(text, style)
+        with self.guard():
+            synthesizer = await self._acquire_synthesizer_async(audio_format)
+
+            # Released in finally so a cancellation does not leak the pool slot
+            healthy = False
+            try:
+                result: SpeechSynthesisResult = await self._speak_ssml_async(
+                    synthesizer, ssml
+                )
+                healthy = result.reason == ResultReason.SynthesizingAudioCompleted
+            except Exception as e:
+                error = f"Speech synthesis failed: {e}"
+                logger.error(error)
+                raise AzureSpeechSynthesisClientError(error)
+            finally:
+                self._release_synthesizer(synthesizer, audio_format, healthy=healthy)
+
+            self._check_result(result)
+
+        return result.audio_data
+
+    def _acquire_synthesizer(self, audio_format: str) -> SpeechSynthesizer:
+        """
+        Take a pooled synthesizer, or build one returning the audio in memory.
+
+        Args:
+            audio_format (str): The audio profile; only the default one is pooled.
+
+        Returns:
+            SpeechSynthesizer: The synthesizer.
+        """
+        if not self._is_pooled(audio_format):
+            return self._create_synthesizer(audio_format)
+
+        return self.pool.acquire()
+
+    async def _acquire_synthesizer_async(self, audio_format: str) -> SpeechSynthesizer:
+        """
+        Take a pooled synthesizer without blocking the event loop, or build one.
+
+        Args:
+            audio_format (str): The audio profile; only the default one is pooled.
+
+        Returns:
+            SpeechSynthesizer: The synthesizer.
+        """
+        if not self._is_pooled(audio_format):
+            return await asyncio.to_thread(self._create_synthesizer, audio_format)
+
+        return await self.pool.acquire_async()
+
+    def _release_synthesizer(
+        self, synthesizer: SpeechSynthesizer, audio_format: str, healthy: bool
+    ) -> None:
+        """
+        Return a pooled synthesizer, recycling it if its synthesis failed.
+
+        Args:
+            synthesizer (SpeechSynthesizer): The synthesizer.
+            audio_format (str): The audio profile it was acquired for.
+            healthy (bool): Whether the synthesis succeeded.
+        """
+        if self._is_pooled(audio_format):
+            self.pool.release(synthesizer, healthy=healthy)
+
+    def _is_pooled(self, audio_format: str) -> bool:
+        """
+        Check whether syntheses in an audio profile use the synthesizer pool.
+
+        Args:
+            audio_format (str): The audio profile.
+
+        Returns:
+            bool: Whether pooling is enabled and the profile is the default one.
+        """
+        return self.pool is not None and audio_format == self.audio_format
+
+    def _create_synthesizer(
+        self,
+        audio_format: Optional[str] = None,
+        audio_config: Optional[AudioOutputConfig] = None,
+    ) -> SpeechSynthesizer:
+        """
+        Build a synthesizer, returning the audio in memory unless an output is given.
+
+        Args:
+            audio_format (Optional[str]): The audio profile, the default one if None.
+            audio_config (Optional[AudioOutputConfig]): Where to write the audio.
+
+        Returns:
+            SpeechSynthesizer: The synthesizer.
+        """
+        return SpeechSynthesizer(
+            speech_config=self.configs[audio_format or self.audio_format],
+            audio_config=audio_config,
+        )
+
+    async def _speak_ssml_async(
+        self, synthesizer: SpeechSynthesizer, ssml: str
+    ) -> SpeechSynthesisResult:
+        """
+        Bridge the SDK `speak_ssml_async` future into asyncio.
+
+        The SDK future only exposes a blocking `get()`, so completion is signalled
+        through the synthesizer events instead and `get()` is called once the
+        result is already available.
+
+        Args:
+            synthesizer (SpeechSynthesizer): The synthesizer to speak with.
+            ssml (str): The SSML to synthesize.
+
+        Returns:
+            SpeechSynthesisResult: The synthesis result.
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def on_done(_: SpeechSynthesisEventArgs):
+            loop.call_soon_threadsafe(
+                lambda: done.done() or done.set_result(None)
+            )
+
+        synthesizer.synthesis_completed.connect(on_done)
+        synthesizer.synthesis_canceled.connect(on_done)
+
+        try:
+            result_future = synthesizer.speak_ssml_async(ssml)
+            await done
+        finally:
+            synthesizer.synthesis_completed.disconnect_all()
+            synthesizer.synthesis_canceled.disconnect_all()
+
+        return result_future.get()
+
+    def _check_result(self, result: SpeechSynthesisResult) -> None:
+        """
+        Ensure the synthesis completed.
+
+        Args:
+            result (SpeechSynthesisResult): The synthesis result.
+        """
         if result.reason != ResultReason.SynthesizingAudioCompleted:
             error = "Speech synthesis failed"
             logger.error(error)
             raise AzureSpeechSynthesisClientError(error)
 
-        return filename
+    def _save_audio(self, filename: str, audio: bytes) -> None:
+        """
+        Save the synthesized audio to the audio store, ending any pending synthesis.
 
-    def _get_speech_config(self, settings: AzureAIServices) -> SpeechConfig:
+        Args:
+            filename (str): The audio file name.
+            audio (bytes): The synthesized audio.
+        """
+        self.store.put(filename, audio)
+        self.pending.pop(filename)
+
+    async def _save_audio_async(self, filename: str, audio: bytes) -> None:
+        """
+        Save the synthesized audio without blocking the event loop.
+
+        Args:
+            filename (str): The audio file name.
+            audio (bytes): The synthesized audio.
+        """
+        await asyncio.to_thread(self.store.put, filename, audio)
+        self.pending.pop(filename)
+
+    def _get_unique_filename(self, audio_format: str) -> str:
+        """
+        Name the audio after a new uuid7.
+
+        Args:
+            audio_format (str): The audio profile.
+
+        Returns:
+            str: The unique audio file name.
+        """
+        return f"{uuid7str()}.{AUDIO_FORMATS[audio_format].extension}"
+
+    def _get_content_filename(self, text: str, style: str, audio_format: str) -> str:
+        """
+        Name the audio after everything that determines its content.
+
+        Args:
+            text (str): The text to synthesize.
+            style (str): The voice style to apply.
+            audio_format (str): The audio profile.
+
+        Returns:
+            str: The content-addressed audio file name.
+        """
+        profile: AudioFormat = AUDIO_FORMATS[audio_format]
+        inputs = [text, style, self.voice, profile.output_format.name]
+        digest = hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()
+
+        return f"{digest}.{profile.extension}"
+
+    def _join_flight(self, filename: str) -> Tuple[Future, bool]:
+        """
+        Join the synthesis in progress for a file, or start one.
+
+        Args:
+            filename (str): The content-addressed audio file name.
+
+        Returns:
+            Tuple[Future, bool]: The future resolved with the file name, and whether
+                the caller owns the synthesis and must resolve it.
+        """
+        with self._in_flight_lock:
+            flight = self._in_flight.get(filename)
+            if flight is not None:
+                return flight, False
+
+            flight = self._in_flight[filename] = Future()
+            return flight, True
+
+    def _leave_flight(self, filename: str, flight: Future) -> None:
         """
-        Get the Azure Text Analytics client.
+        Forget a finished synthesis, failing it for the waiters if the owner was
+        interrupted (e.g. cancelled) before resolving it.
+
+        Args:
+            filename (str): The content-addressed audio file name.
+            flight (Future): The future of the synthesis.
+        """
+        with self._in_flight_lock:
+            self._in_flight.pop(filename, None)
+
+        if not flight.done():
+            flight.set_exception(
+                AzureSpeechSynthesisClientError(f"Audio synthesis interrupted: {filename}")
+            )
+
+    def _get_style(self, sentiment: str) -> str:
+        """
+        Get the voice style for a sentiment.
+
+        Args:
+            sentiment (str): The feedback sentiment.
+
+        Returns:
+            str: The voice style.
+        """
+        return self.voices.get(sentiment.upper(), self.voices["NEUTRAL"])
+
+    def _get_pool(
+        self, settings: AzureAIServices
+    ) -> Optional[SpeechSynthesizerPool]:
+        """
+        Create the synthesizer pool if pooling is enabled.
+
+        Args:
+            settings (AzureAIServices): Azure AI Services settings.
+
+        Returns:
+            Optional[SpeechSynthesizerPool]: The pool, or None if disabled.
+        """
+        if not settings.speech_pool_size:
+            return None
+
+        return SpeechSynthesizerPool(
+            factory=self._create_synthesizer, size=settings.speech_pool_size
+        )
+
+    def _get_guard(self, settings: Resilience) -> DependencyGuard:
+        """
+        Create the circuit breaker and concurrency limit around the syntheses.
+
+        Args:
+            settings (Resilience): Resilience settings.
+
+        Returns:
+            DependencyGuard: The dependency guard.
+        """
+        return DependencyGuard(
+            name="Azure Speech",
+            breaker=CircuitBreaker(
+                failure_threshold=settings.failure_threshold,
+                reset_timeout=settings.reset_timeout,
+            ),
+            limiter=(
+                AdaptiveLimiter(
+                    initial_limit=settings.initial_limit,
+                    min_limit=settings.min_limit,
+                    max_limit=settings.max_limit,
+                    latency_target=settings.latency_target,
+                )
+                if settings.load_shedding
+                else None
+            ),
+            enabled=settings.enabled,
+        )
+
+    def _get_speech_config(
+        self, settings: AzureAIServices, output_format: SpeechSynthesisOutputFormat
+    ) -> SpeechConfig:
+        """
+        Get the Azure AI Speech Config for an output format.
 
         Args:
             settings (AzureAIServices): Azure AI Services settings
+            output_format (SpeechSynthesisOutputFormat): The synthesized audio format
 
         Returns:
             SpeechConfig: Azure AI Speech Config
@@ -80,9 +803,7 @@ class AzureSpeechSynthesisClient:
             region=settings.region,
         )
 
-        speech_config.set_speech_synthesis_output_format(
-            SpeechSynthesisOutputFormat.Audio48Khz192KBitRateMonoMp3
-        )
+        speech_config.set_speech_synthesis_output_format(output_format)
 
         return speech_config
 
@@ -99,7 +820,7 @@ class AzureSpeechSynthesisClient:
         """
         ssml_template = f"""
         <speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xmlns:mstts='https://www.w3.org/2001/mstts' xml:lang='en-US'>
-            <voice name='en-US-AriaNeural'>
+            <voice name='{self.voice}'>
                 <mstts:express-as style='{style}'>
                     {text}
                 </mstts:express-as>
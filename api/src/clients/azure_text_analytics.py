@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 import logging
+import unicodedata
 
 from typing import List
 
@@ -7,14 +10,26 @@ from azure.ai.textanalytics import (
     AnalyzeSentimentResult,
     DocumentError
 )
+from azure.ai.textanalytics.aio import TextAnalyticsClient as AsyncTextAnalyticsClient
 from azure.core.credentials import AzureKeyCredential
 
 from src import api_settings
 from src.settings.azure_ai_services import AzureAIServices
 from src.clients.client_errors import AzureTextAnalyticsClientError
+from src.settings.resilience import Resilience
+from src.utils import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DependencyGuard,
+    DependencyUnavailableError,
+    MicroBatcher,
+    TTLCache,
+)
 
 logger = logging.getLogger(__name__)
 
+MAX_DOCUMENTS_PER_REQUEST = 10
+
 
 class AzureTextAnalyticsClient:
     """
@@ -22,10 +37,22 @@ class AzureTextAnalyticsClient:
 
     Attributes:
         client: TextAnalyticsClient: Azure Text Analytics client
+        async_client: AsyncTextAnalyticsClient: Azure Text Analytics asyncio client
+        batcher: MicroBatcher | None: Coalesces concurrent asyncio requests, if enabled
+        cache: TTLCache | None: Sentiment results by normalized text, if enabled
+        guard: DependencyGuard: Circuit breaker and concurrency limit around the API calls
+        probe: bool: Whether the health check sends a (billed) sentiment request
     """
 
     def __init__(self):
         self.client = self._get_text_analytics_client(api_settings.azure_ai_services)
+        self.async_client = self._get_async_text_analytics_client(
+            api_settings.azure_ai_services
+        )
+        self.batcher = self._get_batcher(api_settings.azure_ai_services)
+        self.cache = self._get_cache(api_settings.azure_ai_services)
+        self.guard = self._get_guard(api_settings.resilience)
+        self.probe = api_settings.health.text_analytics_probe
 
     def analyze_sentiment(self, text: str) -> str:
         """
@@ -37,28 +64,287 @@ class AzureTextAnalyticsClient:
         Returns:
             str: The sentiment of the text
         """
+        sentiment = self._get_cached(text)
+        if sentiment is not None:
+            return sentiment
+
+        with self.guard():
+            try:
+                response: List[AnalyzeSentimentResult | DocumentError] = (
+                    self.client.analyze_sentiment(documents=[text])
+                )
+            except Exception as e:
+                error = f"Text Analytics API error: {e}"
+                logger.error(error)
+                raise AzureTextAnalyticsClientError(error)
+
+        sentiment = self._get_sentiment(response[0])
+        self._set_cached(text, sentiment)
+
+        return sentiment
+
+    async def analyze_sentiment_async(self, text: str) -> str:
+        """
+        Analyze the sentiment of a given text without blocking the event loop.
+
+        Concurrent calls are coalesced into multi-document requests when
+        AZURE_AI_SERVICES_SENTIMENT_BATCH_WINDOW_MS is set.
+
+        Args:
+            text (str): The text to analyze
+
+        Returns:
+            str: The sentiment of the text
+        """
+        sentiment = self._get_cached(text)
+        if sentiment is not None:
+            return sentiment
+
+        if self.batcher is not None:
+            sentiment = await self.batcher.submit(text)
+        else:
+            with self.guard():
+                try:
+                    response: List[AnalyzeSentimentResult | DocumentError] = (
+                        await self.async_client.analyze_sentiment(documents=[text])
+                    )
+                except Exception as e:
+                    error = f"Text Analytics API error: {e}"
+                    logger.error(error)
+                    raise AzureTextAnalyticsClientError(error)
+
+            sentiment = self._get_sentiment(response[0])
+
+        self._set_cached(text, sentiment)
+
+        return sentiment
+
+    async def analyze_sentiment_batch_async(
+        self, texts: List[str]
+    ) -> List[str | AzureTextAnalyticsClientError | DependencyUnavailableError]:
+        """
+        Analyze the sentiment of several texts, sending them in service-sized groups.
+
+        Args:
+            texts (List[str]): The texts to analyze
+
+        Returns:
+            List[str | AzureTextAnalyticsClientError | DependencyUnavailableError]: The
+                sentiment of each text, or the error raised for it, in the same order as
+                the input
+        """
+        sentiments = [self._get_cached(text) for text in texts]
+        missing = [i for i, sentiment in enumerate(sentiments) if sentiment is None]
+
+        groups = [
+            [texts[i] for i in missing[j:j + MAX_DOCUMENTS_PER_REQUEST]]
+            for j in range(0, len(missing), MAX_DOCUMENTS_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(self._analyze_group_async(group) for group in groups)
+        )
+
+        for i, sentiment in zip(
+            missing, [sentiment for group in results for sentiment in group]
+        ):
+            sentiments[i] = sentiment
+            if not isinstance(sentiment, Exception):
+                self._set_cached(texts[i], sentiment)
+
+        return sentiments
+
+    def ping(self, timeout: float) -> None:
+        """
+        Check that the Text Analytics endpoint answers a one-document request.
+
+        Every request is billed, so unless probing is enabled no request is sent
+        and the dependency is reported unhealthy only while its circuit is open.
+
+        Args:
+            timeout (float): Seconds to wait for the service.
+        """
+        if not self.probe:
+            if self.guard.breaker.state == "open":
+                error = "Text Analytics health check failed: circuit is open"
+                logger.error(error)
+                raise AzureTextAnalyticsClientError(error)
+            return
+
         try:
-            response: List[AnalyzeSentimentResult | DocumentError] = (
-                self.client.analyze_sentiment(documents=[text])
+            response = self.client.analyze_sentiment(
+                documents=["ok"], connection_timeout=timeout, read_timeout=timeout
             )
         except Exception as e:
-            error = f"Text Analytics API error: {e}"
+            error = f"Text Analytics health check failed: {e}"
             logger.error(error)
             raise AzureTextAnalyticsClientError(error)
 
-        if isinstance(response[0], DocumentError):
+        self._get_sentiment(response[0])
+
+    async def _analyze_group_async(
+        self, texts: List[str]
+    ) -> List[str | AzureTextAnalyticsClientError | DependencyUnavailableError]:
+        """
+        Analyze a group of texts in a single Text Analytics call.
+
+        Args:
+            texts (List[str]): Up to MAX_DOCUMENTS_PER_REQUEST texts
+
+        Returns:
+            List[str | AzureTextAnalyticsClientError | DependencyUnavailableError]: The
+                sentiment or error of each text
+        """
+        try:
+            with self.guard():
+                response: List[AnalyzeSentimentResult | DocumentError] = (
+                    await self.async_client.analyze_sentiment(documents=texts)
+                )
+        except DependencyUnavailableError as e:
+            logger.error(str(e))
+            return [e for _ in texts]
+        except Exception as e:
+            error = f"Text Analytics API error: {e}"
+            logger.error(error)
+            return [AzureTextAnalyticsClientError(error) for _ in texts]
+
+        sentiments = []
+        for result in response:
+            try:
+                sentiments.append(self._get_sentiment(result))
+            except AzureTextAnalyticsClientError as e:
+                sentiments.append(e)
+
+        return sentiments
+
+    def _get_sentiment(self, result: AnalyzeSentimentResult | DocumentError) -> str:
+        """
+        Extract the sentiment label from a single document result.
+
+        Args:
+            result (AnalyzeSentimentResult | DocumentError): The document result
+
+        Returns:
+            str: Either "POSITIVE", "NEGATIVE" or "NEUTRAL"
+        """
+        if isinstance(result, DocumentError):
             error = "Text Analytics API error"
             logger.error(error)
             raise AzureTextAnalyticsClientError(error)
 
         try:
-            sentiment = response[0].sentiment.upper()
+            sentiment = result.sentiment.upper()
             return sentiment if sentiment in ("POSITIVE", "NEGATIVE") else "NEUTRAL"
         except Exception as e:
             error = f"Sentiment analysis failed: {e}"
             logger.error(error)
             raise AzureTextAnalyticsClientError(error)
 
+    def _get_cached(self, text: str) -> str | None:
+        """
+        Get the cached sentiment of a text.
+
+        Args:
+            text (str): The analyzed text
+
+        Returns:
+            str | None: The cached sentiment, or None if not cached or caching is disabled
+        """
+        if self.cache is None:
+            return None
+
+        return self.cache.get(self._get_cache_key(text))
+
+    def _set_cached(self, text: str, sentiment: str) -> None:
+        """
+        Cache the sentiment of a text, if caching is enabled.
+
+        Args:
+            text (str): The analyzed text
+            sentiment (str): Its sentiment
+        """
+        if self.cache is not None:
+            self.cache.set(self._get_cache_key(text), sentiment)
+
+    def _get_cache_key(self, text: str) -> str:
+        """
+        Hash the normalized text, so that copies differing only in Unicode form,
+        case or whitespace share an entry.
+
+        Args:
+            text (str): The analyzed text
+
+        Returns:
+            str: The cache key
+        """
+        normalized = " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _get_cache(self, settings: AzureAIServices) -> TTLCache | None:
+        """
+        Get the sentiment cache.
+
+        Args:
+            settings (AzureAIServices): Azure AI Services settings
+
+        Returns:
+            TTLCache | None: The cache, or None if caching is disabled
+        """
+        if not settings.sentiment_cache_enabled:
+            return None
+
+        return TTLCache(
+            max_entries=settings.sentiment_cache_max_entries,
+            ttl=settings.sentiment_cache_ttl,
+        )
+
+    def _get_batcher(self, settings: AzureAIServices) -> MicroBatcher | None:
+        """
+        Get the batcher coalescing concurrent single-document requests.
+
+        Args:
+            settings (AzureAIServices): Azure AI Services settings
+
+        Returns:
+            MicroBatcher | None: The batcher, or None if coalescing is disabled
+        """
+        if settings.sentiment_batch_window_ms <= 0:
+            return None
+
+        return MicroBatcher(
+            self._analyze_group_async,
+            window=settings.sentiment_batch_window_ms / 1000,
+            max_batch_size=MAX_DOCUMENTS_PER_REQUEST,
+        )
+
+    def _get_guard(self, settings: Resilience) -> DependencyGuard:
+        """
+        Get the circuit breaker and concurrency limit around the API calls.
+
+        Args:
+            settings (Resilience): Resilience settings
+
+        Returns:
+            DependencyGuard: The dependency guard
+        """
+        return DependencyGuard(
+            name="Azure Text Analytics",
+            breaker=CircuitBreaker(
+                failure_threshold=settings.failure_threshold,
+                reset_timeout=settings.reset_timeout,
+            ),
+            limiter=(
+                AdaptiveLimiter(
+                    initial_limit=settings.initial_limit,
+                    min_limit=settings.min_limit,
+                    max_limit=settings.max_limit,
+                    latency_target=settings.latency_target,
+                )
+                if settings.load_shedding
+                else None
+            ),
+            enabled=settings.enabled,
+        )
+
     def _get_text_analytics_client(
         self, settings: AzureAIServices
     ) -> TextAnalyticsClient:
@@ -75,5 +361,21 @@ class AzureTextAnalyticsClient:
             endpoint=settings.endpoint, credential=AzureKeyCredential(settings.api_key)
         )
 
+    def _get_async_text_analytics_client(
+        self, settings: AzureAIServices
+    ) -> AsyncTextAnalyticsClient:
+        """
+        Get the Azure Text Analytics asyncio client.
+
+        Args:
+            settings (AzureAIServices): Azure AI Services settings
+
+        Returns:
+            AsyncTextAnalyticsClient: Azure Text Analytics asyncio client
+        """
+        return AsyncTextAnalyticsClient(
+            endpoint=settings.endpoint, credential=AzureKeyCredential(settings.api_key)
+        )
+
 
 azure_text_analytics_client = AzureTextAnalyticsClient()
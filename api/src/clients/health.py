@@ -0,0 +1,15 @@
+from src import api_settings
+from src.clients.azure_openai import azure_openai_client
+from src.clients.azure_text_analytics import azure_text_analytics_client
+from src.clients.azure_speech_synthesis import azure_speech_synthesis_client
+from src.utils import HealthMonitor
+
+health_monitor = HealthMonitor(
+    probes={
+        "azure_open_ai_client": azure_openai_client.ping,
+        "azure_text_analytics_client": azure_text_analytics_client.ping,
+        "azure_speech_synthesis_client": azure_speech_synthesis_client.ping,
+    },
+    interval=api_settings.health.interval,
+    timeout=api_settings.health.timeout,
+)
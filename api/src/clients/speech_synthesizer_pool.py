@@ -0,0 +1,204 @@
+import queue
+import time
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from azure.cognitiveservices.speech import Connection, SpeechSynthesizer
+
+logger = logging.getLogger(__name__)
+
+ACQUIRE_POLL_INTERVAL = 0.1
+
+
+class SpeechSynthesizerPool:
+    """
+    Bounded pool of speech synthesizers that keep their service connection open.
+
+    Synthesizers are created lazily up to `size`, or all at once by `warm_up`, and
+    their connection is pre-opened with the SDK `Connection` API so a synthesis
+    does not pay for the websocket setup. A synthesizer released after an error is
+    closed, and a fresh one takes its place on the next acquisition.
+
+    Voice and style are part of the SSML, so a single pool serves every request.
+
+    Attributes:
+        size (int): Maximum number of synthesizers.
+        acquisitions (int): Number of synthesizers handed out.
+        recycled (int): Number of synthesizers discarded after an error.
+    """
+
+    def __init__(self, factory: Callable[[], SpeechSynthesizer], size: int):
+        """
+        Initialize the pool.
+
+        Args:
+            factory (Callable[[], SpeechSynthesizer]): Creates a new synthesizer.
+            size (int): Maximum number of synthesizers.
+        """
+        self.factory = factory
+        self.size = size
+        self.acquisitions = 0
+        self.recycled = 0
+        self._idle: queue.LifoQueue[SpeechSynthesizer] = queue.LifoQueue()
+        self._created = 0
+        self._in_use = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._busy_total = 0.0
+        self._busy_since: Dict[int, float] = {}
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Create every synthesizer up front and open their connections."""
+        try:
+            while (synthesizer := self._create_if_room()) is not None:
+                self._idle.put(synthesizer)
+        except Exception as e:
+            logger.error(f"Speech synthesizer warm-up failed: {e}")
+
+    def acquire(self, block: bool = True) -> Optional[SpeechSynthesizer]:
+        """
+        Take a synthesizer, creating one if the pool is not full.
+
+        Args:
+            block (bool): Wait for a synthesizer to be released if none is available.
+
+        Returns:
+            Optional[SpeechSynthesizer]: The synthesizer, or None if not blocking and
+                none is available.
+        """
+        start = time.monotonic()
+
+        try:
+            synthesizer = self._idle.get_nowait()
+        except queue.Empty:
+            synthesizer = self._create_if_room()
+
+        if synthesizer is None and not block:
+            return None
+
+        while synthesizer is None:
+            try:
+                synthesizer = self._idle.get(timeout=ACQUIRE_POLL_INTERVAL)
+            except queue.Empty:
+                synthesizer = self._create_if_room()
+
+        self._lease(synthesizer, time.monotonic() - start)
+
+        return synthesizer
+
+    async def acquire_async(self) -> SpeechSynthesizer:
+        """
+        Take a synthesizer without blocking the event loop.
+
+        An idle synthesizer is taken right away; creating one, which opens its
+        connection, or waiting for one runs in a worker thread.
+
+        Returns:
+            SpeechSynthesizer: The synthesizer.
+        """
+        try:
+            synthesizer = self._idle.get_nowait()
+        except queue.Empty:
+            synthesizer = None
+
+        if synthesizer is not None:
+            self._lease(synthesizer, 0.0)
+            return synthesizer
+
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self.acquire))
+        try:
+            return await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(
+                lambda done: done.cancelled()
+                or done.exception() is not None
+                or self.release(done.result())
+            )
+            raise
+
+    def release(self, synthesizer: SpeechSynthesizer, healthy: bool = True) -> None:
+        """
+        Return a synthesizer to the pool, discarding it if it failed.
+
+        Args:
+            synthesizer (SpeechSynthesizer): The synthesizer to return.
+            healthy (bool): Whether its last synthesis succeeded.
+        """
+        with self._lock:
+            self._in_use -= 1
+            self._busy_total += time.monotonic() - self._busy_since.pop(
+                id(synthesizer), time.monotonic()
+            )
+            if not healthy:
+                self._created -= 1
+                self.recycled += 1
+
+        if healthy:
+            self._idle.put(synthesizer)
+            return
+
+        try:
+            Connection.from_speech_synthesizer(synthesizer).close()
+        except Exception as e:
+            logger.error(f"Speech synthesizer close failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the pool metrics.
+
+        Returns:
+            Dict[str, Any]: Size and usage counters, average and maximum wait for a
+                synthesizer in seconds, and utilization as the busy fraction of the
+                pool capacity since it was created.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            busy = self._busy_total + sum(
+                time.monotonic() - since for since in self._busy_since.values()
+            )
+
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "acquisitions": self.acquisitions,
+                "recycled": self.recycled,
+                "wait_avg": self._wait_total / self.acquisitions if self.acquisitions else 0.0,
+                "wait_max": self._wait_max,
+                "utilization": busy / (self.size * elapsed) if elapsed else 0.0,
+            }
+
+    def _create_if_room(self) -> Optional[SpeechSynthesizer]:
+        """Create a synthesizer if the pool is not full."""
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+
+        try:
+            return self._create()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _create(self) -> SpeechSynthesizer:
+        """Create a synthesizer and pre-open its connection."""
+        synthesizer = self.factory()
+        Connection.from_speech_synthesizer(synthesizer).open(True)
+
+        return synthesizer
+
+    def _lease(self, synthesizer: SpeechSynthesizer, wait: float) -> None:
+        """Record a synthesizer being handed out."""
+        with self._lock:
+            self.acquisitions += 1
+            self._in_use += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._busy_since[id(synthesizer)] = time.monotonic()
@@ -1,32 +1,159 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
 import os
+import time
+import asyncio
+from typing import BinaryIO, Iterator, Optional
 
-from src import api_settings
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+
+from src.clients import azure_speech_synthesis_client
+from src.clients.audio_formats import MEDIA_TYPES
+from src.storage import audio_links, audio_store
+from src.utils import RangeNotSatisfiableError, etag_matches, parse_byte_range
 
 router = APIRouter(prefix="/audio", tags=["audio"])
 
+# Audio file names are unique and their content never changes
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Signed links must not outlive their expiry in shared caches
+SIGNED_CACHE_CONTROL = "private, max-age={max_age}"
+
+CHUNK_SIZE = 64 * 1024
+
 
 @router.get(
     "/{filename}",
     summary="Download feedback audio file",
-    description="Downloads the specified feedback MP3 file.",
-    response_description="The requested audio file.",
+    description=(
+        "Downloads the specified feedback MP3, Ogg or WAV file from the audio store. "
+        "Stored files are immutable: they carry a strong ETag, answer `If-None-Match` "
+        "with 304 and support single byte ranges. Deferred syntheses are streamed whole "
+        "while the audio is being synthesized, range requests included, concurrent "
+        "downloads sharing one synthesis. When audio links are signed, only the "
+        "`audio_url` links returned with the feedback response are served, until they "
+        "expire."
+    ),
+    response_description="The requested audio file, or the requested part of it.",
+    responses={403: {"description": "The audio link is unsigned, invalid or expired."}},
 )
-async def download_audio(filename: str):
-    if not filename.endswith(".mp3"):
+async def download_audio(
+    filename: str,
+    request: Request,
+    expires: Optional[int] = Query(None, description="Signed link expiry, as a Unix timestamp."),
+    signature: Optional[str] = Query(None, description="Signed link signature."),
+):
+    stem, _, extension = filename.rpartition(".")
+    media_type = MEDIA_TYPES.get(extension)
+
+    if not stem or media_type is None:
         raise HTTPException(status_code=400, detail="Invalid filename")
 
-    path = os.path.join(api_settings.azure_ai_services.audio_path, filename)
+    if not audio_links.verify(filename, expires, signature):
+        raise HTTPException(status_code=403, detail="Invalid or expired audio link")
+
+    etag = f'"{stem}"'
+    cache_headers = {"ETag": etag, "Cache-Control": _get_cache_control(expires)}
 
-    if not os.path.isfile(path):
-        raise HTTPException(status_code=404, detail="File not found")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
 
     try:
-        return FileResponse(
-            path=path,
-            media_type="audio/mpeg",
-            filename=filename,
-        )
+        audio_file = await asyncio.to_thread(audio_store.open_file, filename)
+        audio = None
+        if audio_file is None:
+            audio = await asyncio.to_thread(audio_store.get, filename)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error serving file: {str(e)}")
+
+    if audio_file is None and audio is None:
+        stream = azure_speech_synthesis_client.open_stream(filename)
+
+        if stream is None:
+            raise HTTPException(status_code=404, detail="File not found")
+
+        return StreamingResponse(stream, media_type=media_type, headers=headers)
+
+    headers.update(cache_headers)
+    headers["Accept-Ranges"] = "bytes"
+
+    size = os.fstat(audio_file.fileno()).st_size if audio_file else len(audio)
+    start, end = 0, size - 1
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except RangeNotSatisfiableError:
+            if audio_file:
+                audio_file.close()
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    status_code = 206 if "Content-Range" in headers else 200
+
+    if audio_file is None:
+        return Response(
+            content=audio[start : end + 1],
+            status_code=status_code,
+            media_type=media_type,
+            headers=headers,
+        )
+
+    # Files on local disk are streamed rather than read into memory
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _read_file(audio_file, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _get_cache_control(expires: Optional[int]) -> str:
+    """
+    Get the Cache-Control header of a served file.
+
+    Args:
+        expires (Optional[int]): The verified link expiry, if links are signed.
+
+    Returns:
+        str: Immutable and public for unsigned links, private until the expiry otherwise.
+    """
+    if not audio_links.signed:
+        return CACHE_CONTROL
+
+    return SIGNED_CACHE_CONTROL.format(max_age=max(0, expires - int(time.time())))
+
+
+def _read_file(audio_file: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """
+    Read a byte range of an open audio file in chunks, closing it at the end.
+
+    Args:
+        audio_file (BinaryIO): The open audio file.
+        start (int): The first byte.
+        end (int): The last byte, inclusive.
+
+    Yields:
+        bytes: The next chunk of the range.
+    """
+    with audio_file:
+        audio_file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = audio_file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
@@ -1,9 +1,9 @@
+from typing import Dict
+
 from fastapi import APIRouter, HTTPException
 
-from src.clients.azure_openai import AzureOpenAIClient
-from src.clients.azure_speech_synthesis import AzureSpeechSynthesisClient
-from src.clients.azure_text_analytics import AzureTextAnalyticsClient
-from src.dtos import HealthResponse
+from src.clients import health_monitor
+from src.dtos import HealthCheck, HealthResponse
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -11,15 +11,22 @@ router = APIRouter(prefix="/health", tags=["health"])
 @router.get(
     "/",
     summary="Health check",
-    description="Checks the health of all Azure services clients.",
+    description=(
+        "Reports whether each Azure service answered its latest background probe, "
+        "with the age of the result. Never calls the services itself."
+    ),
     response_description="The health status of all Azure services clients.",
     response_model=HealthResponse
 )
 def health_check():
+    checks = {
+        name: HealthCheck(**result) for name, result in health_monitor.status().items()
+    }
     health_response = HealthResponse(
-        azure_open_ai_client=_check_azure_openai_client(),
-        azure_text_analytics_client=_check_azure_text_analytics_client(),
-        azure_speech_synthesis_client=_check_azure_speech_synthesis_client(),
+        azure_open_ai_client=checks["azure_open_ai_client"].healthy,
+        azure_text_analytics_client=checks["azure_text_analytics_client"].healthy,
+        azure_speech_synthesis_client=checks["azure_speech_synthesis_client"].healthy,
+        checks=checks,
     )
 
     if not all(
@@ -40,28 +47,11 @@ def health_check():
     return health_response
 
 
-def _check_azure_openai_client():
-    try:
-        AzureOpenAIClient()
-        return True
-    except Exception as e:
-        print(f"AzureOpenAIClient init failed: {e}")
-        return False
-
-
-def _check_azure_text_analytics_client():
-    try:
-        AzureTextAnalyticsClient()
-        return True
-    except Exception as e:
-        print(f"AzureTextAnalyticsClient init failed: {e}")
-        return False
-
-
-def _check_azure_speech_synthesis_client():
-    try:
-        AzureSpeechSynthesisClient()
-        return True
-    except Exception as e:
-        print(f"AzureSpeechSynthesisClient init failed: {e}")
-        return False
+@router.get(
+    "/live",
+    summary="Liveness check",
+    description="Reports that the API process is serving requests, without checking any dependency.",
+    response_description="The liveness status.",
+)
+async def liveness_check() -> Dict[str, str]:
+    return {"status": "ok"}
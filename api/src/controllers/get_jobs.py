@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from src.dtos import JobResponse
+from src.jobs import job_runner
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get a feedback job",
+    description=(
+        "Returns the status of a feedback job, and its result once it has succeeded. "
+        "With `wait`, waits up to that many seconds for the job to finish."
+    ),
+    response_description="The job status and, when finished, its result or error.",
+)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to wait for the job to finish."),
+) -> JobResponse:
+    job = await job_runner.wait(job_id, wait) if wait else await job_runner.get(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
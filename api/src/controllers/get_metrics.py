@@ -0,0 +1,59 @@
+from fastapi import APIRouter
+
+from src.clients import (
+    azure_openai_client,
+    azure_text_analytics_client,
+    azure_speech_synthesis_client,
+)
+from src.dtos import MetricsResponse
+from src.jobs import job_runner
+from src.storage import audio_store, audio_retention
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/",
+    summary="Runtime metrics",
+    description=(
+        "Reports the circuit breaker and concurrency limit of each Azure service, "
+        "along with cache, hedging, synthesizer pool, audio store and retention, and "
+        "job queue counters."
+    ),
+    response_description="The current metrics of each component.",
+    response_model=MetricsResponse,
+)
+async def get_metrics() -> MetricsResponse:
+    text_analytics_batcher = azure_text_analytics_client.batcher
+    speech_pool = azure_speech_synthesis_client.pool
+
+    return MetricsResponse(
+        azure_open_ai_client={
+            **azure_openai_client.guard.stats(),
+            "cache": azure_openai_client.cache.stats() if azure_openai_client.cache else None,
+            "hedger": azure_openai_client.hedger.stats() if azure_openai_client.hedger else None,
+        },
+        azure_text_analytics_client={
+            **azure_text_analytics_client.guard.stats(),
+            "cache": (
+                azure_text_analytics_client.cache.stats()
+                if azure_text_analytics_client.cache
+                else None
+            ),
+            "batcher": (
+                {"batches": text_analytics_batcher.batches, "items": text_analytics_batcher.items}
+                if text_analytics_batcher
+                else None
+            ),
+        },
+        azure_speech_synthesis_client={
+            **azure_speech_synthesis_client.guard.stats(),
+            "pool": speech_pool.stats() if speech_pool else None,
+            "pending_streams": len(azure_speech_synthesis_client.pending),
+        },
+        audio_store={
+            **audio_store.stats(),
+            "retention": audio_retention.stats() if audio_retention else None,
+        },
+        jobs={"pending": job_runner.pending, "max_pending": job_runner.max_pending},
+    )
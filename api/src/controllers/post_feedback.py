@@ -1,18 +1,220 @@
-from fastapi import APIRouter, Body
+import json
+import base64
+import logging
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from src import api_settings
 from src.actions import GenerateFeedbackResponse
-from src.dtos import Feedback, SentimentResponse
+from src.clients import azure_speech_synthesis_client
+from src.clients.audio_formats import (
+    AUDIO_FORMATS,
+    MEDIA_TYPES,
+    get_audio_format_for_accept,
+)
+from src.dtos import (
+    Feedback,
+    FeedbackBatch,
+    JobResponse,
+    SentimentResponse,
+    InlineAudioResponse,
+    FeedbackBatchResponse,
+)
+from src.jobs import JobQueueFullError, job_runner
+from src.utils import encode_multipart
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
 
 @router.post(
     "/",
-    response_model=SentimentResponse,
+    response_model=InlineAudioResponse | SentimentResponse | JobResponse,
     summary="Process user feedback",
-    description="Analyzes feedback sentiment and generates an AI response including audio.",
+    description=(
+        "Analyzes feedback sentiment and generates an AI response including audio. "
+        "With `mode=async` the feedback is queued as a job and its id is returned "
+        "right away; poll `GET /jobs/{id}` for the result. Clients that play the "
+        "audio right away can skip `GET /audio/{filename}` with `inline_audio`: "
+        "`base64` adds it to the JSON as `audio_data`, while `multipart` returns a "
+        "`multipart/mixed` body with the JSON followed by the audio file."
+    ),
     response_description="The analyzed sentiment, generated response, and corresponding audio file.",
+    responses={
+        202: {"model": JobResponse, "description": "The queued job."},
+        400: {"description": "Inline audio was requested for a queued job."},
+        503: {"description": "Too many pending jobs."},
+    },
+)
+async def process_feedback(
+    response: Response,
+    feedback: Feedback = Body(..., examples=[{"feedback": "This is a great product!"}]),
+    mode: Literal["sync", "async"] = Query(
+        "sync", description="`async` queues the feedback as a job instead of waiting."
+    ),
+    inline_audio: Optional[Literal["base64", "multipart"]] = Query(
+        None, description="Return the audio in the response, in sync mode."
+    ),
+) -> InlineAudioResponse | SentimentResponse | JobResponse | Response:
+    if mode == "sync":
+        result = await GenerateFeedbackResponse().call_async(feedback)
+        if inline_audio is None:
+            return result
+
+        return await _inline_audio(result, inline_audio)
+
+    if inline_audio is not None:
+        raise HTTPException(
+            status_code=400, detail="Inline audio is only available in sync mode"
+        )
+
+    try:
+        job = await job_runner.submit(feedback)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+    response.status_code = 202
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
+
+
+@router.post(
+    "/batch",
+    response_model=FeedbackBatchResponse,
+    summary="Process a batch of user feedback",
+    description="Analyzes and answers several feedback messages at once, reporting errors per item.",
+    response_description="The result, or the error, of each feedback message in request order.",
 )
-def process_feedback(
+async def process_feedback_batch(
+    batch: FeedbackBatch = Body(
+        ...,
+        examples=[
+            {
+                "items": [
+                    {"feedback": "This is a great product!"},
+                    {"feedback": "It stopped working after a week."},
+                ]
+            }
+        ],
+    ),
+) -> FeedbackBatchResponse:
+    return await GenerateFeedbackResponse().batch_async(batch.items)
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Process user feedback as a stream",
+    description=(
+        "Streams server-sent events: `sentiment` as soon as it is analyzed, one `token` "
+        "event per generated response token, then `audio` with the full response and "
+        "audio file. Failures are reported as an `error` event."
+    ),
+    response_description="A text/event-stream of feedback processing events.",
+)
+async def stream_feedback(
     feedback: Feedback = Body(..., examples=[{"feedback": "This is a great product!"}]),
-) -> SentimentResponse:
-    return GenerateFeedbackResponse()(feedback)
+) -> StreamingResponse:
+    return StreamingResponse(
+        _server_sent_events(GenerateFeedbackResponse().stream_async(feedback)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/speech",
+    response_class=StreamingResponse,
+    summary="Process user feedback as a spoken response",
+    description=(
+        "Streams the spoken response as audio. Each sentence is synthesized as "
+        "soon as the model has generated it, so playback can start before the full "
+        "response exists. The sentiment is returned in the `X-Sentiment` header. "
+        "The audio profile is the body `audio_format`, or else the first supported "
+        "type in the `Accept` header; WAV cannot be streamed."
+    ),
+    response_description="An audio stream of the spoken response.",
+    responses={
+        400: {"description": "The audio profile cannot be streamed."},
+        406: {"description": "No streamable audio type is accepted."},
+    },
+)
+async def speak_feedback(
+    feedback: Feedback = Body(..., examples=[{"feedback": "This is a great product!"}]),
+    accept: Optional[str] = Header(None),
+) -> StreamingResponse:
+    audio_format = feedback.audio_format or get_audio_format_for_accept(
+        accept, api_settings.azure_ai_services.audio_format
+    )
+
+    if audio_format is None:
+        raise HTTPException(status_code=406, detail="No supported audio type is accepted")
+
+    if not AUDIO_FORMATS[audio_format].streamable:
+        raise HTTPException(
+            status_code=400, detail=f"The {audio_format} audio format cannot be streamed"
+        )
+
+    sentiment, audio = await GenerateFeedbackResponse().speech_async(feedback, audio_format)
+
+    return StreamingResponse(
+        _audio_stream(audio),
+        media_type=AUDIO_FORMATS[audio_format].media_type,
+        headers={"Cache-Control": "no-cache", "X-Sentiment": sentiment},
+    )
+
+
+async def _inline_audio(
+    result: SentimentResponse, encoding: Literal["base64", "multipart"]
+) -> InlineAudioResponse | Response:
+    """
+    Add the audio file content to a feedback result.
+    """
+    audio = await azure_speech_synthesis_client.read_async(result.audio)
+
+    if encoding == "base64":
+        return InlineAudioResponse(
+            **result.model_dump(), audio_data=base64.b64encode(audio).decode("ascii")
+        )
+
+    content_type, body = encode_multipart(
+        [
+            ({"Content-Type": "application/json"}, result.model_dump_json().encode("utf-8")),
+            (
+                {
+                    "Content-Type": MEDIA_TYPES[result.audio.rsplit(".", 1)[-1]],
+                    "Content-Disposition": f'attachment; filename="{result.audio}"',
+                },
+                audio,
+            ),
+        ]
+    )
+
+    return Response(content=body, media_type=content_type)
+
+
+async def _audio_stream(audio: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Forward audio chunks, ending the stream early on failure.
+    """
+    try:
+        async for chunk in audio:
+            yield chunk
+    except Exception as e:
+        logger.error(f"Feedback speech stream failed: {e}")
+
+
+async def _server_sent_events(
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """
+    Format pipeline events as server-sent events, ending with an error event on failure.
+    """
+    try:
+        async for event, data in events:
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    except Exception as e:
+        logger.error(f"Feedback stream failed: {e}")
+        yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
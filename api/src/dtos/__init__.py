@@ -1,3 +1,9 @@
 from .feedback import Feedback
+from .feedback_batch import FeedbackBatch
 from .sentiment_response import SentimentResponse
-from .health_response import HealthResponse
\ No newline at end of file
+from .inline_audio_response import InlineAudioResponse
+from .feedback_batch_response import FeedbackBatchResult, FeedbackBatchResponse
+from .health_check import HealthCheck
+from .health_response import HealthResponse
+from .job_response import JobResponse
+from .metrics_response import MetricsResponse
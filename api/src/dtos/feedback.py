@@ -1,5 +1,15 @@
-from pydantic import BaseModel
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
 
 
 class Feedback(BaseModel):
     feedback: str
+    audio_format: Optional[Literal["mp3-high", "mp3-low", "opus", "pcm"]] = Field(
+        default=None,
+        description=(
+            "Audio profile: `mp3-high` (48 kHz, 192 kbps), `mp3-low` (16 kHz, 32 kbps), "
+            "`opus` (Ogg Opus, 24 kHz) or `pcm` (WAV, 24 kHz). Defaults to the "
+            "server's configured profile."
+        ),
+    )
@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from src.dtos.feedback import Feedback
+
+
+class FeedbackBatch(BaseModel):
+    items: List[Feedback] = Field(min_length=1, max_length=100)
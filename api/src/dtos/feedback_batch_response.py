@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class FeedbackBatchResult(BaseModel):
+    feedback: str
+    sentiment: Optional[str] = None
+    response: Optional[str] = None
+    audio: Optional[str] = None
+    audio_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+class FeedbackBatchResponse(BaseModel):
+    results: List[FeedbackBatchResult]
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class HealthCheck(BaseModel):
+    healthy: bool
+    age: Optional[float] = None
+    latency: Optional[float] = None
+    error: Optional[str] = None
@@ -1,7 +1,12 @@
-from pydantic import BaseModel
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from src.dtos.health_check import HealthCheck
 
 
 class HealthResponse(BaseModel):
     azure_open_ai_client: bool
     azure_text_analytics_client: bool
     azure_speech_synthesis_client: bool
+    checks: Dict[str, HealthCheck] = Field(default_factory=dict)
@@ -0,0 +1,7 @@
+from pydantic import Field
+
+from src.dtos.sentiment_response import SentimentResponse
+
+
+class InlineAudioResponse(SentimentResponse):
+    audio_data: str = Field(description="The audio file content, base64 encoded.")
@@ -0,0 +1,12 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+from src.dtos.sentiment_response import SentimentResponse
+
+
+class JobResponse(BaseModel):
+    id: str
+    status: Literal["pending", "running", "succeeded", "failed"]
+    result: Optional[SentimentResponse] = None
+    error: Optional[str] = None
@@ -0,0 +1,11 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+
+class MetricsResponse(BaseModel):
+    azure_open_ai_client: Dict[str, Any]
+    azure_text_analytics_client: Dict[str, Any]
+    azure_speech_synthesis_client: Dict[str, Any]
+    audio_store: Dict[str, Any]
+    jobs: Dict[str, Any]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -6,3 +8,4 @@ class SentimentResponse(BaseModel):
     sentiment: str
     response: str
     audio: str
+    audio_url: Optional[str] = None
@@ -0,0 +1,3 @@
+from .job_errors import JobQueueFullError
+from .job_store import JobStore, MemoryJobStore, SQLiteJobStore
+from .job_runner import JobRunner, job_runner
@@ -0,0 +1,6 @@
+class JobQueueFullError(Exception):
+    """
+    Custom exception raised when the job runner has no room for more jobs.
+    """
+
+    pass
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from uuid_extensions import uuid7str
+
+from src import api_settings
+from src.actions import GenerateFeedbackResponse
+from src.dtos import Feedback, JobResponse
+from src.jobs.job_errors import JobQueueFullError
+from src.jobs.job_store import JobStore, MemoryJobStore, SQLiteJobStore
+from src.settings.jobs import Jobs
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.25
+FINISHED = ("succeeded", "failed")
+
+
+class JobRunner:
+    """
+    Runs feedback jobs on a bounded worker pool, keeping their state in a job store.
+
+    Attributes:
+        store (JobStore): The job state store.
+        max_pending (int): Maximum queued or running jobs.
+        pending (int): Jobs currently queued or running.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int, max_pending: int):
+        self.store = store
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="feedback-job"
+        )
+        self._lock = threading.Lock()
+
+    async def submit(self, feedback: Feedback) -> JobResponse:
+        """
+        Queue a feedback job, without blocking the event loop on the job store.
+
+        Args:
+            feedback (Feedback): The user feedback.
+
+        Returns:
+            JobResponse: The pending job.
+
+        Raises:
+            JobQueueFullError: If there are already `max_pending` jobs queued or running.
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise JobQueueFullError("Too many pending jobs")
+            self.pending += 1
+
+        job = JobResponse(id=uuid7str(), status="pending")
+
+        try:
+            await asyncio.to_thread(self.store.set, job)
+            self._executor.submit(self._run, job, feedback)
+        except Exception:
+            with self._lock:
+                self.pending -= 1
+            raise
+
+        return job
+
+    async def get(self, job_id: str) -> Optional[JobResponse]:
+        """
+        Get a job, without blocking the event loop on the job store.
+
+        Args:
+            job_id (str): The job id.
+
+        Returns:
+            Optional[JobResponse]: The job, or None if unknown or expired.
+        """
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[JobResponse]:
+        """
+        Wait until a job finishes or the timeout elapses.
+
+        The store is polled so that jobs run by other processes sharing it are seen too.
+
+        Args:
+            job_id (str): The job id.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            Optional[JobResponse]: The job as last seen, or None if unknown or expired.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        while True:
+            job = await asyncio.to_thread(self.store.get, job_id)
+            remaining = deadline - asyncio.get_running_loop().time()
+
+            if job is None or job.status in FINISHED or remaining <= 0:
+                return job
+
+            await asyncio.sleep(min(POLL_INTERVAL, remaining))
+
+    def _run(self, job: JobResponse, feedback: Feedback) -> None:
+        """Run the feedback pipeline for a job, recording its outcome."""
+        try:
+            self.store.set(job.model_copy(update={"status": "running"}))
+            result = GenerateFeedbackResponse()(feedback)
+            self.store.set(job.model_copy(update={"status": "succeeded", "result": result}))
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            self.store.set(job.model_copy(update={"status": "failed", "error": str(e)}))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+
+def _get_job_store(settings: Jobs) -> JobStore:
+    """
+    Create the configured job store.
+
+    Args:
+        settings (Jobs): Job settings.
+
+    Returns:
+        JobStore: The job store.
+    """
+    if settings.store == "sqlite":
+        return SQLiteJobStore(path=settings.sqlite_path, ttl=settings.ttl)
+
+    return MemoryJobStore(ttl=settings.ttl)
+
+
+job_runner = JobRunner(
+    store=_get_job_store(api_settings.jobs),
+    max_workers=api_settings.jobs.max_workers,
+    max_pending=api_settings.jobs.max_pending,
+)
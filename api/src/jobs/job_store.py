@@ -0,0 +1,110 @@
+import os
+import time
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from src.dtos import JobResponse
+from src.utils import TTLCache
+
+
+class JobStore(ABC):
+    """
+    Keeps the state of feedback jobs until they expire.
+    """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobResponse]:
+        """
+        Get a job.
+
+        Args:
+            job_id (str): The job id.
+
+        Returns:
+            Optional[JobResponse]: The job, or None if unknown or expired.
+        """
+
+    @abstractmethod
+    def set(self, job: JobResponse) -> None:
+        """
+        Create or update a job.
+
+        Args:
+            job (JobResponse): The job.
+        """
+
+
+class MemoryJobStore(JobStore):
+    """
+    Job store kept in the process memory.
+
+    Attributes:
+        jobs (TTLCache): The jobs, by id.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 100000):
+        self.jobs = TTLCache(max_entries=max_entries, ttl=ttl)
+
+    def get(self, job_id: str) -> Optional[JobResponse]:
+        return self.jobs.get(job_id)
+
+    def set(self, job: JobResponse) -> None:
+        self.jobs.set(job.id, job)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store in a SQLite database, shared by every process using the same file.
+
+    Attributes:
+        path (str): The SQLite database path.
+        ttl (float): Seconds a job is kept after it is created.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._create_table()
+
+    def get(self, job_id: str) -> Optional[JobResponse]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM jobs WHERE id = ? AND expires_at > ?",
+                (job_id, time.time()),
+            ).fetchone()
+
+        return JobResponse.model_validate_json(row[0]) if row else None
+
+    def set(self, job: JobResponse) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET value = excluded.value",
+                (job.id, job.model_dump_json(), time.time() + self.ttl),
+            )
+            connection.execute("DELETE FROM jobs WHERE expires_at <= ?", (time.time(),))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the job database, committing and closing it on exit."""
+        connection = sqlite3.connect(self.path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_table(self) -> None:
+        """Create the jobs table if it does not exist."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs "
+                "(id TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,4 +26,76 @@ class AzureAIServices(BaseSettings):
         default="audio"
     )
 
+    audio_format: Literal["mp3-high", "mp3-low", "opus", "pcm"] = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_AUDIO_FORMAT"),
+        description="Default audio profile when a request does not pick one",
+        default="mp3-high",
+    )
+
+    audio_content_addressed: bool = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_AUDIO_CONTENT_ADDRESSED"),
+        description="Name audio files after their content and reuse existing files",
+        default=False,
+    )
+
+    audio_streaming: bool = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_AUDIO_STREAMING"),
+        description=(
+            "Defer synthesis until the audio is downloaded and stream it while it is "
+            "synthesized. Deferred audio can only be downloaded from the same API "
+            "instance, within 10 minutes, until it is saved"
+        ),
+        default=False,
+    )
+
+    audio_stream_save: bool = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_AUDIO_STREAM_SAVE"),
+        description=(
+            "Also save streamed audio to the audio store; without it, every later "
+            "download synthesizes the audio again"
+        ),
+        default=True,
+    )
+
+    speech_max_concurrency: int = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SPEECH_MAX_CONCURRENCY"),
+        description="Maximum concurrent speech syntheses per batch",
+        default=4,
+        gt=0,
+    )
+
+    speech_pool_size: int = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SPEECH_POOL_SIZE"),
+        description="Pre-connected speech synthesizers kept for reuse (0 disables pooling)",
+        default=0,
+        ge=0,
+    )
+
+    sentiment_batch_window_ms: float = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SENTIMENT_BATCH_WINDOW_MS"),
+        description="Window to coalesce concurrent sentiment requests, in milliseconds (0 disables)",
+        default=0,
+        ge=0,
+    )
+
+    sentiment_cache_enabled: bool = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SENTIMENT_CACHE_ENABLED"),
+        description="Cache sentiment results by normalized text",
+        default=False,
+    )
+
+    sentiment_cache_max_entries: int = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SENTIMENT_CACHE_MAX_ENTRIES"),
+        description="Maximum cached sentiment results",
+        default=10000,
+        gt=0,
+    )
+
+    sentiment_cache_ttl: float = Field(
+        alias=AliasChoices("AZURE_AI_SERVICES_SENTIMENT_CACHE_TTL"),
+        description="Seconds a cached sentiment result stays valid",
+        default=3600,
+        gt=0,
+    )
+
     model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -40,4 +42,72 @@ class AzureOpenAI(BaseSettings):
         description="Azure OpenAI system prompt",
     )
 
+    max_concurrency: int = Field(
+        alias=AliasChoices("AZURE_OPENAI_MAX_CONCURRENCY"),
+        description="Maximum concurrent Azure OpenAI calls per batch",
+        default=5,
+        gt=0,
+    )
+
+    cache_enabled: bool = Field(
+        alias=AliasChoices("AZURE_OPENAI_CACHE_ENABLED"),
+        description="Cache LLM responses by prompt and model settings",
+        default=False,
+    )
+
+    cache_max_entries: int = Field(
+        alias=AliasChoices("AZURE_OPENAI_CACHE_MAX_ENTRIES"),
+        description="Maximum LLM responses kept in memory",
+        default=1000,
+        gt=0,
+    )
+
+    cache_ttl: float = Field(
+        alias=AliasChoices("AZURE_OPENAI_CACHE_TTL"),
+        description="Seconds a cached LLM response stays valid",
+        default=86400,
+        gt=0,
+    )
+
+    cache_path: Optional[str] = Field(
+        alias=AliasChoices("AZURE_OPENAI_CACHE_PATH"),
+        description="SQLite file for the persistent LLM response cache (memory only if unset)",
+        default=None,
+    )
+
+    hedge_enabled: bool = Field(
+        alias=AliasChoices("AZURE_OPENAI_HEDGE_ENABLED"),
+        description="Send a second LLM call when the first one is slower than usual",
+        default=False,
+    )
+
+    hedge_percentile: float = Field(
+        alias=AliasChoices("AZURE_OPENAI_HEDGE_PERCENTILE"),
+        description="Percentile of recent LLM latencies after which a call is hedged",
+        default=95,
+        gt=0,
+        lt=100,
+    )
+
+    hedge_max_rate: float = Field(
+        alias=AliasChoices("AZURE_OPENAI_HEDGE_MAX_RATE"),
+        description="Maximum fraction of LLM calls hedged",
+        default=0.05,
+        ge=0,
+        le=1,
+    )
+
+    hedge_initial_delay: float = Field(
+        alias=AliasChoices("AZURE_OPENAI_HEDGE_INITIAL_DELAY"),
+        description="Seconds before hedging until enough LLM latencies are recorded",
+        default=2,
+        gt=0,
+    )
+
+    hedge_deployment: Optional[str] = Field(
+        alias=AliasChoices("AZURE_OPENAI_HEDGE_DEPLOYMENT"),
+        description="Secondary Azure OpenAI deployment for hedge calls (same deployment if unset)",
+        default=None,
+    )
+
     model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -0,0 +1,30 @@
+from pydantic import Field, AliasChoices
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Health(BaseSettings):
+    interval: float = Field(
+        alias=AliasChoices("HEALTH_CHECK_INTERVAL"),
+        description="Seconds between background health probes",
+        default=30,
+        gt=0,
+    )
+
+    timeout: float = Field(
+        alias=AliasChoices("HEALTH_CHECK_TIMEOUT"),
+        description="Seconds before a health probe is considered failed",
+        default=5,
+        gt=0,
+    )
+
+    text_analytics_probe: bool = Field(
+        alias=AliasChoices("HEALTH_CHECK_TEXT_ANALYTICS_PROBE"),
+        description=(
+            "Probe Text Analytics with a one-document sentiment request. Each probe "
+            "is a billed text record, every interval on every instance; when off, "
+            "the health check reports the circuit breaker state instead"
+        ),
+        default=False,
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -0,0 +1,41 @@
+from typing import Literal
+
+from pydantic import Field, AliasChoices
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Jobs(BaseSettings):
+    store: Literal["memory", "sqlite"] = Field(
+        alias=AliasChoices("JOBS_STORE"),
+        description="Job state store, in-memory or SQLite for multi-process setups",
+        default="memory",
+    )
+
+    sqlite_path: str = Field(
+        alias=AliasChoices("JOBS_SQLITE_PATH"),
+        description="SQLite job store file",
+        default="jobs.db",
+    )
+
+    max_workers: int = Field(
+        alias=AliasChoices("JOBS_MAX_WORKERS"),
+        description="Worker threads running feedback jobs",
+        default=4,
+        gt=0,
+    )
+
+    max_pending: int = Field(
+        alias=AliasChoices("JOBS_MAX_PENDING"),
+        description="Maximum queued or running jobs before new jobs are rejected",
+        default=100,
+        gt=0,
+    )
+
+    ttl: float = Field(
+        alias=AliasChoices("JOBS_TTL"),
+        description="Seconds a job is kept after it is created",
+        default=3600,
+        gt=0,
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
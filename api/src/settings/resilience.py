@@ -0,0 +1,63 @@
+from pydantic import Field, AliasChoices
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Resilience(BaseSettings):
+    enabled: bool = Field(
+        alias=AliasChoices("RESILIENCE_ENABLED"),
+        description="Guard the Azure clients with circuit breakers",
+        default=True,
+    )
+
+    load_shedding: bool = Field(
+        alias=AliasChoices("RESILIENCE_LOAD_SHEDDING"),
+        description=(
+            "Also cap concurrent calls per Azure client with an adaptive limit; "
+            "calls over the limit are rejected with 503 instead of queued"
+        ),
+        default=False,
+    )
+
+    failure_threshold: int = Field(
+        alias=AliasChoices("RESILIENCE_FAILURE_THRESHOLD"),
+        description="Consecutive failures that open a dependency circuit",
+        default=5,
+        gt=0,
+    )
+
+    reset_timeout: float = Field(
+        alias=AliasChoices("RESILIENCE_RESET_TIMEOUT"),
+        description="Seconds an open circuit waits before a trial call",
+        default=30,
+        gt=0,
+    )
+
+    initial_limit: int = Field(
+        alias=AliasChoices("RESILIENCE_INITIAL_LIMIT"),
+        description="Initial concurrent calls allowed per dependency, with load shedding",
+        default=20,
+        gt=0,
+    )
+
+    min_limit: int = Field(
+        alias=AliasChoices("RESILIENCE_MIN_LIMIT"),
+        description="Lowest concurrent calls allowed per dependency",
+        default=1,
+        gt=0,
+    )
+
+    max_limit: int = Field(
+        alias=AliasChoices("RESILIENCE_MAX_LIMIT"),
+        description="Highest concurrent calls allowed per dependency",
+        default=100,
+        gt=0,
+    )
+
+    latency_target: float = Field(
+        alias=AliasChoices("RESILIENCE_LATENCY_TARGET"),
+        description="Seconds above which a call lowers the concurrency limit (0 disables)",
+        default=0,
+        ge=0,
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -3,6 +3,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.settings.azure_openai import AzureOpenAI
 from src.settings.azure_ai_services import AzureAIServices
+from src.settings.jobs import Jobs
+from src.settings.health import Health
+from src.settings.resilience import Resilience
+from src.settings.storage import Storage
 
 
 class Settings(BaseSettings):
@@ -12,6 +16,10 @@ class Settings(BaseSettings):
 
     azure_openai: AzureOpenAI = Field(default_factory=AzureOpenAI)
     azure_ai_services: AzureAIServices = Field(default_factory=AzureAIServices)
+    jobs: Jobs = Field(default_factory=Jobs)
+    health: Health = Field(default_factory=Health)
+    resilience: Resilience = Field(default_factory=Resilience)
+    storage: Storage = Field(default_factory=Storage)
 
     prompt: str = Field(
         alias=AliasChoices("PROMPT_FILE"), description="Prompts definition file"
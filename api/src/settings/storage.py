@@ -0,0 +1,76 @@
+from typing import Literal, Optional
+
+from pydantic import Field, AliasChoices
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Storage(BaseSettings):
+    backend: Literal["local", "memory", "blob"] = Field(
+        alias=AliasChoices("AUDIO_STORE"),
+        description="Audio store, the local audio path, process memory or Azure Blob Storage",
+        default="local",
+    )
+
+    hot_tier: bool = Field(
+        alias=AliasChoices("AUDIO_STORE_HOT_TIER"),
+        description="Keep freshly synthesized audio in memory in front of the local or blob store",
+        default=False,
+    )
+
+    memory_max_mb: float = Field(
+        alias=AliasChoices("AUDIO_STORE_MEMORY_MAX_MB"),
+        description="Maximum megabytes of audio kept in memory",
+        default=64,
+        gt=0,
+    )
+
+    blob_connection_string: Optional[str] = Field(
+        alias=AliasChoices("AUDIO_STORE_BLOB_CONNECTION_STRING"),
+        description="Azure Storage connection string for the blob store",
+        default=None,
+    )
+
+    blob_container: str = Field(
+        alias=AliasChoices("AUDIO_STORE_BLOB_CONTAINER"),
+        description="Blob container holding the audio",
+        default="audio",
+    )
+
+    retention_max_age: float = Field(
+        alias=AliasChoices("AUDIO_RETENTION_MAX_AGE"),
+        description=(
+            "Seconds local audio is kept: per-request audio after its creation, "
+            "content-addressed audio after its last download (0 keeps it)"
+        ),
+        default=0,
+        ge=0,
+    )
+
+    retention_max_mb: float = Field(
+        alias=AliasChoices("AUDIO_RETENTION_MAX_MB"),
+        description="Maximum megabytes of local audio, least recently accessed removed first (0 is unlimited)",
+        default=0,
+        ge=0,
+    )
+
+    retention_interval: float = Field(
+        alias=AliasChoices("AUDIO_RETENTION_INTERVAL"),
+        description="Seconds between local audio retention sweeps",
+        default=300,
+        gt=0,
+    )
+
+    url_signing_key: Optional[str] = Field(
+        alias=AliasChoices("AUDIO_URL_SIGNING_KEY"),
+        description="Key signing the audio download links; when set, unsigned downloads are refused",
+        default=None,
+    )
+
+    url_ttl: float = Field(
+        alias=AliasChoices("AUDIO_URL_TTL"),
+        description="Seconds a signed audio download link is valid",
+        default=300,
+        gt=0,
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -0,0 +1,5 @@
+from .audio_store import AudioStore, LocalAudioStore, MemoryAudioStore
+from .blob_audio_store import BlobAudioStore
+from .audio_retention import AudioRetention
+from .audio_links import AudioLinks
+from .store import audio_store, audio_retention, audio_links
@@ -0,0 +1,86 @@
+import hmac
+import time
+import base64
+import hashlib
+from typing import Optional
+
+
+class AudioLinks:
+    """
+    Builds and checks the links to the audio download endpoint.
+
+    With a signing key the links carry an expiry time and an HMAC-SHA256 signature
+    of the file name and expiry, so they can be handed to a browser without opening
+    the endpoint to everyone. Without a key the links are plain and any request is
+    accepted.
+
+    Attributes:
+        key (Optional[bytes]): The signing key, or None to leave links unsigned.
+        ttl (float): Seconds a signed link is valid.
+    """
+
+    def __init__(self, key: Optional[str], ttl: float):
+        self.key = key.encode("utf-8") if key else None
+        self.ttl = ttl
+
+    @property
+    def signed(self) -> bool:
+        """Whether the links are signed and the signature is required."""
+        return self.key is not None
+
+    def url(self, filename: str, now: Optional[float] = None) -> str:
+        """
+        Get the download link of an audio file.
+
+        Args:
+            filename (str): The audio file name.
+            now (Optional[float]): The current time, for tests.
+
+        Returns:
+            str: The path of the download endpoint, with `expires` and `signature`
+                query parameters if links are signed.
+        """
+        if not self.signed:
+            return f"/audio/{filename}"
+
+        expires = int((time.time() if now is None else now) + self.ttl)
+
+        return f"/audio/{filename}?expires={expires}&signature={self._sign(filename, expires)}"
+
+    def verify(
+        self,
+        filename: str,
+        expires: Optional[int],
+        signature: Optional[str],
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Check a download link.
+
+        Args:
+            filename (str): The audio file name.
+            expires (Optional[int]): The link expiry time, as a Unix timestamp.
+            signature (Optional[str]): The link signature.
+            now (Optional[float]): The current time, for tests.
+
+        Returns:
+            bool: Whether links are unsigned, or the link is signed and not expired.
+        """
+        if not self.signed:
+            return True
+
+        if expires is None or signature is None:
+            return False
+
+        if expires < (time.time() if now is None else now):
+            return False
+
+        return hmac.compare_digest(signature, self._sign(filename, expires))
+
+    def _sign(self, filename: str, expires: int) -> str:
+        """Sign a file name and expiry time."""
+        digest = hmac.new(
+            self.key, f"{filename}\n{expires}".encode("utf-8"), hashlib.sha256
+        ).digest()
+
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
@@ -0,0 +1,241 @@
+import os
+import time
+import shutil
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.storage.audio_store import (
+    LocalAudioStore,
+    MemoryAudioStore,
+    PARTITION_FORMAT,
+    SHARED_PARTITION,
+)
+
+logger = logging.getLogger(__name__)
+
+PARTITION_SECONDS = 3600
+PARTIAL_FILE_TTL = 3600
+
+
+class AudioRetention:
+    """
+    Enforces a maximum age and a byte quota on a local audio store, in the background.
+
+    Every `interval` seconds:
+
+    - hourly partitions that ended more than `max_age` ago are removed whole;
+    - shared and unpartitioned files not read or written for `max_age` are removed;
+    - while the store holds more than `max_bytes`, the least recently accessed
+      files are removed;
+    - past partitions left empty are removed.
+
+    Files removed are also evicted from the memory hot tier in front of the
+    store, if any, so they are not served after their expiry.
+
+    Attributes:
+        store (LocalAudioStore): The audio store.
+        hot_tier (Optional[MemoryAudioStore]): The memory tier in front of the store, if any.
+        max_age (float): Seconds audio is kept (0 keeps it forever).
+        max_bytes (int): Maximum bytes of audio kept (0 is unlimited).
+        interval (float): Seconds between sweeps.
+    """
+
+    def __init__(
+        self,
+        store: LocalAudioStore,
+        max_age: float,
+        max_bytes: int,
+        interval: float,
+        hot_tier: Optional[MemoryAudioStore] = None,
+    ):
+        self.store = store
+        self.hot_tier = hot_tier
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self._stats = {
+            "sweeps": 0,
+            "partitions_removed": 0,
+            "files_removed": 0,
+            "bytes_reclaimed": 0,
+            "bytes": 0,
+            "last_sweep_duration": None,
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start sweeping in a background thread, if not already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="audio-retention", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sweeping."""
+        self._stop.set()
+
+    def sweep(self) -> None:
+        """Remove expired audio, then the least recently accessed audio over the quota."""
+        started = time.monotonic()
+        now = time.time()
+        expired_before = now - self.max_age if self.max_age else None
+        files: List[Tuple[float, int, str]] = []
+        partitions = []
+
+        try:
+            entries = list(os.scandir(self.store.path))
+        except FileNotFoundError:
+            entries = []
+
+        for entry in entries:
+            if entry.is_file():
+                self._collect(entry, now, expired_before, files)
+                continue
+
+            partition_end = self._get_partition_end(entry.name)
+            if (
+                expired_before is not None
+                and partition_end is not None
+                and partition_end <= expired_before
+            ):
+                self._remove_partition(entry.path)
+                continue
+
+            if partition_end is not None and partition_end <= now:
+                partitions.append(entry.path)
+
+            for file_entry in os.scandir(entry.path):
+                self._collect(
+                    file_entry,
+                    now,
+                    expired_before if partition_end is None else None,
+                    files,
+                )
+
+        total = sum(size for _, size, _ in files)
+
+        if self.max_bytes and total > self.max_bytes:
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                self._remove_file(path, size)
+                total -= size
+
+        for path in partitions:
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+        with self._lock:
+            self._stats["sweeps"] += 1
+            self._stats["bytes"] = total
+            self._stats["last_sweep_duration"] = time.monotonic() - started
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the retention metrics.
+
+        Returns:
+            Dict[str, Any]: Sweeps run, partitions and files removed, bytes reclaimed,
+                bytes stored after the last sweep and its duration in seconds.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _collect(
+        self,
+        entry: os.DirEntry,
+        now: float,
+        expired_before: Optional[float],
+        files: List[Tuple[float, int, str]],
+    ) -> None:
+        """Remove a stale partial or expired file, or add it to the quota candidates."""
+        if not entry.is_file():
+            return
+
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            return
+
+        if entry.name.endswith(".part"):
+            if stat.st_mtime < now - PARTIAL_FILE_TTL:
+                self._remove_file(entry.path, stat.st_size)
+            return
+
+        accessed = max(stat.st_atime, stat.st_mtime)
+        if expired_before is not None and accessed < expired_before:
+            self._remove_file(entry.path, stat.st_size)
+            return
+
+        files.append((accessed, stat.st_size, entry.path))
+
+    def _remove_partition(self, path: str) -> None:
+        """Remove a whole partition."""
+        removed = 0
+        reclaimed = 0
+        filenames = []
+        for entry in os.scandir(path):
+            if entry.is_file():
+                removed += 1
+                reclaimed += entry.stat().st_size
+                filenames.append(entry.name)
+
+        shutil.rmtree(path, ignore_errors=True)
+
+        for filename in filenames:
+            self._evict(filename)
+
+        with self._lock:
+            self._stats["partitions_removed"] += 1
+            self._stats["files_removed"] += removed
+            self._stats["bytes_reclaimed"] += reclaimed
+
+    def _remove_file(self, path: str, size: int) -> None:
+        """Remove a single file."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+
+        self._evict(os.path.basename(path))
+
+        with self._lock:
+            self._stats["files_removed"] += 1
+            self._stats["bytes_reclaimed"] += size
+
+    def _evict(self, filename: str) -> None:
+        """Drop a removed file from the hot tier, if any."""
+        if self.hot_tier is not None:
+            self.hot_tier.evict(filename)
+
+    def _get_partition_end(self, name: str) -> Optional[float]:
+        """Get when an hourly partition ended, or None for the shared partition."""
+        if name == SHARED_PARTITION:
+            return None
+
+        try:
+            start = datetime.strptime(name, PARTITION_FORMAT).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+        return start.timestamp() + PARTITION_SECONDS
+
+    def _run(self) -> None:
+        """Sweep on every interval until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Audio retention sweep failed: {e}")
+            self._stop.wait(self.interval)
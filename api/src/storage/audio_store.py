@@ -0,0 +1,373 @@
+import os
+import time
+import uuid
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Optional
+
+from uuid_extensions import uuid7str, uuid_to_datetime
+
+SHARED_PARTITION = "shared"
+PARTITION_FORMAT = "%Y-%m-%dT%H"
+
+
+class AudioStore(ABC):
+    """
+    Keeps the synthesized audio files, by file name.
+    """
+
+    @abstractmethod
+    def exists(self, filename: str) -> bool:
+        """
+        Check whether an audio file is stored.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            bool: Whether the file is stored.
+        """
+
+    @abstractmethod
+    def get(self, filename: str) -> Optional[bytes]:
+        """
+        Read an audio file.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            Optional[bytes]: The audio, or None if not stored.
+        """
+
+    @abstractmethod
+    def put(self, filename: str, audio: bytes) -> None:
+        """
+        Store an audio file, replacing any previous one with the same name.
+
+        Args:
+            filename (str): The audio file name.
+            audio (bytes): The audio.
+        """
+
+    @abstractmethod
+    def delete(self, filename: str) -> None:
+        """
+        Remove an audio file, if stored.
+
+        Args:
+            filename (str): The audio file name.
+        """
+
+    def touch(self, filename: str) -> None:
+        """
+        Record a read of an audio file served from elsewhere, such as a memory tier.
+
+        Args:
+            filename (str): The audio file name.
+        """
+
+    def open_file(self, filename: str) -> Optional[BinaryIO]:
+        """
+        Open an audio file kept on local disk, so it can be streamed instead of read
+        into memory.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            Optional[BinaryIO]: The open file, which the caller closes, or None if the
+                store does not keep the file on local disk.
+        """
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the store metrics.
+
+        Returns:
+            Dict[str, Any]: The store type and its counters.
+        """
+        return {"type": type(self).__name__}
+
+
+class LocalAudioStore(AudioStore):
+    """
+    Audio store in a local directory, only shared by processes on the same host.
+
+    Files named after a uuid7 are kept in an hourly partition taken from the time
+    encoded in the uuid, such as `2025-02-14T09/`, so expired audio can be dropped
+    a whole partition at a time. Content-addressed files carry no creation time and
+    are kept in the `shared/` partition. Files written before partitioning, at the
+    top of the directory, are still read.
+
+    Reading a file updates its access time, which the retention sweep uses to evict
+    the least recently used files first.
+
+    Attributes:
+        path (str): The audio directory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def exists(self, filename: str) -> bool:
+        return self._find(filename) is not None
+
+    def get(self, filename: str) -> Optional[bytes]:
+        file_path = self._find(filename)
+        if file_path is None:
+            return None
+
+        try:
+            with open(file_path, "rb") as audio_file:
+                audio = audio_file.read()
+        except FileNotFoundError:
+            return None
+
+        self._touch(file_path)
+
+        return audio
+
+    def open_file(self, filename: str) -> Optional[BinaryIO]:
+        file_path = self._find(filename)
+        if file_path is None:
+            return None
+
+        try:
+            audio_file = open(file_path, "rb")
+        except FileNotFoundError:
+            return None
+
+        self._touch(file_path)
+
+        return audio_file
+
+    def touch(self, filename: str) -> None:
+        file_path = self._find(filename)
+        if file_path is not None:
+            self._touch(file_path)
+
+    def put(self, filename: str, audio: bytes) -> None:
+        """
+        Write the audio file atomically, so it is never served half written.
+
+        Args:
+            filename (str): The audio file name.
+            audio (bytes): The audio.
+        """
+        file_path = self._get_file_path(filename)
+        partial_path = f"{file_path}.{uuid7str()}.part"
+
+        try:
+            audio_file = open(partial_path, "wb")
+        except FileNotFoundError:
+            # The retention sweep removed the emptied partition in the meantime
+            self._get_file_path(filename)
+            audio_file = open(partial_path, "wb")
+
+        with audio_file:
+            audio_file.write(audio)
+
+        os.replace(partial_path, file_path)
+
+    def delete(self, filename: str) -> None:
+        for file_path in (self._get_partition_path(filename), self._get_legacy_path(filename)):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def partition(self, filename: str) -> str:
+        """
+        Get the partition of an audio file.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            str: The hour the uuid7 in the file name was created, or the shared
+                partition for any other name.
+        """
+        try:
+            created = uuid_to_datetime(uuid.UUID(filename.split(".", 1)[0]))
+        except ValueError:
+            created = None
+
+        if created is None:
+            return SHARED_PARTITION
+
+        return created.strftime(PARTITION_FORMAT)
+
+    def _find(self, filename: str) -> Optional[str]:
+        """Get the path of a stored audio file, in its partition or at the top."""
+        for file_path in (self._get_partition_path(filename), self._get_legacy_path(filename)):
+            if os.path.isfile(file_path):
+                return file_path
+
+        return None
+
+    def _touch(self, file_path: str) -> None:
+        """Record a read in the file access time, whatever the mount options."""
+        try:
+            os.utime(file_path, (time.time(), os.stat(file_path).st_mtime))
+        except OSError:
+            pass
+
+    def _get_file_path(self, filename: str) -> str:
+        """
+        Get the path of an audio file, creating its partition directory if needed.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            str: The audio file path.
+        """
+        file_path = self._get_partition_path(filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        return file_path
+
+    def _get_partition_path(self, filename: str) -> str:
+        """Get the path of an audio file in its partition."""
+        return os.path.join(self.path, self.partition(filename), filename)
+
+    def _get_legacy_path(self, filename: str) -> str:
+        """Get the path of an audio file written before partitioning."""
+        return os.path.join(self.path, filename)
+
+
+class MemoryAudioStore(AudioStore):
+    """
+    Bounded in-memory audio store, evicting the least recently used files.
+
+    With a backend it is a hot tier: files are written through to the backend and
+    kept in memory while fresh, so they are served without a backend round trip
+    right after being synthesized, which is when they are downloaded. Reads served
+    from memory are still recorded in the backend. Without a backend evicted files
+    are lost, so it only suits a single instance.
+
+    Attributes:
+        max_bytes (int): Maximum bytes of audio kept in memory.
+        backend (Optional[AudioStore]): The store behind the memory tier, if any.
+        hits (int): Reads served from memory.
+        misses (int): Reads not found in memory.
+    """
+
+    def __init__(self, max_bytes: int, backend: Optional[AudioStore] = None):
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._files: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def exists(self, filename: str) -> bool:
+        with self._lock:
+            if filename in self._files:
+                return True
+
+        return self.backend is not None and self.backend.exists(filename)
+
+    def get(self, filename: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._files.get(filename)
+            if audio is not None:
+                self._files.move_to_end(filename)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if audio is not None:
+            # Keep the backend access time current for its least recently used eviction
+            if self.backend is not None:
+                self.backend.touch(filename)
+            return audio
+
+        if self.backend is None:
+            return None
+
+        return self.backend.get(filename)
+
+    def open_file(self, filename: str) -> Optional[BinaryIO]:
+        """
+        Open a file missing from memory in the backend, if kept on local disk.
+
+        Args:
+            filename (str): The audio file name.
+
+        Returns:
+            Optional[BinaryIO]: The open backend file, or None if the file is in
+                memory or the backend does not keep it on local disk.
+        """
+        with self._lock:
+            if filename in self._files:
+                return None
+
+        if self.backend is None:
+            return None
+
+        audio_file = self.backend.open_file(filename)
+        if audio_file is not None:
+            with self._lock:
+                self.misses += 1
+
+        return audio_file
+
+    def put(self, filename: str, audio: bytes) -> None:
+        if self.backend is not None:
+            self.backend.put(filename, audio)
+
+        with self._lock:
+            self._remove(filename)
+            if len(audio) > self.max_bytes:
+                return
+
+            self._files[filename] = audio
+            self._bytes += len(audio)
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._files.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def delete(self, filename: str) -> None:
+        with self._lock:
+            self._remove(filename)
+
+        if self.backend is not None:
+            self.backend.delete(filename)
+
+    def evict(self, filename: str) -> None:
+        """
+        Drop a file from memory only, once the backend no longer holds it.
+
+        Args:
+            filename (str): The audio file name.
+        """
+        with self._lock:
+            self._remove(filename)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "type": type(self).__name__,
+                "entries": len(self._files),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+        if self.backend is not None:
+            stats["backend"] = self.backend.stats()
+
+        return stats
+
+    def _remove(self, filename: str) -> None:
+        """Drop a file from memory; the caller holds the lock."""
+        audio = self._files.pop(filename, None)
+        if audio is not None:
+            self._bytes -= len(audio)
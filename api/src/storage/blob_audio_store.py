@@ -0,0 +1,80 @@
+from typing import Optional
+
+from src.clients.audio_formats import MEDIA_TYPES
+from src.storage.audio_store import AudioStore
+
+try:
+    from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+    from azure.storage.blob import BlobServiceClient, ContentSettings
+except ImportError:
+    BlobServiceClient = None
+
+
+class BlobAudioStore(AudioStore):
+    """
+    Audio store in an Azure Blob Storage container, shared by every API instance.
+
+    Requires the optional `azure-storage-blob` package. The container is created on
+    the first write if it does not exist.
+
+    Attributes:
+        container (ContainerClient): The blob container client.
+    """
+
+    def __init__(self, connection_string: str, container: str):
+        """
+        Initialize the store.
+
+        Args:
+            connection_string (str): Azure Storage connection string.
+            container (str): The blob container name.
+
+        Raises:
+            ImportError: If azure-storage-blob is not installed.
+        """
+        if BlobServiceClient is None:
+            raise ImportError(
+                "The blob audio store requires the azure-storage-blob package: "
+                "poetry install --extras blob"
+            )
+
+        self.container = BlobServiceClient.from_connection_string(
+            connection_string
+        ).get_container_client(container)
+
+    def exists(self, filename: str) -> bool:
+        return self.container.get_blob_client(filename).exists()
+
+    def get(self, filename: str) -> Optional[bytes]:
+        try:
+            return self.container.download_blob(filename).readall()
+        except ResourceNotFoundError:
+            return None
+
+    def put(self, filename: str, audio: bytes) -> None:
+        try:
+            self._upload(filename, audio)
+        except ResourceNotFoundError:
+            try:
+                self.container.create_container()
+            except ResourceExistsError:
+                pass
+            self._upload(filename, audio)
+
+    def delete(self, filename: str) -> None:
+        try:
+            self.container.delete_blob(filename)
+        except ResourceNotFoundError:
+            pass
+
+    def _upload(self, filename: str, audio: bytes) -> None:
+        """Upload the audio, replacing any previous blob with the same name."""
+        content_type = MEDIA_TYPES.get(
+            filename.rsplit(".", 1)[-1], "application/octet-stream"
+        )
+        self.container.upload_blob(
+            filename,
+            audio,
+            overwrite=True,
+            content_settings=ContentSettings(content_type=content_type),
+        )
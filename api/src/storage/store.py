@@ -0,0 +1,95 @@
+from typing import Optional
+
+from src import api_settings
+from src.settings.storage import Storage
+from src.storage.audio_links import AudioLinks
+from src.storage.audio_retention import AudioRetention
+from src.storage.audio_store import AudioStore, LocalAudioStore, MemoryAudioStore
+from src.storage.blob_audio_store import BlobAudioStore
+
+
+def _get_audio_store(settings: Storage, audio_path: str) -> AudioStore:
+    """
+    Create the configured audio store.
+
+    Args:
+        settings (Storage): Audio store settings.
+        audio_path (str): The local audio directory.
+
+    Returns:
+        AudioStore: The audio store.
+
+    Raises:
+        ValueError: If the blob store is selected without a connection string.
+    """
+    max_bytes = int(settings.memory_max_mb * 1024 * 1024)
+
+    if settings.backend == "memory":
+        return MemoryAudioStore(max_bytes=max_bytes)
+
+    if settings.backend == "blob":
+        if not settings.blob_connection_string:
+            raise ValueError("AUDIO_STORE_BLOB_CONNECTION_STRING is required by the blob store")
+        store = BlobAudioStore(
+            connection_string=settings.blob_connection_string,
+            container=settings.blob_container,
+        )
+    else:
+        store = LocalAudioStore(path=audio_path)
+
+    if settings.hot_tier:
+        return MemoryAudioStore(max_bytes=max_bytes, backend=store)
+
+    return store
+
+
+def _get_audio_retention(settings: Storage, store: AudioStore) -> Optional[AudioRetention]:
+    """
+    Create the retention sweep of the local audio store.
+
+    Args:
+        settings (Storage): Audio store settings.
+        store (AudioStore): The audio store.
+
+    Returns:
+        Optional[AudioRetention]: The retention sweep, or None if the audio is not
+            stored locally or neither a maximum age nor a quota is set.
+    """
+    hot_tier = None
+    if isinstance(store, MemoryAudioStore):
+        hot_tier = store
+        store = store.backend
+
+    if not isinstance(store, LocalAudioStore):
+        return None
+
+    if not settings.retention_max_age and not settings.retention_max_mb:
+        return None
+
+    return AudioRetention(
+        store=store,
+        max_age=settings.retention_max_age,
+        max_bytes=int(settings.retention_max_mb * 1024 * 1024),
+        interval=settings.retention_interval,
+        hot_tier=hot_tier,
+    )
+
+
+def _get_audio_links(settings: Storage) -> AudioLinks:
+    """
+    Create the audio download links, signed if a signing key is set.
+
+    Args:
+        settings (Storage): Audio store settings.
+
+    Returns:
+        AudioLinks: The audio download links.
+    """
+    return AudioLinks(key=settings.url_signing_key, ttl=settings.url_ttl)
+
+
+audio_store = _get_audio_store(
+    api_settings.storage, api_settings.azure_ai_services.audio_path
+)
+audio_retention = _get_audio_retention(api_settings.storage, audio_store)
+audio_links = _get_audio_links(api_settings.storage)
@@ -1 +1,16 @@
-from .prompt import Prompt
+from .prompt_registry import CompiledPrompt, PromptRegistry
+from .prompt import Prompt, prompt_registry
+from .micro_batcher import MicroBatcher
+from .ttl_cache import TTLCache
+from .response_cache import ResponseCache
+from .sentence_splitter import SentenceSplitter
+from .health_monitor import HealthMonitor
+from .hedger import Hedger
+from .byte_range import RangeNotSatisfiableError, etag_matches, parse_byte_range
+from .multipart import encode_multipart
+from .resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DependencyGuard,
+    DependencyUnavailableError,
+)
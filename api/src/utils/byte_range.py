@@ -0,0 +1,74 @@
+import re
+from typing import Optional, Tuple
+
+BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiableError(Exception):
+    """
+    Raised when a byte range starts past the end of the content.
+    """
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range of a `Range` header.
+
+    Multiple ranges and malformed headers are not supported and yield None, in
+    which case the whole content is served, as HTTP allows.
+
+    Args:
+        header (str): The `Range` header value, such as `bytes=0-1023`, `bytes=1024-`
+            or `bytes=-1024` for the last 1024 bytes.
+        size (int): The content length.
+
+    Returns:
+        Optional[Tuple[int, int]]: The first and last byte positions, inclusive, or
+            None if the header is not a single byte range.
+
+    Raises:
+        RangeNotSatisfiableError: If the range does not overlap the content.
+    """
+    match = BYTE_RANGE.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+
+    if not first:
+        if not last:
+            return None
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+
+    if last and end < start:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+
+    return start, min(end, size - 1)
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Check an `If-None-Match` header against an entity tag, using weak comparison.
+
+    Args:
+        header (Optional[str]): The header value, a list of entity tags or `*`.
+        etag (str): The current entity tag, quoted.
+
+    Returns:
+        bool: Whether the client already holds the current representation.
+    """
+    if not header:
+        return False
+
+    tags = [tag.strip() for tag in header.split(",")]
+
+    return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
@@ -0,0 +1,130 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Probes dependencies in the background and keeps the latest result of each.
+
+    Every `interval` seconds all probes run in parallel; a probe that raises or
+    takes longer than `timeout` marks its dependency unhealthy. Reading the
+    results never waits on a dependency.
+
+    Attributes:
+        probes (Dict[str, Callable[[float], None]]): Probe for each dependency, given the timeout.
+        interval (float): Seconds between probe rounds.
+        timeout (float): Seconds before a probe is considered failed.
+    """
+
+    def __init__(
+        self,
+        probes: Dict[str, Callable[[float], None]],
+        interval: float,
+        timeout: float,
+    ):
+        self.probes = probes
+        self.interval = interval
+        self.timeout = timeout
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * len(probes), thread_name_prefix="health-probe"
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start probing in a background thread, if not already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="health-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop probing."""
+        self._stop.set()
+
+    def check(self) -> None:
+        """Run every probe once, in parallel, and record the results."""
+        started = {name: time.monotonic() for name in self.probes}
+        futures = {
+            name: self._executor.submit(probe, self.timeout)
+            for name, probe in self.probes.items()
+        }
+        deadline = time.monotonic() + self.timeout
+
+        for name, future in futures.items():
+            error = None
+            try:
+                future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                error = f"Timed out after {self.timeout} s"
+            except Exception as e:
+                error = str(e)
+
+            if error is not None:
+                logger.error(f"Health probe {name} failed: {error}")
+
+            checked_at = time.monotonic()
+            with self._lock:
+                self._results[name] = {
+                    "healthy": error is None,
+                    "checked_at": checked_at,
+                    "latency": checked_at - started[name],
+                    "error": error,
+                }
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the latest result of each probe.
+
+        A dependency never probed, or last probed more than three intervals ago,
+        is reported unhealthy.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each dependency, whether it is healthy,
+                the age of the result and the probe latency in seconds, and the error.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            results = dict(self._results)
+
+        status = {}
+        for name in self.probes:
+            result = results.get(name)
+            if result is None:
+                status[name] = {
+                    "healthy": False, "age": None, "latency": None, "error": "Not checked yet"
+                }
+                continue
+
+            age = now - result["checked_at"]
+            stale = age > 3 * self.interval
+            status[name] = {
+                "healthy": result["healthy"] and not stale,
+                "age": age,
+                "latency": result["latency"],
+                "error": "Result is stale" if stale and result["healthy"] else result["error"],
+            }
+
+        return status
+
+    def _run(self) -> None:
+        """Probe on every interval until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Health check round failed: {e}")
+            self._stop.wait(self.interval)
@@ -0,0 +1,161 @@
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Generic, TypeVar
+
+Result = TypeVar("Result")
+
+MIN_SAMPLES = 20
+MAX_BUDGET = 10.0
+
+
+class Hedger(Generic[Result]):
+    """
+    Sends a second, identical call when the first one is slower than usual.
+
+    The first call gets `percentile` of the recent latencies to finish; past that a
+    hedge call is started and whichever succeeds first wins, the other one being
+    cancelled. Until `MIN_SAMPLES` latencies are recorded, `initial_delay` is used.
+
+    Hedging is capped by a budget: every call earns `max_rate` hedges, up to
+    `MAX_BUDGET`, and every hedge spends one, so at most about `max_rate` of the
+    calls are sent twice.
+
+    Attributes:
+        percentile (float): Latency percentile, 0 to 100, after which a call is hedged.
+        max_rate (float): Maximum fraction of calls hedged.
+        initial_delay (float): Seconds before hedging while few latencies are recorded.
+        calls (int): Number of calls.
+        hedged (int): Number of calls hedged.
+        hedge_wins (int): Number of hedged calls won by the hedge.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        max_rate: float,
+        initial_delay: float,
+        window: int = 100,
+    ):
+        """
+        Initialize the hedger.
+
+        Args:
+            percentile (float): Latency percentile, 0 to 100, after which a call is hedged.
+            max_rate (float): Maximum fraction of calls hedged.
+            initial_delay (float): Seconds before hedging while few latencies are recorded.
+            window (int): Number of recent latencies the percentile is computed over.
+        """
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.initial_delay = initial_delay
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._budget = 0.0
+        self._lock = threading.Lock()
+
+    async def __call__(
+        self,
+        first: Callable[[], Awaitable[Result]],
+        hedge: Callable[[], Awaitable[Result]],
+    ) -> Result:
+        """
+        Run the first call, hedging it if it is too slow and the budget allows it.
+
+        Args:
+            first (Callable[[], Awaitable[Result]]): Starts the first call.
+            hedge (Callable[[], Awaitable[Result]]): Starts the hedge call.
+
+        Returns:
+            Result: The result of the first call to succeed.
+
+        Raises:
+            Exception: The first call error, if every call failed.
+        """
+        with self._lock:
+            self.calls += 1
+            self._budget = min(MAX_BUDGET, self._budget + self.max_rate)
+
+        tasks = []
+
+        def start(call: Callable[[], Awaitable[Result]]) -> asyncio.Task:
+            task = asyncio.ensure_future(call())
+            tasks.append(task)
+            return task
+
+        # Latencies are measured from the first call, whichever call wins, so
+        # hedge wins do not pull the delay down
+        started = time.monotonic()
+        try:
+            primary = start(first)
+            done, _ = await asyncio.wait([primary], timeout=self.delay())
+
+            if not done and self._spend():
+                start(hedge)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._record(task, time.monotonic() - started, primary)
+                        return task.result()
+
+            raise primary.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def delay(self) -> float:
+        """
+        Get the seconds a call is given before it is hedged.
+
+        Returns:
+            float: The latency percentile, or the initial delay with few latencies recorded.
+        """
+        with self._lock:
+            if len(self._latencies) < MIN_SAMPLES:
+                return self.initial_delay
+
+            latencies = sorted(self._latencies)
+
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return latencies[index]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hedging counters.
+
+        Returns:
+            Dict[str, Any]: Calls, hedged calls, hedges that won, and the current delay.
+        """
+        with self._lock:
+            stats = {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+
+        return {**stats, "delay": self.delay()}
+
+    def _spend(self) -> bool:
+        """Take one hedge from the budget, if available."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+
+            self._budget -= 1
+            self.hedged += 1
+            return True
+
+    def _record(self, task: asyncio.Task, latency: float, primary: asyncio.Task) -> None:
+        """Record the latency seen by the caller and whether the hedge won."""
+        with self._lock:
+            self._latencies.append(latency)
+            if task is not primary:
+                self.hedge_wins += 1
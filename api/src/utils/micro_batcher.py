@@ -0,0 +1,101 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Set, Tuple, TypeVar
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+class MicroBatcher(Generic[Item, Result]):
+    """
+    Coalesces concurrent single-item calls into batched calls.
+
+    The first item submitted opens a window; every item submitted while it is open
+    joins the same batch, which is sent when the window closes or as soon as it is full.
+    Each caller only gets back its own result, or its own exception.
+
+    Attributes:
+        window (float): Seconds to wait for more items before sending a batch.
+        max_batch_size (int): Maximum items per batch.
+        batches (int): Number of batches sent.
+        items (int): Number of items sent.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Item]], Awaitable[List[Result | Exception]]],
+        window: float,
+        max_batch_size: int,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch (Callable): Coroutine function returning one result, or
+                exception, per item and in the same order.
+            window (float): Seconds to wait for more items before sending a batch.
+            max_batch_size (int): Maximum items per batch.
+        """
+        self.process_batch = process_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.items = 0
+        self._pending: List[Tuple[Item, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Item) -> Result:
+        """
+        Add an item to the current batch and wait for its result.
+
+        Args:
+            item (Item): The item to process.
+
+        Returns:
+            Result: The result for this item.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending items as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending[:self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size:]
+
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[Item, asyncio.Future]]) -> None:
+        """Process a batch and hand each caller its own result."""
+        self.batches += 1
+        self.items += len(batch)
+
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
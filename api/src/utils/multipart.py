@@ -0,0 +1,27 @@
+import uuid
+from typing import Dict, List, Tuple
+
+
+def encode_multipart(parts: List[Tuple[Dict[str, str], bytes]]) -> Tuple[str, bytes]:
+    """
+    Encode a `multipart/mixed` body.
+
+    Args:
+        parts (List[Tuple[Dict[str, str], bytes]]): The headers and content of each part,
+            in order.
+
+    Returns:
+        Tuple[str, bytes]: The body content type, carrying its boundary, and the body.
+    """
+    boundary = uuid.uuid4().hex
+    body = bytearray()
+
+    for headers, content in parts:
+        body += f"--{boundary}\r\n".encode("latin-1")
+        for name, value in headers.items():
+            body += f"{name}: {value}\r\n".encode("latin-1")
+        body += b"\r\n" + content + b"\r\n"
+
+    body += f"--{boundary}--\r\n".encode("latin-1")
+
+    return f"multipart/mixed; boundary={boundary}", bytes(body)
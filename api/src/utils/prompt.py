@@ -1,11 +1,12 @@
-import yaml
+from typing import Optional
 
 from src import api_settings
+from src.utils.prompt_registry import PromptRegistry
 
 
 class Prompt:
-    def __init__(self):
-        self.prompts = self._load_prompts()
+    def __init__(self, registry: Optional[PromptRegistry] = None):
+        self.registry = registry or prompt_registry
 
     def __call__(self, sentiment: str, feedback_text: str) -> str:
         """
@@ -18,19 +19,7 @@ class Prompt:
         Returns:
             str: The formatted prompt for the LLM to generate a response to the feedback and sentiment.
         """
-        return self._get_formatted_prompt(sentiment, feedback_text)
-
-    def _load_prompts(self):
-        """Loads LLM prompts from a YAML file."""
-        with open(f"{api_settings.prompt}.yaml", "r") as file:
-            prompts = yaml.safe_load(file)
-        return prompts["llm_prompts"]
-
-    def _get_formatted_prompt(
-        self,
-        sentiment: str,
-        feedback_text: str,
-    ) -> str:
-        """Formats the prompt with the provided sentiment and feedback text."""
-        prompt_template = self.prompts.get(sentiment, self.prompts["NEUTRAL"])
-        return prompt_template.format(feedback_text=feedback_text)
+        return self.registry.get(sentiment).format(feedback_text=feedback_text)
+
+
+prompt_registry = PromptRegistry(path=f"{api_settings.prompt}.yaml")
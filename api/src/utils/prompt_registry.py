@@ -0,0 +1,139 @@
+import os
+import logging
+import threading
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+SENTIMENTS = ("POSITIVE", "NEGATIVE", "NEUTRAL")
+FIELDS = {"feedback_text"}
+
+
+class CompiledPrompt:
+    """
+    Prompt template parsed once into literal text and field pieces.
+
+    Attributes:
+        pieces (List[Tuple[str, Optional[str]]]): Literal text, and the field that follows it.
+    """
+
+    def __init__(self, template: str):
+        """
+        Parse and validate the template.
+
+        Args:
+            template (str): A `str.format` template using only the `feedback_text` field.
+
+        Raises:
+            ValueError: If the template is malformed or uses other fields.
+        """
+        self.pieces: List[Tuple[str, Optional[str]]] = []
+
+        for literal, field, format_spec, conversion in Formatter().parse(template):
+            if field is not None and (field not in FIELDS or format_spec or conversion):
+                raise ValueError(f"Unsupported prompt field: {{{field}}}")
+            self.pieces.append((literal, field))
+
+    def format(self, **fields: str) -> str:
+        """
+        Render the prompt.
+
+        Args:
+            **fields (str): The field values.
+
+        Returns:
+            str: The rendered prompt.
+        """
+        return "".join(
+            literal + fields[field] if field else literal for literal, field in self.pieces
+        )
+
+
+class PromptRegistry:
+    """
+    Thread-safe registry of compiled prompts, loaded once and reloaded when the
+    prompts file changes on disk.
+
+    A reload that fails validation keeps serving the previous prompts.
+
+    Attributes:
+        path (str): The prompts YAML file.
+        reloads (int): Number of times the prompts were loaded.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reloads = 0
+        self._prompts: Optional[Dict[str, CompiledPrompt]] = None
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self, sentiment: str) -> CompiledPrompt:
+        """
+        Get the prompt for a sentiment, falling back to the neutral prompt.
+
+        Args:
+            sentiment (str): Either "POSITIVE", "NEGATIVE", or "NEUTRAL"
+
+        Returns:
+            CompiledPrompt: The compiled prompt.
+        """
+        prompts = self._get_prompts()
+
+        return prompts.get(sentiment, prompts["NEUTRAL"])
+
+    def load(self) -> None:
+        """
+        Load the prompts if they were never loaded or the file changed.
+
+        Raises:
+            OSError: If the prompts were never loaded and the file cannot be read.
+            ValueError: If the prompts were never loaded and the file is invalid.
+        """
+        self._get_prompts()
+
+    def _get_prompts(self) -> Dict[str, CompiledPrompt]:
+        """Get the compiled prompts, reloading them if the file changed."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            if self._prompts is None:
+                raise
+            mtime = self._mtime
+
+        if self._prompts is not None and mtime == self._mtime:
+            return self._prompts
+
+        with self._lock:
+            if self._prompts is None or mtime != self._mtime:
+                self._reload(mtime)
+
+        return self._prompts
+
+    def _reload(self, mtime: int) -> None:
+        """Load, validate and compile the prompts file."""
+        try:
+            with open(self.path, "r") as file:
+                templates = yaml.safe_load(file)["llm_prompts"]
+
+            prompts = {
+                sentiment: CompiledPrompt(template)
+                for sentiment, template in templates.items()
+            }
+
+            missing = [sentiment for sentiment in SENTIMENTS if sentiment not in prompts]
+            if missing:
+                raise ValueError(f"Missing prompts: {', '.join(missing)}")
+        except Exception as e:
+            if self._prompts is None:
+                raise
+            logger.error(f"Prompt reload failed, keeping previous prompts: {e}")
+            self._mtime = mtime
+            return
+
+        self._prompts = prompts
+        self._mtime = mtime
+        self.reloads += 1
@@ -0,0 +1,280 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class DependencyUnavailableError(Exception):
+    """
+    Raised instead of calling a dependency whose circuit is open or whose
+    concurrency limit is reached.
+
+    Attributes:
+        dependency (str): The dependency name.
+        retry_after (float): Seconds after which a retry may succeed.
+    """
+
+    def __init__(self, dependency: str, reason: str, retry_after: float = 1.0):
+        super().__init__(f"{dependency} is unavailable: {reason}")
+        self.dependency = dependency
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Stops calling a dependency after consecutive failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast. Once `reset_timeout` has elapsed a single trial call is let
+    through (half-open); its success closes the circuit, its failure reopens it.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open before a trial call.
+        state (str): "closed", "open" or "half_open".
+        failures (int): Current consecutive failures.
+        rejected (int): Calls rejected while open.
+        opened (int): Number of times the circuit opened.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[float]:
+        """
+        Check whether a call may go through, reserving the trial call if half-open.
+
+        Returns:
+            Optional[float]: None if allowed, otherwise seconds until a trial call.
+        """
+        with self._lock:
+            if self.state == "closed":
+                return None
+
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if self.state == "open" and remaining <= 0:
+                self.state = "half_open"
+
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return None
+
+            self.rejected += 1
+            return max(remaining, 1.0)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit once the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.opened += 1
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give back a trial call that neither succeeded nor failed, such as a cancelled one."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the breaker state.
+
+        Returns:
+            Dict[str, Any]: State, consecutive failures, rejections and openings.
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "opened": self.opened,
+            }
+
+
+class AdaptiveLimiter:
+    """
+    Additive-increase, multiplicative-decrease (AIMD) concurrency limit.
+
+    Each successful call raises the limit by `1 / limit`, so about one per
+    `limit` calls; a failure, or a call slower than `latency_target`, halves it.
+    Calls over the limit are rejected instead of queued.
+
+    Attributes:
+        limit (float): Current concurrency limit.
+        min_limit (int): Lowest limit.
+        max_limit (int): Highest limit.
+        latency_target (float): Seconds above which a call counts as congested (0 disables).
+        in_flight (int): Calls in progress.
+        rejected (int): Calls rejected over the limit.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float = 0,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot if the limit allows it.
+
+        Returns:
+            bool: Whether the slot was taken.
+        """
+        with self._lock:
+            if self.in_flight >= int(self.limit):
+                self.rejected += 1
+                return False
+
+            self.in_flight += 1
+            return True
+
+    def release(self, success: Optional[bool], latency: Optional[float] = None) -> None:
+        """
+        Give back a slot and adapt the limit.
+
+        Args:
+            success (Optional[bool]): Whether the call succeeded, or None to leave
+                the limit unchanged.
+            latency (Optional[float]): The call latency in seconds, if meaningful.
+        """
+        with self._lock:
+            self.in_flight -= 1
+
+            if success is None:
+                return
+
+            congested = (
+                self.latency_target > 0
+                and latency is not None
+                and latency > self.latency_target
+            )
+
+            if success and not congested:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            else:
+                self.limit = max(self.min_limit, self.limit / 2)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the limiter state.
+
+        Returns:
+            Dict[str, Any]: Current limit, calls in flight and rejections.
+        """
+        with self._lock:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "rejected": self.rejected,
+            }
+
+
+class DependencyGuard:
+    """
+    Circuit breaker and adaptive concurrency limit around the calls to one dependency.
+
+    Attributes:
+        name (str): The dependency name, used in errors.
+        breaker (CircuitBreaker): The circuit breaker.
+        limiter (Optional[AdaptiveLimiter]): The concurrency limiter, or None for no limit.
+        enabled (bool): Whether calls are guarded at all.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        breaker: CircuitBreaker,
+        limiter: Optional[AdaptiveLimiter],
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.breaker = breaker
+        self.limiter = limiter
+        self.enabled = enabled
+
+    @contextmanager
+    def __call__(self, measure_latency: bool = True) -> Iterator[None]:
+        """
+        Guard a call to the dependency; any exception raised inside counts as a failure.
+
+        Args:
+            measure_latency (bool): Whether the call duration reflects the dependency
+                latency. Streams held open by the consumer should not be measured.
+
+        Raises:
+            DependencyUnavailableError: If the circuit is open or the limit is reached.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        retry_after = self.breaker.allow()
+        if retry_after is not None:
+            raise DependencyUnavailableError(self.name, "circuit open", retry_after)
+
+        if self.limiter is not None and not self.limiter.try_acquire():
+            self.breaker.release()
+            raise DependencyUnavailableError(self.name, "concurrency limit reached")
+
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self._release(success=False)
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self._release(success=None)
+            self.breaker.release()
+            raise
+
+        latency = time.monotonic() - start if measure_latency else None
+        self._release(success=True, latency=latency)
+        self.breaker.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the breaker and limiter state.
+
+        Returns:
+            Dict[str, Any]: Whether guarding is enabled, and the breaker and limiter state.
+        """
+        return {
+            "enabled": self.enabled,
+            "breaker": self.breaker.stats(),
+            "limiter": self.limiter.stats() if self.limiter else None,
+        }
+
+    def _release(self, success: Optional[bool], latency: Optional[float] = None) -> None:
+        """Give back the limiter slot, if calls are limited."""
+        if self.limiter is not None:
+            self.limiter.release(success, latency)
@@ -0,0 +1,163 @@
+import os
+import time
+import asyncio
+import sqlite3
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from src.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Two-tier string cache: an in-memory LRU tier in front of an optional SQLite tier
+    that survives process restarts and can be shared by several workers.
+
+    Attributes:
+        memory (TTLCache): The in-memory tier.
+        path (Optional[str]): The SQLite database path, or None for memory only.
+        disk_hits (int): Number of lookups answered by the SQLite tier.
+    """
+
+    # Expired rows are purged at most this often, not on every write.
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, max_entries: int, ttl: float, path: Optional[str] = None):
+        self.memory = TTLCache(max_entries=max_entries, ttl=ttl)
+        self.ttl = ttl
+        self.path = path
+        self.disk_hits = 0
+        self.next_purge = 0.0
+
+        if self.path:
+            self._create_table()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached value, promoting SQLite hits to the memory tier.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached value, or None if missing or expired.
+        """
+        value = self.memory.get(key)
+        if value is not None or not self.path:
+            return value
+
+        return self._get_disk(key)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """
+        Get a cached value without blocking the event loop on the SQLite tier.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached value, or None if missing or expired.
+        """
+        value = self.memory.get(key)
+        if value is not None or not self.path:
+            return value
+
+        return await asyncio.to_thread(self._get_disk, key)
+
+    def _get_disk(self, key: str) -> Optional[str]:
+        """Look a key up in the SQLite tier, promoting hits to the memory tier."""
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Response cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        self.disk_hits += 1
+        self.memory.set(key, row[0])
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key (str): The cache key.
+            value (str): The value to cache.
+        """
+        self.memory.set(key, value)
+
+        if self.path:
+            self._set_disk(key, value)
+
+    async def set_async(self, key: str, value: str) -> None:
+        """
+        Store a value in both tiers without blocking the event loop on the SQLite tier.
+
+        Args:
+            key (str): The cache key.
+            value (str): The value to cache.
+        """
+        self.memory.set(key, value)
+
+        if self.path:
+            await asyncio.to_thread(self._set_disk, key, value)
+
+    def _set_disk(self, key: str, value: str) -> None:
+        """Write a value to the SQLite tier, purging expired rows now and then."""
+        now = time.time()
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, now + self.ttl),
+                )
+                if now >= self.next_purge:
+                    self.next_purge = now + self.PURGE_INTERVAL
+                    connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        except sqlite3.Error as e:
+            logger.error(f"Response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, int]: Memory tier counters plus SQLite tier hits.
+        """
+        return {**self.memory.stats(), "disk_hits": self.disk_hits}
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the SQLite tier, committing and closing it on exit."""
+        connection = sqlite3.connect(self.path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_table(self) -> None:
+        """Create the SQLite tier table if it does not exist."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
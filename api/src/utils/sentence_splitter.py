@@ -0,0 +1,55 @@
+import re
+from typing import List, Optional
+
+SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+
+
+class SentenceSplitter:
+    """
+    Splits streamed text into complete sentences as soon as they end.
+
+    A sentence ends at `.`, `!` or `?` (optionally followed by closing quotes or
+    brackets) once whitespace follows, so decimals such as "3.5" are not split.
+    Sentences shorter than `min_length` are joined with the next one.
+
+    Attributes:
+        min_length (int): Minimum characters per emitted sentence.
+    """
+
+    def __init__(self, min_length: int = 1):
+        self.min_length = min_length
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text and take the sentences it completes.
+
+        Args:
+            text (str): The next chunk of text.
+
+        Returns:
+            List[str]: The completed sentences, in order.
+        """
+        self._buffer += text
+        sentences = []
+        start = 0
+
+        for match in SENTENCE_END.finditer(self._buffer):
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) >= self.min_length:
+                sentences.append(sentence)
+                start = match.end()
+
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """
+        Take the remaining text once the stream has ended.
+
+        Returns:
+            Optional[str]: The last sentence, or None if nothing is left.
+        """
+        sentence = self._buffer.strip()
+        self._buffer = ""
+        return sentence or None
@@ -1,8 +1,14 @@
+import asyncio
 import pytest
 from typing import Generator
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from src.actions.generate_feedback_response import GenerateFeedbackResponse
-from src.dtos import Feedback, SentimentResponse
+from src.clients.client_errors import (
+    AzureOpenAIClientError,
+    AzureSpeechSynthesisClientError,
+    AzureTextAnalyticsClientError,
+)
+from src.dtos import Feedback, SentimentResponse, FeedbackBatchResponse
 
 
 class TestGenerateFeedbackResponse:
@@ -20,6 +26,15 @@ class TestGenerateFeedbackResponse:
             mock.return_value = "positive"
             yield mock
 
+    @pytest.fixture
+    def mock_text_analytics_async(self) -> Generator[AsyncMock, None, None]:
+        with patch(
+            "src.actions.generate_feedback_response.azure_text_analytics_client.analyze_sentiment_async",
+            new_callable=AsyncMock,
+        ) as mock:
+            mock.return_value = "positive"
+            yield mock
+
     @pytest.fixture
     def mock_prompt(self) -> Generator[MagicMock, None, None]:
         """
@@ -36,12 +51,14 @@ class TestGenerateFeedbackResponse:
     def mock_openai_client(self) -> Generator[MagicMock, None, None]:
         with patch("src.actions.generate_feedback_response.azure_openai_client") as mock:
             mock.return_value = "Generated response"
+            mock.call_async = AsyncMock(return_value="Generated response")
             yield mock
 
     @pytest.fixture
     def mock_speech_synthesis_client(self) -> Generator[MagicMock, None, None]:
         with patch("src.actions.generate_feedback_response.azure_speech_synthesis_client") as mock:
             mock.return_value = "audio.mp3"
+            mock.call_async = AsyncMock(return_value="audio.mp3")
             yield mock
 
     @pytest.fixture
@@ -63,10 +80,189 @@ class TestGenerateFeedbackResponse:
         mock_prompt.assert_called_once()
         mock_prompt.return_value.assert_called_once_with("positive", feedback.feedback)
         mock_openai_client.assert_called_once_with("Generated prompt")
-        mock_speech_synthesis_client.assert_called_once_with("Generated response", "positive")
+        mock_speech_synthesis_client.assert_called_once_with("Generated response", "positive", None)
 
         assert isinstance(response, SentimentResponse)
         assert response.feedback == feedback.feedback
         assert response.response == "Generated response"
         assert response.sentiment == "positive"
         assert response.audio == "audio.mp3"
+
+    def test_generate_feedback_response_async(
+        self,
+        feedback: Feedback,
+        mock_text_analytics_async: AsyncMock,
+        mock_prompt: MagicMock,
+        mock_openai_client: MagicMock,
+        mock_speech_synthesis_client: MagicMock,
+        generate_feedback_response: GenerateFeedbackResponse,
+    ):
+        response = asyncio.run(generate_feedback_response.call_async(feedback))
+
+        mock_text_analytics_async.assert_awaited_once_with(feedback.feedback)
+        mock_prompt.return_value.assert_called_once_with("positive", feedback.feedback)
+        mock_openai_client.call_async.assert_awaited_once_with("Generated prompt")
+        mock_openai_client.assert_not_called()
+        mock_speech_synthesis_client.call_async.assert_awaited_once_with(
+            "Generated response", "positive", None
+        )
+        mock_speech_synthesis_client.assert_not_called()
+
+        assert isinstance(response, SentimentResponse)
+        assert response.response == "Generated response"
+        assert response.sentiment == "positive"
+        assert response.audio == "audio.mp3"
+
+    def test_generate_feedback_response_batch(
+        self,
+        mock_prompt: MagicMock,
+        mock_openai_client: MagicMock,
+        mock_speech_synthesis_client: MagicMock,
+        generate_feedback_response: GenerateFeedbackResponse,
+    ):
+        feedbacks = [
+            Feedback(feedback="one", audio_format="opus"),
+            Feedback(feedback="two"),
+            Feedback(feedback="three"),
+            Feedback(feedback="four", audio_format="mp3-low"),
+        ]
+        mock_openai_client.batch_async = AsyncMock(
+            return_value=["Response one", AzureOpenAIClientError("LLM failed"), "Response four"]
+        )
+        mock_speech_synthesis_client.call_async.side_effect = [
+            "one.mp3", AzureSpeechSynthesisClientError("TTS failed")
+        ]
+
+        with patch(
+            "src.actions.generate_feedback_response.azure_text_analytics_client.analyze_sentiment_batch_async",
+            new_callable=AsyncMock,
+            return_value=[
+                "POSITIVE", "NEGATIVE", AzureTextAnalyticsClientError("TA failed"), "NEUTRAL"
+            ],
+        ):
+            response = asyncio.run(generate_feedback_response.batch_async(feedbacks))
+
+        assert isinstance(response, FeedbackBatchResponse)
+        assert [result.feedback for result in response.results] == ["one", "two", "three", "four"]
+
+        first, second, third, fourth = response.results
+        assert (first.sentiment, first.response, first.audio, first.error) == (
+            "POSITIVE", "Response one", "one.mp3", None
+        )
+        assert (second.sentiment, second.response, second.error) == ("NEGATIVE", None, "LLM failed")
+        assert (third.sentiment, third.error) == (None, "TA failed")
+        assert (fourth.response, fourth.audio, fourth.error) == ("Response four", None, "TTS failed")
+
+        mock_openai_client.batch_async.assert_awaited_once_with(["Generated prompt"] * 3)
+        assert [call.args for call in mock_speech_synthesis_client.call_async.await_args_list] == [
+            ("Response one", "POSITIVE", "opus"),
+            ("Response four", "NEUTRAL", "mp3-low"),
+        ]
+
+    def test_generate_feedback_response_stream(
+        self,
+        feedback: Feedback,
+        mock_text_analytics_async: AsyncMock,
+        mock_prompt: MagicMock,
+        mock_openai_client: MagicMock,
+        mock_speech_synthesis_client: MagicMock,
+        generate_feedback_response: GenerateFeedbackResponse,
+    ):
+        async def stream_async(prompt: str):
+            for token in (" Thank", " you", "! "):
+                yield token
+
+        mock_openai_client.stream_async = MagicMock(side_effect=stream_async)
+
+        async def collect():
+            return [
+                event async for event in generate_feedback_response.stream_async(feedback)
+            ]
+
+        events = asyncio.run(collect())
+
+        assert events == [
+            ("sentiment", {"sentiment": "positive"}),
+            ("token", {"token": " Thank"}),
+            ("token", {"token": " you"}),
+            ("token", {"token": "! "}),
+            (
+                "audio",
+                {"response": "Thank you!", "audio": "audio.mp3", "audio_url": "/audio/audio.mp3"},
+            ),
+        ]
+        mock_openai_client.stream_async.assert_called_once_with("Generated prompt")
+        mock_speech_synthesis_client.call_async.assert_awaited_once_with(
+            "Thank you!", "positive", None
+        )
+
+    def test_generate_feedback_response_speech(
+        self,
+        feedback: Feedback,
+        mock_text_analytics_async: AsyncMock,
+        mock_prompt: MagicMock,
+        mock_openai_client: MagicMock,
+        mock_speech_synthesis_client: MagicMock,
+        generate_feedback_response: GenerateFeedbackResponse,
+    ):
+        synthesized = []
+
+        async def stream_async(prompt: str):
+            for token in ("Thank you", "! We are glad", " it helps.", " Bye"):
+                yield token
+                await asyncio.sleep(0)
+                # Completed sentences are sent to synthesis before the next token.
+                synthesized.append(len(mock_speech_synthesis_client.stream_async.call_args_list))
+
+        async def speech_stream_async(sentence: str, sentiment: str, audio_format: str):
+            await asyncio.sleep(0.01 if sentence.startswith("Thank") else 0)
+            yield sentence.encode()
+            yield b"|"
+
+        mock_openai_client.stream_async = MagicMock(side_effect=stream_async)
+        mock_speech_synthesis_client.stream_async = MagicMock(
+            side_effect=speech_stream_async
+        )
+
+        async def collect():
+            sentiment, audio = await generate_feedback_response.speech_async(feedback)
+            return sentiment, b"".join([chunk async for chunk in audio])
+
+        sentiment, audio = asyncio.run(collect())
+
+        assert sentiment == "positive"
+        assert audio == b"Thank you!|We are glad it helps.|Bye|"
+        assert synthesized == [0, 1, 1, 2]
+        mock_speech_synthesis_client.stream_async.assert_any_call("Thank you!", "positive", None)
+        mock_speech_synthesis_client.call_async.assert_not_called()
+
+    def test_generate_feedback_response_speech_error(
+        self,
+        feedback: Feedback,
+        mock_text_analytics_async: AsyncMock,
+        mock_prompt: MagicMock,
+        mock_openai_client: MagicMock,
+        mock_speech_synthesis_client: MagicMock,
+        generate_feedback_response: GenerateFeedbackResponse,
+    ):
+        async def stream_async(prompt: str):
+            yield "Thank you! "
+            raise AzureOpenAIClientError("LLM response generation failed: API Error")
+
+        async def speech_stream_async(sentence: str, sentiment: str, audio_format: str):
+            yield b"audio"
+
+        mock_openai_client.stream_async = MagicMock(side_effect=stream_async)
+        mock_speech_synthesis_client.stream_async = MagicMock(
+            side_effect=speech_stream_async
+        )
+
+        async def collect():
+            chunks = []
+            _, audio = await generate_feedback_response.speech_async(feedback)
+            with pytest.raises(AzureOpenAIClientError, match="API Error"):
+                async for chunk in audio:
+                    chunks.append(chunk)
+            return chunks
+
+        assert asyncio.run(collect()) == [b"audio"]
@@ -0,0 +1,27 @@
+import pytest
+
+from src.clients.audio_formats import AUDIO_FORMATS, MEDIA_TYPES, get_audio_format_for_accept
+
+
+class TestAudioFormats:
+    def test_media_types(self):
+        assert MEDIA_TYPES == {"mp3": "audio/mpeg", "ogg": "audio/ogg", "wav": "audio/wav"}
+
+    def test_only_pcm_is_not_streamable(self):
+        assert [name for name, fmt in AUDIO_FORMATS.items() if not fmt.streamable] == ["pcm"]
+
+    @pytest.mark.parametrize(
+        "accept, default, expected",
+        [
+            (None, "mp3-high", "mp3-high"),
+            ("*/*", "opus", "opus"),
+            ("audio/*", "mp3-low", "mp3-low"),
+            ("audio/mpeg", "mp3-low", "mp3-low"),
+            ("audio/mpeg", "opus", "mp3-high"),
+            ("audio/ogg;q=0.9, audio/mpeg", "mp3-high", "opus"),
+            ("text/html, audio/wav", "mp3-high", "pcm"),
+            ("audio/flac", "mp3-high", None),
+        ],
+    )
+    def test_get_audio_format_for_accept(self, accept, default, expected):
+        assert get_audio_format_for_accept(accept, default) == expected
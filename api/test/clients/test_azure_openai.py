@@ -1,12 +1,16 @@
+import asyncio
 import pytest
 import logging
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from langchain.schema import AIMessage
+from langchain_core.messages import AIMessageChunk
 
+from src import api_settings
 from src.clients import azure_openai_client
 from src.clients.client_errors import AzureOpenAIClientError
 from src.clients.azure_openai import AzureOpenAIClient
+from src.utils import DependencyUnavailableError
 
 
 class TestAzureOpenAIClient:
@@ -63,6 +67,279 @@ class TestAzureOpenAIClient:
 
         mock_logger.assert_called_once_with("LLM response generation failed: API Error")
 
+    def test_successful_async_response(
+        self,
+        azure_openai_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test successful response from AzureOpenAIClient.call_async."""
+        mock_azure_chat_openai.return_value.ainvoke = AsyncMock(
+            return_value=AIMessage(content=" Mock async response ")
+        )
+
+        response = asyncio.run(azure_openai_client.call_async("Hello"))
+
+        assert response == "Mock async response"
+        mock_azure_chat_openai.return_value.ainvoke.assert_awaited_once()
+        mock_azure_chat_openai.return_value.invoke.assert_not_called()
+        mock_logger.assert_not_called()
+
+    def test_async_exception_handling(
+        self,
+        azure_openai_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test exception handling when an API error occurs in call_async."""
+        mock_azure_chat_openai.return_value.ainvoke = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+
+        with pytest.raises(
+            AzureOpenAIClientError, match="LLM response generation failed: API Error"
+        ):
+            asyncio.run(azure_openai_client.call_async("Test prompt"))
+
+        mock_logger.assert_called_once_with("LLM response generation failed: API Error")
+
+    def test_batch_async(
+        self,
+        azure_openai_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that batch_async uses abatch and reports errors per prompt."""
+        mock_azure_chat_openai.return_value.abatch = AsyncMock(
+            return_value=[AIMessage(content=" First "), Exception("API Error")]
+        )
+
+        responses = asyncio.run(azure_openai_client.batch_async(["One", "Two"]))
+
+        assert responses[0] == "First"
+        assert isinstance(responses[1], AzureOpenAIClientError)
+        assert str(responses[1]) == "LLM response generation failed: API Error"
+        _, kwargs = mock_azure_chat_openai.return_value.abatch.call_args
+        assert kwargs["return_exceptions"] is True
+        assert kwargs["config"] == {"max_concurrency": 5}
+        mock_logger.assert_called_once_with("LLM response generation failed: API Error")
+
+    def _collect(self, client: AzureOpenAIClient, prompt: str):
+        async def collect():
+            return [token async for token in client.stream_async(prompt)]
+
+        return asyncio.run(collect())
+
+    def test_stream_async(
+        self,
+        azure_openai_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that stream_async yields the non-empty response chunks."""
+        async def astream(messages):
+            for content in ("Thank", "", " you", "!"):
+                yield AIMessageChunk(content=content)
+
+        mock_azure_chat_openai.return_value.astream = astream
+
+        assert self._collect(azure_openai_client, "Hello") == ["Thank", " you", "!"]
+        mock_logger.assert_not_called()
+
+    def test_stream_async_exception_handling(
+        self,
+        azure_openai_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test exception handling when the stream fails."""
+        async def astream(messages):
+            yield AIMessageChunk(content="Thank")
+            raise Exception("API Error")
+
+        mock_azure_chat_openai.return_value.astream = astream
+
+        with pytest.raises(
+            AzureOpenAIClientError, match="LLM response generation failed: API Error"
+        ):
+            self._collect(azure_openai_client, "Hello")
+
+        mock_logger.assert_called_once_with("LLM response generation failed: API Error")
+
+    @pytest.fixture
+    def cached_client(self, azure_openai_client: AzureOpenAIClient) -> AzureOpenAIClient:
+        """Fixture enabling the in-memory response cache."""
+        azure_openai_client.cache = azure_openai_client._get_cache(
+            api_settings.azure_openai.model_copy(update={"cache_enabled": True})
+        )
+        return azure_openai_client
+
+    def test_cached_response(
+        self,
+        cached_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+    ):
+        """Test that identical prompts are answered from the cache."""
+        mock_azure_chat_openai.return_value.ainvoke = AsyncMock()
+
+        assert cached_client("Hello") == "Mock response"
+        assert cached_client("Hello") == "Mock response"
+        assert asyncio.run(cached_client.call_async("Hello")) == "Mock response"
+
+        mock_azure_chat_openai.return_value.invoke.assert_called_once()
+        mock_azure_chat_openai.return_value.ainvoke.assert_not_called()
+
+    def test_cache_key_covers_prompt_and_settings(self, cached_client: AzureOpenAIClient):
+        """Test that changing the prompt or the system prompt changes the key."""
+        key = cached_client._get_cache_key("Hello")
+
+        assert cached_client._get_cache_key("Hello") == key
+        assert cached_client._get_cache_key("Hello!") != key
+
+        with patch("src.clients.azure_openai.api_settings") as mock_settings:
+            mock_settings.azure_openai = api_settings.azure_openai.model_copy(
+                update={"system_prompt": "Other"}
+            )
+            assert cached_client._get_cache_key("Hello") != key
+
+    def test_stream_async_uses_cache(
+        self,
+        cached_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+    ):
+        """Test that streamed responses are cached and replayed in one piece."""
+        async def astream(messages):
+            for content in (" Thank", " you! "):
+                yield AIMessageChunk(content=content)
+
+        mock_azure_chat_openai.return_value.astream = astream
+
+        self._collect(cached_client, "Hello")
+
+        assert self._collect(cached_client, "Hello") == ["Thank you!"]
+        assert cached_client("Hello") == "Thank you!"
+        mock_azure_chat_openai.return_value.invoke.assert_not_called()
+
+    def test_batch_async_only_sends_uncached_prompts(
+        self,
+        cached_client: AzureOpenAIClient,
+        mock_azure_chat_openai: MagicMock,
+    ):
+        """Test that the batch path reuses cached responses."""
+        cached_client("Cached")
+        mock_azure_chat_openai.return_value.abatch = AsyncMock(
+            return_value=[AIMessage(content="New response")]
+        )
+
+        responses = asyncio.run(cached_client.batch_async(["Cached", "New"]))
+
+        assert responses == ["Mock response", "New response"]
+        (messages,), _ = mock_azure_chat_openai.return_value.abatch.call_args
+        assert len(messages) == 1
+        assert messages[0][1].content == "New"
+
+    def test_ping(
+        self, azure_openai_client: AzureOpenAIClient, mock_logger: MagicMock
+    ):
+        """Test the health probe lists the models with the given timeout."""
+        azure_openai_client.ping(timeout=5)
+
+        models = azure_openai_client.client.root_client.models
+        models.list.assert_called_once_with(timeout=5)
+        mock_logger.assert_not_called()
+
+    def test_ping_failure(
+        self, azure_openai_client: AzureOpenAIClient, mock_logger: MagicMock
+    ):
+        """Test the health probe failure is raised as a client error."""
+        azure_openai_client.client.root_client.models.list.side_effect = Exception("401")
+
+        with pytest.raises(AzureOpenAIClientError, match="Azure OpenAI health check failed: 401"):
+            azure_openai_client.ping(timeout=5)
+
+        mock_logger.assert_called_once_with("Azure OpenAI health check failed: 401")
+
+    def test_open_circuit_fails_fast(
+        self, azure_openai_client: AzureOpenAIClient, mock_logger: MagicMock
+    ):
+        """Test that repeated failures stop calling the API until the circuit resets."""
+        azure_openai_client.client.invoke.side_effect = Exception("Timeout")
+        threshold = api_settings.resilience.failure_threshold
+
+        for _ in range(threshold):
+            with pytest.raises(AzureOpenAIClientError):
+                azure_openai_client("Hello")
+
+        with pytest.raises(DependencyUnavailableError, match="Azure OpenAI is unavailable"):
+            azure_openai_client("Hello")
+        with pytest.raises(DependencyUnavailableError):
+            asyncio.run(azure_openai_client.call_async("Hello"))
+
+        assert azure_openai_client.client.invoke.call_count == threshold
+        azure_openai_client.client.ainvoke.assert_not_called()
+        assert azure_openai_client.guard.stats()["breaker"]["rejected"] == 2
+
+    def test_batch_async_failures_open_circuit_per_prompt(
+        self, azure_openai_client: AzureOpenAIClient, mock_logger: MagicMock
+    ):
+        """Test that failed batches count on the breaker and an open circuit fails each prompt."""
+        azure_openai_client.client.abatch = AsyncMock(
+            side_effect=lambda inputs, **kwargs: [Exception("Timeout") for _ in inputs]
+        )
+        threshold = api_settings.resilience.failure_threshold
+
+        for _ in range(threshold):
+            responses = asyncio.run(azure_openai_client.batch_async(["One", "Two"]))
+            assert all(isinstance(response, AzureOpenAIClientError) for response in responses)
+
+        responses = asyncio.run(azure_openai_client.batch_async(["One", "Two"]))
+
+        assert [str(response) for response in responses] == [
+            "LLM response generation failed: Azure OpenAI is unavailable: circuit open"
+        ] * 2
+        assert azure_openai_client.client.abatch.call_count == threshold
+        assert azure_openai_client.guard.stats()["breaker"]["state"] == "open"
+
+    def test_hedged_call_to_secondary_deployment(
+        self, mock_azure_chat_openai: MagicMock, mock_logger: MagicMock
+    ):
+        """Test that a slow call is hedged on the secondary deployment and the fastest wins."""
+        primary, secondary = MagicMock(), MagicMock()
+        mock_azure_chat_openai.side_effect = [primary, secondary]
+
+        async def slow(messages):
+            await asyncio.sleep(1)
+            return AIMessage(content="Slow response")
+
+        primary.ainvoke = slow
+        secondary.ainvoke = AsyncMock(return_value=AIMessage(content="Hedged response"))
+
+        with patch("src.clients.azure_openai.api_settings") as mock_settings:
+            mock_settings.azure_openai = api_settings.azure_openai.model_copy(
+                update={
+                    "hedge_enabled": True,
+                    "hedge_initial_delay": 0.01,
+                    "hedge_max_rate": 1,
+                    "hedge_deployment": "secondary",
+                }
+            )
+            mock_settings.resilience = api_settings.resilience
+            client = AzureOpenAIClient()
+
+            response = asyncio.run(client.call_async("Hello"))
+
+        assert response == "Hedged response"
+        assert client.hedge_client is secondary
+        _, kwargs = mock_azure_chat_openai.call_args
+        assert kwargs["azure_deployment"] == "secondary"
+        assert client.hedger.stats()["hedge_wins"] == 1
+        mock_logger.assert_not_called()
+
+    def test_hedging_disabled_by_default(self, azure_openai_client: AzureOpenAIClient):
+        """Test that without hedging the primary client handles every call."""
+        assert azure_openai_client.hedger is None
+        assert azure_openai_client.hedge_client is azure_openai_client.client
+
     def test_singleton_instance(self):
         """Test that the module-initialized AzureOpenAIClient is a singleton."""
 
@@ -1,14 +1,18 @@
-import os
+import asyncio
+import threading
 import logging
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from azure.cognitiveservices.speech import SpeechSynthesisResult, ResultReason
 
+from src import api_settings
 from src.clients import azure_speech_synthesis_client
 from src.clients.azure_speech_synthesis import AzureSpeechSynthesisClient
 from src.clients.client_errors import AzureSpeechSynthesisClientError
+from src.storage import LocalAudioStore
+from src.utils import DependencyUnavailableError
 
 
 class TestAzureSpeechSynthesisClient:
@@ -36,12 +40,31 @@ class TestAzureSpeechSynthesisClient:
         ) as mock_join:
             yield mock_join
 
+    @pytest.fixture
+    def mock_settings(self, tmp_path) -> Generator[MagicMock, None, None]:
+        """Fixture to write the audio files to a temporary directory."""
+        with patch("src.clients.azure_speech_synthesis.api_settings") as mock:
+            mock.azure_ai_services = api_settings.azure_ai_services.model_copy(
+                update={"audio_path": str(tmp_path)}
+            )
+            mock.resilience = api_settings.resilience
+            yield mock
+
     @pytest.fixture
     def speech_synthesis_client(
-        self, mock_speech_synthesizer: MagicMock
+        self, mock_speech_synthesizer: MagicMock, mock_settings: MagicMock
     ) -> AzureSpeechSynthesisClient:
         """Fixture to create an instance of AzureSpeechSynthesisClient with a mock."""
-        return AzureSpeechSynthesisClient()
+        return AzureSpeechSynthesisClient(
+            store=LocalAudioStore(mock_settings.azure_ai_services.audio_path)
+        )
+
+    @pytest.fixture
+    def content_addressed(self, mock_settings: MagicMock) -> None:
+        """Fixture to enable content-addressed audio files."""
+        mock_settings.azure_ai_services = mock_settings.azure_ai_services.model_copy(
+            update={"audio_content_addressed": True}
+        )
 
     def test_successful_speech_synthesis(
         self,
@@ -53,6 +76,7 @@ class TestAzureSpeechSynthesisClient:
         """Test successful speech synthesis."""
         mock_result = MagicMock(spec=SpeechSynthesisResult)
         mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
         mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
 
         filename = speech_synthesis_client("Hello")
@@ -60,6 +84,11 @@ class TestAzureSpeechSynthesisClient:
         assert filename.endswith(".mp3")
         mock_logger.assert_not_called()
         mock_os_path_join.assert_called_once()
+        mock_speech_synthesizer.assert_called_once_with(
+            speech_config=speech_synthesis_client.config, audio_config=None
+        )
+        with open("/".join(mock_os_path_join.call_args[0]), "rb") as audio:
+            assert audio.read() == b"audio"
 
     def test_speech_synthesis_api_failure(
         self,
@@ -97,6 +126,645 @@ class TestAzureSpeechSynthesisClient:
 
         mock_logger.assert_called_once_with("Speech synthesis failed")
 
+    def _complete_async_synthesis(
+        self, mock_speech_synthesizer: MagicMock, result: MagicMock
+    ) -> None:
+        """Make speak_ssml_async fire the completion event and resolve to result."""
+        synthesizer = mock_speech_synthesizer.return_value
+
+        def speak_ssml_async(ssml: str) -> MagicMock:
+            on_done = synthesizer.synthesis_completed.connect.call_args[0][0]
+            on_done(MagicMock())
+            result_future = MagicMock()
+            result_future.get.return_value = result
+            return result_future
+
+        synthesizer.speak_ssml_async.side_effect = speak_ssml_async
+
+    def test_successful_async_speech_synthesis(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_logger: MagicMock,
+        mock_os_path_join: MagicMock,
+    ):
+        """Test successful speech synthesis through call_async."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        self._complete_async_synthesis(mock_speech_synthesizer, mock_result)
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello", "POSITIVE"))
+
+        assert filename.endswith(".mp3")
+        synthesizer = mock_speech_synthesizer.return_value
+        synthesizer.speak_ssml_async.assert_called_once()
+        synthesizer.speak_ssml.assert_not_called()
+        synthesizer.synthesis_canceled.connect.assert_called_once()
+        assert "style='excited'" in synthesizer.speak_ssml_async.call_args[0][0]
+        mock_logger.assert_not_called()
+
+    def test_async_speech_synthesis_unsuccessful(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test handling when asynchronous speech synthesis is canceled."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.Canceled
+        self._complete_async_synthesis(mock_speech_synthesizer, mock_result)
+
+        with pytest.raises(
+            AzureSpeechSynthesisClientError, match="Speech synthesis failed"
+        ):
+            asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        mock_logger.assert_called_once_with("Speech synthesis failed")
+
+    def test_async_speech_synthesis_api_failure(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test handling when the asynchronous API call fails."""
+        mock_speech_synthesizer.return_value.speak_ssml_async.side_effect = Exception(
+            "API Error"
+        )
+
+        with pytest.raises(
+            AzureSpeechSynthesisClientError, match="Speech synthesis failed: API Error"
+        ):
+            asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        mock_logger.assert_called_once_with("Speech synthesis failed: API Error")
+
+    def test_content_addressed_audio_is_reused(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that identical requests reuse the existing file."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+        self._complete_async_synthesis(mock_speech_synthesizer, mock_result)
+
+        first = speech_synthesis_client("Hello", "POSITIVE")
+        second = speech_synthesis_client("Hello", "POSITIVE")
+        third = asyncio.run(speech_synthesis_client.call_async("Hello", "POSITIVE"))
+        other_style = speech_synthesis_client("Hello", "NEGATIVE")
+
+        assert first == second == third
+        assert len(first) == len("0" * 64 + ".mp3")
+        assert other_style != first
+        assert mock_speech_synthesizer.return_value.speak_ssml.call_count == 2
+        mock_speech_synthesizer.return_value.speak_ssml_async.assert_not_called()
+
+    def test_audio_formats_have_their_own_files(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that each audio format is synthesized, cached and named separately."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+
+        filenames = {
+            audio_format: speech_synthesis_client("Hello", "POSITIVE", audio_format)
+            for audio_format in ("mp3-high", "mp3-low", "opus", "pcm")
+        }
+
+        assert filenames["mp3-high"] == speech_synthesis_client("Hello", "POSITIVE")
+        assert filenames["mp3-high"].endswith(".mp3")
+        assert filenames["mp3-low"].endswith(".mp3")
+        assert filenames["opus"].endswith(".ogg")
+        assert filenames["pcm"].endswith(".wav")
+        assert len(set(filenames.values())) == 4
+        assert mock_speech_synthesizer.return_value.speak_ssml.call_count == 4
+        assert mock_speech_synthesizer.call_args_list[2] == call(
+            speech_config=speech_synthesis_client.configs["opus"], audio_config=None
+        )
+
+    def test_unique_audio_filename_extension(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+    ):
+        """Test that uuid file names carry the extension of the audio format."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+
+        filename = speech_synthesis_client("Hello", audio_format="opus")
+
+        assert filename.endswith(".ogg")
+        assert speech_synthesis_client.store.get(filename) == b"audio"
+
+    def test_content_addressed_concurrent_requests_synthesize_once(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that concurrent identical requests share a single synthesis."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        synthesizer = mock_speech_synthesizer.return_value
+
+        def speak_ssml_async(ssml: str) -> MagicMock:
+            on_done = synthesizer.synthesis_completed.connect.call_args[0][0]
+            asyncio.get_running_loop().call_later(0.01, on_done, MagicMock())
+            result_future = MagicMock()
+            result_future.get.return_value = mock_result
+            return result_future
+
+        synthesizer.speak_ssml_async.side_effect = speak_ssml_async
+
+        async def run():
+            return await asyncio.gather(
+                *(speech_synthesis_client.call_async("Hello") for _ in range(5))
+            )
+
+        filenames = asyncio.run(run())
+
+        assert len(set(filenames)) == 1
+        synthesizer.speak_ssml_async.assert_called_once()
+        assert speech_synthesis_client._in_flight == {}
+
+    def test_content_addressed_failure_is_shared_and_retried(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that a failed synthesis is not cached."""
+        mock_speech_synthesizer.return_value.speak_ssml.side_effect = Exception("API Error")
+
+        with pytest.raises(AzureSpeechSynthesisClientError):
+            speech_synthesis_client("Hello")
+
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        mock_speech_synthesizer.return_value.speak_ssml.side_effect = None
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+
+        assert speech_synthesis_client("Hello").endswith(".mp3")
+
+    def test_content_addressed_cancelled_owner_fails_waiters(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that waiters are released when the synthesis owner is cancelled."""
+        synthesizer = mock_speech_synthesizer.return_value
+        synthesizer.speak_ssml_async.return_value = MagicMock()
+
+        async def run():
+            owner = asyncio.create_task(speech_synthesis_client.call_async("Hello"))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(speech_synthesis_client.call_async("Hello"))
+            await asyncio.sleep(0.01)
+
+            owner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await owner
+            with pytest.raises(AzureSpeechSynthesisClientError):
+                await asyncio.wait_for(waiter, timeout=1)
+
+        asyncio.run(run())
+
+        synthesizer.speak_ssml_async.assert_called_once()
+        assert speech_synthesis_client._in_flight == {}
+
+    def test_content_addressed_cancelled_waiter_does_not_fail_the_flight(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+    ):
+        """Test that a waiter cancelled by its client leaves the shared synthesis intact."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        synthesizer = mock_speech_synthesizer.return_value
+
+        def speak_ssml_async(ssml: str) -> MagicMock:
+            on_done = synthesizer.synthesis_completed.connect.call_args[0][0]
+            asyncio.get_running_loop().call_later(0.05, on_done, MagicMock())
+            result_future = MagicMock()
+            result_future.get.return_value = mock_result
+            return result_future
+
+        synthesizer.speak_ssml_async.side_effect = speak_ssml_async
+
+        async def run():
+            owner = asyncio.create_task(speech_synthesis_client.call_async("Hello"))
+            await asyncio.sleep(0.01)
+            waiters = [
+                asyncio.create_task(speech_synthesis_client.call_async("Hello"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+
+            waiters[0].cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiters[0]
+
+            return await asyncio.gather(owner, waiters[1])
+
+        filenames = asyncio.run(run())
+
+        assert filenames[0] == filenames[1]
+        synthesizer.speak_ssml_async.assert_called_once()
+        assert speech_synthesis_client._in_flight == {}
+
+    @pytest.fixture
+    def audio_streaming(self, mock_settings: MagicMock) -> None:
+        """Fixture to defer synthesis to the audio download."""
+        mock_settings.azure_ai_services = mock_settings.azure_ai_services.model_copy(
+            update={"audio_streaming": True}
+        )
+
+    @pytest.fixture
+    def mock_push_stream(self) -> Generator[MagicMock, None, None]:
+        """Fixture to capture the push audio stream callback."""
+        with patch(
+            "src.clients.azure_speech_synthesis.PushAudioOutputStream"
+        ) as mock_stream, patch("src.clients.azure_speech_synthesis.AudioOutputConfig"):
+            yield mock_stream
+
+    def _stream_async_synthesis(
+        self,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        result: MagicMock,
+        chunks: list,
+    ) -> None:
+        """Make speak_ssml_async write the chunks to the push stream, then complete."""
+        synthesizer = mock_speech_synthesizer.return_value
+
+        def speak_ssml_async(ssml: str) -> MagicMock:
+            writer = mock_push_stream.call_args[0][0]
+            for chunk in chunks:
+                writer.write(memoryview(chunk))
+            on_done = synthesizer.synthesis_completed.connect.call_args[0][0]
+            on_done(MagicMock())
+            result_future = MagicMock()
+            result_future.get.return_value = result
+            return result_future
+
+        synthesizer.speak_ssml_async.side_effect = speak_ssml_async
+
+    async def _collect(self, stream) -> bytes:
+        return b"".join([chunk async for chunk in stream])
+
+    def test_stream_async_yields_chunks(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that the synthesized audio is yielded as it is pushed."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"au", b"dio"]
+        )
+
+        audio = asyncio.run(
+            self._collect(speech_synthesis_client.stream_async("Hello", "NEGATIVE"))
+        )
+
+        assert audio == b"audio"
+        ssml = mock_speech_synthesizer.return_value.speak_ssml_async.call_args[0][0]
+        assert "style='empathetic'" in ssml
+        mock_logger.assert_not_called()
+
+    def test_stream_async_creates_the_synthesizer_off_the_event_loop(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+    ):
+        """Test that building the synthesizer does not block the event loop."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"audio"]
+        )
+        threads = []
+        mock_speech_synthesizer.side_effect = lambda **kwargs: (
+            threads.append(threading.current_thread())
+            or mock_speech_synthesizer.return_value
+        )
+
+        asyncio.run(self._collect(speech_synthesis_client.stream_async("Hello")))
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_stream_async_unsuccessful(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that a canceled streamed synthesis raises once the stream ends."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.Canceled
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, []
+        )
+
+        with pytest.raises(
+            AzureSpeechSynthesisClientError, match="Speech synthesis failed"
+        ):
+            asyncio.run(self._collect(speech_synthesis_client.stream_async("Hello")))
+
+        mock_logger.assert_called_once_with("Speech synthesis failed")
+
+    def test_audio_streaming_defers_synthesis(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        mock_settings: MagicMock,
+        audio_streaming: None,
+    ):
+        """Test that the synthesis runs on download and the audio is saved."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"audio"]
+        )
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        mock_speech_synthesizer.assert_not_called()
+        assert speech_synthesis_client.open_stream("unknown.mp3") is None
+
+        audio = asyncio.run(
+            self._collect(speech_synthesis_client.open_stream(filename))
+        )
+
+        assert audio == b"audio"
+        assert speech_synthesis_client.open_stream(filename) is None
+        assert speech_synthesis_client.store.get(filename) == b"audio"
+
+    def test_audio_streaming_dropped_download_completes_synthesis(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        audio_streaming: None,
+    ):
+        """Test that a download closed mid-stream does not abort the synthesis."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"au", b"dio"]
+        )
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        async def disconnect():
+            stream = speech_synthesis_client.open_stream(filename)
+            assert await anext(stream) == b"au"
+            synthesis = speech_synthesis_client._streams[filename].task
+            await stream.aclose()
+            await synthesis
+
+        asyncio.run(disconnect())
+
+        assert speech_synthesis_client.store.get(filename) == b"audio"
+        assert speech_synthesis_client.open_stream(filename) is None
+        assert speech_synthesis_client._streams == {}
+
+    def test_audio_streaming_concurrent_downloads_share_a_synthesis(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        audio_streaming: None,
+    ):
+        """Test that concurrent downloads of a pending file are served by one synthesis."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"au", b"dio"]
+        )
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        async def run():
+            first = speech_synthesis_client.open_stream(filename)
+            assert await anext(first) == b"au"
+            second = speech_synthesis_client.open_stream(filename)
+            return await asyncio.gather(
+                self._collect(first), self._collect(second)
+            )
+
+        assert asyncio.run(run()) == [b"dio", b"audio"]
+        mock_speech_synthesizer.return_value.speak_ssml_async.assert_called_once()
+        assert speech_synthesis_client.store.get(filename) == b"audio"
+        assert speech_synthesis_client.open_stream(filename) is None
+
+    def test_audio_streaming_failed_save_stays_pending(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        audio_streaming: None,
+    ):
+        """Test that the synthesis stays pending when its audio cannot be saved."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"audio"]
+        )
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        with patch.object(
+            speech_synthesis_client.store, "put", side_effect=OSError("disk full")
+        ), pytest.raises(OSError):
+            asyncio.run(self._collect(speech_synthesis_client.open_stream(filename)))
+
+        assert speech_synthesis_client.open_stream(filename) is not None
+
+    def test_read_async(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_push_stream: MagicMock,
+        audio_streaming: None,
+    ):
+        """Test that stored audio is read and deferred audio is synthesized first."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        self._stream_async_synthesis(
+            mock_speech_synthesizer, mock_push_stream, mock_result, [b"au", b"dio"]
+        )
+        speech_synthesis_client._save_audio("stored.mp3", b"stored")
+
+        filename = asyncio.run(speech_synthesis_client.call_async("Hello"))
+
+        assert asyncio.run(speech_synthesis_client.read_async("stored.mp3")) == b"stored"
+        assert asyncio.run(speech_synthesis_client.read_async(filename)) == b"audio"
+        assert asyncio.run(speech_synthesis_client.read_async(filename)) == b"audio"
+        with pytest.raises(AzureSpeechSynthesisClientError, match="unknown.mp3"):
+            asyncio.run(speech_synthesis_client.read_async("unknown.mp3"))
+
+    def test_audio_streaming_skips_existing_content_addressed_file(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        content_addressed: None,
+        audio_streaming: None,
+    ):
+        """Test that audio already in the audio store is not deferred again."""
+        filename = speech_synthesis_client("Hello")
+        assert speech_synthesis_client.open_stream(filename) is not None
+
+        speech_synthesis_client._save_audio(filename, b"audio")
+
+        assert speech_synthesis_client("Hello") == filename
+        assert speech_synthesis_client.open_stream(filename) is None
+        mock_speech_synthesizer.assert_not_called()
+
+    def test_pooled_synthesizers_are_reused_and_recycled(
+        self,
+        mock_speech_synthesizer: MagicMock,
+        mock_settings: MagicMock,
+    ):
+        """Test that pooled synthesizers are reused and replaced after an error."""
+        mock_settings.azure_ai_services = mock_settings.azure_ai_services.model_copy(
+            update={"speech_pool_size": 1}
+        )
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.SynthesizingAudioCompleted
+        mock_result.audio_data = b"audio"
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+        self._complete_async_synthesis(mock_speech_synthesizer, mock_result)
+
+        with patch("src.clients.speech_synthesizer_pool.Connection"):
+            client = AzureSpeechSynthesisClient(
+                store=LocalAudioStore(mock_settings.azure_ai_services.audio_path)
+            )
+            client("Hello")
+            asyncio.run(client.call_async("Hello"))
+
+            assert mock_speech_synthesizer.call_count == 1
+
+            mock_speech_synthesizer.return_value.speak_ssml.side_effect = Exception("API Error")
+            with pytest.raises(AzureSpeechSynthesisClientError):
+                client("Hello")
+
+            mock_speech_synthesizer.return_value.speak_ssml.side_effect = None
+            client("Hello")
+
+        assert mock_speech_synthesizer.call_count == 2
+        assert client.pool.stats()["recycled"] == 1
+        assert client.pool.stats()["in_use"] == 0
+        mock_speech_synthesizer.return_value.synthesis_completed.disconnect_all.assert_called()
+
+    def test_cancelled_synthesis_releases_pooled_synthesizer(
+        self,
+        mock_speech_synthesizer: MagicMock,
+        mock_settings: MagicMock,
+    ):
+        """Test that a cancelled synthesis gives its synthesizer back to the pool."""
+        mock_settings.azure_ai_services = mock_settings.azure_ai_services.model_copy(
+            update={"speech_pool_size": 1}
+        )
+        mock_speech_synthesizer.return_value.speak_ssml_async.return_value = MagicMock()
+
+        with patch("src.clients.speech_synthesizer_pool.Connection"):
+            client = AzureSpeechSynthesisClient(
+                store=LocalAudioStore(mock_settings.azure_ai_services.audio_path)
+            )
+
+            async def run():
+                synthesis = asyncio.create_task(client.call_async("Hello"))
+                await asyncio.sleep(0.01)
+                synthesis.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await synthesis
+
+                return await asyncio.wait_for(client.pool.acquire_async(), timeout=1)
+
+            asyncio.run(run())
+
+        assert client.pool.stats()["recycled"] == 1
+        assert client.pool.stats()["in_use"] == 1
+
+    def test_ping(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_logger: MagicMock,
+    ):
+        """Test the health probe opens and closes a connection."""
+        with patch("src.clients.azure_speech_synthesis.Connection") as mock_connection:
+            connection = mock_connection.from_speech_synthesizer.return_value
+            connection.open.side_effect = (
+                lambda _: connection.connected.connect.call_args[0][0](MagicMock())
+            )
+
+            speech_synthesis_client.ping(timeout=1)
+
+        connection.open.assert_called_once_with(True)
+        connection.close.assert_called_once()
+        mock_logger.assert_not_called()
+
+    def test_ping_timeout(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_logger: MagicMock,
+    ):
+        """Test the health probe fails when the connection never opens."""
+        with patch("src.clients.azure_speech_synthesis.Connection") as mock_connection:
+            with pytest.raises(
+                AzureSpeechSynthesisClientError,
+                match="Speech health check failed: no connection after 0.01 s",
+            ):
+                speech_synthesis_client.ping(timeout=0.01)
+
+        mock_connection.from_speech_synthesizer.return_value.close.assert_called_once()
+        mock_logger.assert_called_once()
+
+    def test_open_circuit_fails_fast(
+        self,
+        speech_synthesis_client: AzureSpeechSynthesisClient,
+        mock_speech_synthesizer: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that canceled syntheses open the circuit and later calls fail fast."""
+        mock_result = MagicMock(spec=SpeechSynthesisResult)
+        mock_result.reason = ResultReason.Canceled
+        mock_speech_synthesizer.return_value.speak_ssml.return_value = mock_result
+        threshold = api_settings.resilience.failure_threshold
+
+        for _ in range(threshold):
+            with pytest.raises(AzureSpeechSynthesisClientError):
+                speech_synthesis_client("Hello")
+
+        with pytest.raises(DependencyUnavailableError, match="Azure Speech is unavailable"):
+            speech_synthesis_client("Hello")
+
+        assert mock_speech_synthesizer.return_value.speak_ssml.call_count == threshold
+
     def test_singleton_instance(self):
         """Test that the module-initialized AzureSpeechSynthesisClient is a singleton."""
 
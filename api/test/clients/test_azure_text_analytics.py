@@ -1,14 +1,20 @@
+import asyncio
 import logging
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from azure.ai.textanalytics import AnalyzeSentimentResult, DocumentError
 from azure.core.exceptions import HttpResponseError, ClientAuthenticationError
 
+from src import api_settings
 from src.clients import azure_text_analytics_client
 from src.clients.client_errors import AzureTextAnalyticsClientError
-from src.clients.azure_text_analytics import AzureTextAnalyticsClient
+from src.utils import DependencyUnavailableError
+from src.clients.azure_text_analytics import (
+    AzureTextAnalyticsClient,
+    MAX_DOCUMENTS_PER_REQUEST,
+)
 
 
 class TestAzureTextAnalyticsClient:
@@ -20,6 +26,15 @@ class TestAzureTextAnalyticsClient:
         ) as mock_client:
             yield mock_client
 
+    @pytest.fixture
+    def mock_async_text_analytics_client(self):
+        """Fixture to mock the Azure Text Analytics asyncio client."""
+        with patch(
+            "src.clients.azure_text_analytics.AzureTextAnalyticsClient._get_async_text_analytics_client"
+        ) as mock_client:
+            mock_client.return_value.analyze_sentiment = AsyncMock()
+            yield mock_client
+
     @pytest.fixture
     def mock_logger(self) -> Generator[MagicMock, None, None]:
         """Fixture to mock the logger."""
@@ -30,7 +45,9 @@ class TestAzureTextAnalyticsClient:
 
     @pytest.fixture
     def text_analytics_client(
-        self, mock_text_analytics_client: MagicMock
+        self,
+        mock_text_analytics_client: MagicMock,
+        mock_async_text_analytics_client: MagicMock,
     ) -> AzureTextAnalyticsClient:
         """Fixture to create an instance of AzureTextAnalyticsClient with a mock."""
         return AzureTextAnalyticsClient()
@@ -173,6 +190,314 @@ class TestAzureTextAnalyticsClient:
 
         mock_logger.assert_called_once()
 
+    def test_successful_async_response(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test successful response from analyze_sentiment_async."""
+        mock_response = MagicMock(spec=AnalyzeSentimentResult)
+        mock_response.sentiment = "negative"
+        mock_async_text_analytics_client.return_value.analyze_sentiment.return_value = [
+            mock_response
+        ]
+
+        sentiment = asyncio.run(
+            text_analytics_client.analyze_sentiment_async("This is broken.")
+        )
+
+        assert sentiment == "NEGATIVE"
+        mock_async_text_analytics_client.return_value.analyze_sentiment.assert_awaited_once_with(
+            documents=["This is broken."]
+        )
+        mock_text_analytics_client.return_value.analyze_sentiment.assert_not_called()
+        mock_logger.assert_not_called()
+
+    def test_async_document_error_response(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test handling of DocumentError response in analyze_sentiment_async."""
+        mock_async_text_analytics_client.return_value.analyze_sentiment.return_value = [
+            MagicMock(spec=DocumentError)
+        ]
+
+        with pytest.raises(
+            AzureTextAnalyticsClientError, match="Text Analytics API error"
+        ):
+            asyncio.run(text_analytics_client.analyze_sentiment_async("Bad input"))
+
+        mock_logger.assert_called_once_with("Text Analytics API error")
+
+    def test_async_http_response_error(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test handling of HTTP response errors in analyze_sentiment_async."""
+        mock_async_text_analytics_client.return_value.analyze_sentiment.side_effect = (
+            HttpResponseError("Service unavailable")
+        )
+
+        with pytest.raises(
+            AzureTextAnalyticsClientError,
+            match="Text Analytics API error: Service unavailable",
+        ):
+            asyncio.run(text_analytics_client.analyze_sentiment_async("Some text"))
+
+        mock_logger.assert_called_once_with(
+            "Text Analytics API error: Service unavailable"
+        )
+
+    def test_batch_splits_into_service_sized_groups(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that batches are sent in groups of at most MAX_DOCUMENTS_PER_REQUEST."""
+        def analyze_sentiment(documents):
+            results = []
+            for document in documents:
+                result = MagicMock(spec=AnalyzeSentimentResult)
+                result.sentiment = "positive" if document.startswith("good") else "negative"
+                results.append(result)
+            return results
+
+        mock_async_text_analytics_client.return_value.analyze_sentiment.side_effect = (
+            analyze_sentiment
+        )
+        texts = [f"good {i}" if i % 2 else f"bad {i}" for i in range(23)]
+
+        sentiments = asyncio.run(
+            text_analytics_client.analyze_sentiment_batch_async(texts)
+        )
+
+        calls = mock_async_text_analytics_client.return_value.analyze_sentiment.await_args_list
+        assert [len(call.kwargs["documents"]) for call in calls] == [
+            MAX_DOCUMENTS_PER_REQUEST, MAX_DOCUMENTS_PER_REQUEST, 3
+        ]
+        assert sentiments == ["POSITIVE" if i % 2 else "NEGATIVE" for i in range(23)]
+        mock_logger.assert_not_called()
+
+    def test_batch_reports_errors_per_item(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that document and request errors only affect their own items."""
+        positive = MagicMock(spec=AnalyzeSentimentResult)
+        positive.sentiment = "positive"
+        mock_async_text_analytics_client.return_value.analyze_sentiment.side_effect = [
+            [positive, MagicMock(spec=DocumentError)] + [positive] * 8,
+            HttpResponseError("Service unavailable"),
+        ]
+
+        sentiments = asyncio.run(
+            text_analytics_client.analyze_sentiment_batch_async(["text"] * 12)
+        )
+
+        assert sentiments[0] == "POSITIVE"
+        assert isinstance(sentiments[1], AzureTextAnalyticsClientError)
+        assert sentiments[2:10] == ["POSITIVE"] * 8
+        assert all(
+            isinstance(sentiment, AzureTextAnalyticsClientError)
+            and "Service unavailable" in str(sentiment)
+            for sentiment in sentiments[10:]
+        )
+        assert mock_logger.call_count == 2
+
+    def test_async_requests_are_coalesced(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that concurrent requests share one call but keep their own results."""
+        text_analytics_client.batcher = text_analytics_client._get_batcher(
+            api_settings.azure_ai_services.model_copy(
+                update={"sentiment_batch_window_ms": 5}
+            )
+        )
+        positive = MagicMock(spec=AnalyzeSentimentResult)
+        positive.sentiment = "positive"
+        mock_async_text_analytics_client.return_value.analyze_sentiment.return_value = [
+            positive, MagicMock(spec=DocumentError)
+        ]
+
+        async def run():
+            return await asyncio.gather(
+                text_analytics_client.analyze_sentiment_async("Great!"),
+                text_analytics_client.analyze_sentiment_async("???"),
+                return_exceptions=True,
+            )
+
+        sentiment, error = asyncio.run(run())
+
+        assert sentiment == "POSITIVE"
+        assert isinstance(error, AzureTextAnalyticsClientError)
+        mock_async_text_analytics_client.return_value.analyze_sentiment.assert_awaited_once_with(
+            documents=["Great!", "???"]
+        )
+
+    def test_coalescing_disabled_by_default(
+        self, text_analytics_client: AzureTextAnalyticsClient
+    ):
+        """Test that no batcher is created unless a window is configured."""
+        assert text_analytics_client.batcher is None
+
+    def test_cached_sentiment_skips_the_service(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+        mock_async_text_analytics_client: MagicMock,
+    ):
+        """Test that normalized copies of a text are answered from the cache."""
+        text_analytics_client.cache = text_analytics_client._get_cache(
+            api_settings.azure_ai_services.model_copy(
+                update={"sentiment_cache_enabled": True}
+            )
+        )
+        mock_response = MagicMock(spec=AnalyzeSentimentResult)
+        mock_response.sentiment = "positive"
+        mock_text_analytics_client.return_value.analyze_sentiment.return_value = [
+            mock_response
+        ]
+
+        assert text_analytics_client.analyze_sentiment("Great product!") == "POSITIVE"
+        assert text_analytics_client.analyze_sentiment("  great   PRODUCT! ") == "POSITIVE"
+        assert asyncio.run(
+            text_analytics_client.analyze_sentiment_async("Great product!")
+        ) == "POSITIVE"
+
+        mock_text_analytics_client.return_value.analyze_sentiment.assert_called_once()
+        mock_async_text_analytics_client.return_value.analyze_sentiment.assert_not_called()
+        assert text_analytics_client.cache.stats() == {"entries": 1, "hits": 2, "misses": 1}
+
+    def test_batch_only_sends_uncached_texts(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_async_text_analytics_client: MagicMock,
+    ):
+        """Test that the batch path reuses cached results and caches only successes."""
+        text_analytics_client.cache = text_analytics_client._get_cache(
+            api_settings.azure_ai_services.model_copy(
+                update={"sentiment_cache_enabled": True}
+            )
+        )
+        text_analytics_client._set_cached("Cached", "NEGATIVE")
+        positive = MagicMock(spec=AnalyzeSentimentResult)
+        positive.sentiment = "positive"
+        mock_async_text_analytics_client.return_value.analyze_sentiment.return_value = [
+            positive, MagicMock(spec=DocumentError)
+        ]
+
+        sentiments = asyncio.run(
+            text_analytics_client.analyze_sentiment_batch_async(["New", "Cached", "Bad"])
+        )
+
+        assert sentiments[:2] == ["POSITIVE", "NEGATIVE"]
+        assert isinstance(sentiments[2], AzureTextAnalyticsClientError)
+        mock_async_text_analytics_client.return_value.analyze_sentiment.assert_awaited_once_with(
+            documents=["New", "Bad"]
+        )
+        assert text_analytics_client._get_cached("New") == "POSITIVE"
+        assert text_analytics_client._get_cached("Bad") is None
+
+    def test_ping(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+    ):
+        """Test the health probe sends a one-document request with the timeout."""
+        text_analytics_client.probe = True
+        mock_result = MagicMock(spec=AnalyzeSentimentResult)
+        mock_result.sentiment = "neutral"
+        mock_result.is_error = False
+        mock_text_analytics_client.return_value.analyze_sentiment.return_value = [mock_result]
+
+        text_analytics_client.ping(timeout=5)
+
+        mock_text_analytics_client.return_value.analyze_sentiment.assert_called_once_with(
+            documents=["ok"], connection_timeout=5, read_timeout=5
+        )
+
+    def test_ping_failure(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test the health probe failure is raised as a client error."""
+        text_analytics_client.probe = True
+        mock_text_analytics_client.return_value.analyze_sentiment.side_effect = Exception(
+            "Timeout"
+        )
+
+        with pytest.raises(
+            AzureTextAnalyticsClientError, match="Text Analytics health check failed: Timeout"
+        ):
+            text_analytics_client.ping(timeout=5)
+
+        mock_logger.assert_called_once_with("Text Analytics health check failed: Timeout")
+
+    def test_ping_without_probe_sends_no_request(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+    ):
+        """Test the health check is free by default and passes while the circuit is closed."""
+        assert text_analytics_client.probe is False
+
+        text_analytics_client.ping(timeout=5)
+
+        mock_text_analytics_client.return_value.analyze_sentiment.assert_not_called()
+
+    def test_ping_without_probe_fails_while_circuit_is_open(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+    ):
+        """Test the free health check reports an open circuit as unhealthy."""
+        text_analytics_client.guard.breaker.state = "open"
+
+        with pytest.raises(
+            AzureTextAnalyticsClientError,
+            match="Text Analytics health check failed: circuit is open",
+        ):
+            text_analytics_client.ping(timeout=5)
+
+        mock_text_analytics_client.return_value.analyze_sentiment.assert_not_called()
+
+    def test_open_circuit_fails_fast(
+        self,
+        text_analytics_client: AzureTextAnalyticsClient,
+        mock_text_analytics_client: MagicMock,
+        mock_async_text_analytics_client: MagicMock,
+        mock_logger: MagicMock,
+    ):
+        """Test that an open circuit rejects single and batch requests without calling the API."""
+        mock_text_analytics_client.return_value.analyze_sentiment.side_effect = Exception(
+            "Timeout"
+        )
+        for _ in range(api_settings.resilience.failure_threshold):
+            with pytest.raises(AzureTextAnalyticsClientError):
+                text_analytics_client.analyze_sentiment("Hello")
+
+        with pytest.raises(DependencyUnavailableError):
+            text_analytics_client.analyze_sentiment("Hello")
+
+        results = asyncio.run(text_analytics_client.analyze_sentiment_batch_async(["a", "b"]))
+
+        assert all(isinstance(result, DependencyUnavailableError) for result in results)
+        mock_async_text_analytics_client.return_value.analyze_sentiment.assert_not_called()
+
     def test_singleton_instance(self):
         """Test that the module-initialized AzureTextAnalyticsClient is a singleton."""
 
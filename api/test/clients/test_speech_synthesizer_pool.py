@@ -0,0 +1,109 @@
+import asyncio
+import threading
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.clients.speech_synthesizer_pool import SpeechSynthesizerPool
+
+
+class TestSpeechSynthesizerPool:
+    """
+    Pooled speech synthesizer tests.
+    """
+
+    @pytest.fixture
+    def mock_connection(self) -> Generator[MagicMock, None, None]:
+        """Fixture to mock the SDK Connection API."""
+        with patch("src.clients.speech_synthesizer_pool.Connection") as mock:
+            yield mock
+
+    @pytest.fixture
+    def factory(self) -> MagicMock:
+        return MagicMock(side_effect=lambda: MagicMock())
+
+    @pytest.fixture
+    def pool(self, mock_connection: MagicMock, factory: MagicMock) -> SpeechSynthesizerPool:
+        return SpeechSynthesizerPool(factory=factory, size=2)
+
+    def test_warm_up_opens_connections(
+        self, pool: SpeechSynthesizerPool, factory: MagicMock, mock_connection: MagicMock
+    ):
+        pool.warm_up()
+
+        assert factory.call_count == 2
+        assert mock_connection.from_speech_synthesizer.return_value.open.call_count == 2
+        assert pool.stats()["idle"] == 2
+
+    def test_synthesizers_are_reused(self, pool: SpeechSynthesizerPool, factory: MagicMock):
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second is first
+        assert factory.call_count == 1
+        assert pool.stats()["acquisitions"] == 2
+        assert pool.stats()["in_use"] == 1
+
+    def test_failed_synthesizers_are_recycled(
+        self, pool: SpeechSynthesizerPool, factory: MagicMock, mock_connection: MagicMock
+    ):
+        broken = pool.acquire()
+        pool.release(broken, healthy=False)
+
+        mock_connection.from_speech_synthesizer.assert_called_with(broken)
+        mock_connection.from_speech_synthesizer.return_value.close.assert_called_once()
+        assert pool.acquire() is not broken
+        assert pool.stats()["recycled"] == 1
+        assert factory.call_count == 2
+
+    def test_acquire_waits_when_exhausted(self, pool: SpeechSynthesizerPool):
+        first, second = pool.acquire(), pool.acquire()
+
+        assert pool.acquire(block=False) is None
+
+        threading.Timer(0.05, pool.release, args=(first,)).start()
+
+        assert pool.acquire() is first
+        stats = pool.stats()
+        assert stats["wait_max"] >= 0.05
+        assert stats["in_use"] == 2
+        assert 0 < stats["utilization"] <= 1
+        pool.release(second)
+
+    def test_acquire_async(self, pool: SpeechSynthesizerPool):
+        first, second = pool.acquire(), pool.acquire()
+
+        async def run():
+            waiting = asyncio.ensure_future(pool.acquire_async())
+            await asyncio.sleep(0.01)
+            assert not waiting.done()
+            pool.release(second)
+            return await waiting
+
+        assert asyncio.run(run()) is second
+        pool.release(first)
+
+    def test_acquire_async_creates_synthesizers_off_the_event_loop(
+        self, mock_connection: MagicMock
+    ):
+        threads = []
+        pool = SpeechSynthesizerPool(
+            factory=lambda: threads.append(threading.current_thread()) or MagicMock(),
+            size=1,
+        )
+
+        asyncio.run(pool.acquire_async())
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert pool.stats()["in_use"] == 1
+
+    def test_warm_up_failure_is_logged(self, mock_connection: MagicMock):
+        pool = SpeechSynthesizerPool(factory=MagicMock(side_effect=Exception("boom")), size=2)
+
+        with patch("src.clients.speech_synthesizer_pool.logger") as mock_logger:
+            pool.warm_up()
+
+        mock_logger.error.assert_called_once_with("Speech synthesizer warm-up failed: boom")
+        assert pool.stats()["created"] == 0
@@ -1,3 +1,4 @@
+import time
 import pytest
 from typing import Generator
 from unittest.mock import MagicMock, patch
@@ -6,6 +7,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from src.api import api
+from src.storage import AudioLinks, LocalAudioStore
 
 
 class TestDownloadAudio:
@@ -21,45 +23,231 @@ class TestDownloadAudio:
         return TestClient(app=api)
 
     @pytest.fixture
-    def mock_file_exists(self) -> Generator[MagicMock, None, None]:
+    def mock_audio_store(self) -> Generator[MagicMock, None, None]:
         """
-        Patch os.path.isfile to simulate file existence.
+        Patch the audio store to avoid real storage access.
         """
-        with patch("os.path.isfile", return_value=True) as mock:
+        with patch("src.controllers.get_audio.audio_store") as mock:
+            mock.open_file.return_value = None
+            mock.get.return_value = None
             yield mock
 
-    @pytest.fixture
-    def mock_file_response(self) -> Generator[MagicMock, None, None]:
-        """
-        Patch FileResponse to avoid real file access.
-        """
-        with patch("src.controllers.get_audio.FileResponse") as mock:
-            mock.return_value = MagicMock()
-            yield mock
+    def test_download_audio_success(self, client: TestClient, mock_audio_store: MagicMock):
+        mock_audio_store.get.return_value = b"audio"
+        filename = "test.mp3"
+        response = client.get(f"/audio/{filename}")
 
-    def test_download_audio_success(
-        self, client: TestClient, mock_file_exists, mock_file_response
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b"audio"
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["content-disposition"] == f'attachment; filename="{filename}"'
+        assert response.headers["etag"] == '"test"'
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert response.headers["accept-ranges"] == "bytes"
+        mock_audio_store.get.assert_called_once_with(filename)
+
+    @pytest.mark.parametrize(
+        "filename, content_type",
+        [("test.ogg", "audio/ogg"), ("test.wav", "audio/wav")],
+    )
+    def test_download_audio_formats(
+        self,
+        client: TestClient,
+        mock_audio_store: MagicMock,
+        filename: str,
+        content_type: str,
     ):
-        filename = "test.mp3"
+        mock_audio_store.get.return_value = b"audio"
         response = client.get(f"/audio/{filename}")
-        path = f"test_audio_path/{filename}"
 
         assert response.status_code == status.HTTP_200_OK
-        mock_file_exists.assert_called_once_with(path)
-        mock_file_response.assert_called_once_with(
-            path=path, media_type="audio/mpeg", filename=filename
+        assert response.headers["content-type"] == content_type
+        assert response.headers["etag"] == '"test"'
+
+    def test_download_audio_signed_link(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        mock_audio_store.get.return_value = b"audio"
+        links = AudioLinks(key="secret", ttl=300)
+
+        with patch("src.controllers.get_audio.audio_links", links):
+            signed = client.get(links.url("test.mp3"))
+            unsigned = client.get("/audio/test.mp3")
+            other_file = client.get(links.url("test.mp3").replace("test.mp3", "other.mp3", 1))
+            expired = client.get(links.url("test.mp3", now=time.time() - 301))
+
+        assert signed.status_code == status.HTTP_200_OK
+        assert signed.content == b"audio"
+        cache_control, max_age = signed.headers["cache-control"].split(", max-age=")
+        assert cache_control == "private"
+        assert 0 < int(max_age) <= 300
+        for response in (unsigned, other_file, expired):
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+            assert response.json()["detail"] == "Invalid or expired audio link"
+        mock_audio_store.get.assert_called_once_with("test.mp3")
+
+    def test_download_audio_not_modified(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        response = client.get("/audio/test.mp3", headers={"If-None-Match": '"test"'})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == '"test"'
+        mock_audio_store.get.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "range_header, content, content_range",
+        [
+            ("bytes=0-3", b"0123", "bytes 0-3/10"),
+            ("bytes=6-", b"6789", "bytes 6-9/10"),
+            ("bytes=-2", b"89", "bytes 8-9/10"),
+        ],
+    )
+    def test_download_audio_range(
+        self,
+        client: TestClient,
+        mock_audio_store: MagicMock,
+        range_header: str,
+        content: bytes,
+        content_range: str,
+    ):
+        mock_audio_store.get.return_value = b"0123456789"
+        response = client.get("/audio/test.mp3", headers={"Range": range_header})
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.content == content
+        assert response.headers["content-range"] == content_range
+        assert response.headers["content-length"] == str(len(content))
+        assert response.headers["etag"] == '"test"'
+
+    def test_download_audio_range_not_satisfiable(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        mock_audio_store.get.return_value = b"0123456789"
+        response = client.get("/audio/test.mp3", headers={"Range": "bytes=10-"})
+
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_download_audio_if_range_mismatch_serves_everything(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        mock_audio_store.get.return_value = b"0123456789"
+        response = client.get(
+            "/audio/test.mp3", headers={"Range": "bytes=0-3", "If-Range": '"other"'}
         )
 
-    def test_download_audio_file_not_found(self, client: TestClient):
-        with patch("os.path.isfile", return_value=False):
-            filename = "nonexistent.mp3"
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b"0123456789"
+
+    def test_bytes_transferred_for_seek_and_replay(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        """
+        A player downloads a clip once, seeks back to the middle twice, then
+        replays it: only the first download and the seeked ranges are transferred.
+        """
+        size = 192_000 // 8 * 10  # 10 s at 192 kbps
+        mock_audio_store.get.return_value = bytes(size)
+
+        first = client.get("/audio/test.mp3")
+        etag = first.headers["etag"]
+        seeks = [
+            client.get("/audio/test.mp3", headers={"Range": f"bytes={size // 2}-", "If-Range": etag}),
+            client.get("/audio/test.mp3", headers={"Range": f"bytes={size * 3 // 4}-", "If-Range": etag}),
+        ]
+        replay = client.get("/audio/test.mp3", headers={"If-None-Match": etag})
+
+        transferred = len(first.content) + sum(len(r.content) for r in seeks) + len(replay.content)
+        without_caching = 4 * size
+
+        assert [r.status_code for r in seeks] == [206, 206]
+        assert replay.status_code == status.HTTP_304_NOT_MODIFIED
+        assert transferred == size + size // 2 + size // 4
+        assert transferred / without_caching < 0.5
+
+    @pytest.mark.parametrize(
+        "headers, status_code, content",
+        [
+            ({}, status.HTTP_200_OK, b"0123456789"),
+            ({"Range": "bytes=2-5"}, status.HTTP_206_PARTIAL_CONTENT, b"2345"),
+        ],
+    )
+    def test_download_audio_streams_local_files(
+        self,
+        client: TestClient,
+        tmp_path,
+        headers: dict,
+        status_code: int,
+        content: bytes,
+    ):
+        store = LocalAudioStore(path=str(tmp_path))
+        store.put("test.mp3", b"0123456789")
+
+        with patch("src.controllers.get_audio.audio_store", store), patch.object(
+            store, "get", side_effect=AssertionError("read into memory")
+        ), patch("src.controllers.get_audio.CHUNK_SIZE", 3):
+            response = client.get("/audio/test.mp3", headers=headers)
+
+        assert response.status_code == status_code
+        assert response.content == content
+        assert response.headers["content-length"] == str(len(content))
+        assert response.headers["etag"] == '"test"'
+
+    def test_download_audio_streams_pending_synthesis(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        async def stream():
+            yield b"au"
+            yield b"dio"
+
+        with patch("src.controllers.get_audio.azure_speech_synthesis_client") as mock_client:
+            mock_client.open_stream.return_value = stream()
+            filename = "pending.mp3"
             response = client.get(f"/audio/{filename}")
 
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b"audio"
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert filename in response.headers["content-disposition"]
+        mock_client.open_stream.assert_called_once_with(filename)
+
+    def test_download_audio_range_on_pending_synthesis_streams_everything(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        async def stream():
+            yield b"audio"
+
+        with patch("src.controllers.get_audio.azure_speech_synthesis_client") as mock_client:
+            mock_client.open_stream.return_value = stream()
+            response = client.get("/audio/pending.mp3", headers={"Range": "bytes=2-"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b"audio"
+        assert "content-range" not in response.headers
+        assert "accept-ranges" not in response.headers
+
+    def test_download_audio_file_not_found(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        filename = "nonexistent.mp3"
+        response = client.get(f"/audio/{filename}")
+
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json()["detail"] == "File not found"
 
-    def test_download_audio_invalid_filename(self, client: TestClient):
-        filename = "invalid.txt"
+    def test_download_audio_store_error(
+        self, client: TestClient, mock_audio_store: MagicMock
+    ):
+        mock_audio_store.get.side_effect = Exception("Connection reset")
+        response = client.get("/audio/test.mp3")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json()["detail"] == "Error serving file: Connection reset"
+
+    @pytest.mark.parametrize("filename", ["invalid.txt", ".mp3", "mp3"])
+    def test_download_audio_invalid_filename(self, client: TestClient, filename: str):
         response = client.get(f"/audio/{filename}")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
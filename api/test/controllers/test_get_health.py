@@ -1,5 +1,5 @@
 import pytest
-from typing import Generator
+from typing import Dict, Generator
 from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 from src.api import api
@@ -18,33 +18,32 @@ class TestHealthCheck:
         return TestClient(app=api)
 
     @pytest.fixture
-    def mock_check_azure_openai_client(self) -> Generator[MagicMock, None, None]:
-        with patch("src.controllers.get_health._check_azure_openai_client") as mock:
+    def mock_health_monitor(self) -> Generator[MagicMock, None, None]:
+        """Mock the background health monitor."""
+        with patch("src.controllers.get_health.health_monitor") as mock:
             yield mock
 
-    @pytest.fixture
-    def mock_check_azure_text_analytics_client(self) -> Generator[MagicMock, None, None]:
-        """Mock Azure Text Analytics client check."""
-        with patch("src.controllers.get_health._check_azure_text_analytics_client") as mock:
-            yield mock
-
-    @pytest.fixture
-    def mock_check_azure_speech_synthesis_client(self) -> Generator[MagicMock, None, None]:
-        """Mock Azure Speech Synthesis client check."""
-        with patch("src.controllers.get_health._check_azure_speech_synthesis_client") as mock:
-            yield mock
+    def _status(self, openai: bool, text_analytics: bool, speech: bool) -> Dict:
+        """Build probe results for each Azure service."""
+        return {
+            name: {
+                "healthy": healthy,
+                "age": 1.5,
+                "latency": 0.2,
+                "error": None if healthy else "Connection refused",
+            }
+            for name, healthy in (
+                ("azure_open_ai_client", openai),
+                ("azure_text_analytics_client", text_analytics),
+                ("azure_speech_synthesis_client", speech),
+            )
+        }
 
     def test_health_check_all_services_available(
-        self,
-        client: TestClient,
-        mock_check_azure_openai_client: MagicMock,
-        mock_check_azure_text_analytics_client: MagicMock,
-        mock_check_azure_speech_synthesis_client: MagicMock
+        self, client: TestClient, mock_health_monitor: MagicMock
     ):
         """Test health check when all services are available."""
-        mock_check_azure_openai_client.return_value = True
-        mock_check_azure_text_analytics_client.return_value = True
-        mock_check_azure_speech_synthesis_client.return_value = True
+        mock_health_monitor.status.return_value = self._status(True, True, True)
 
         response = client.get("/health/")
         assert response.status_code == 200
@@ -52,46 +51,48 @@ class TestHealthCheck:
             "azure_open_ai_client": True,
             "azure_text_analytics_client": True,
             "azure_speech_synthesis_client": True,
+            "checks": self._status(True, True, True),
         }
 
     def test_health_check_some_services_unavailable(
-        self,
-        client: TestClient,
-        mock_check_azure_openai_client: MagicMock,
-        mock_check_azure_text_analytics_client: MagicMock,
-        mock_check_azure_speech_synthesis_client: MagicMock
+        self, client: TestClient, mock_health_monitor: MagicMock
     ):
         """Test health check when one or more services are unavailable."""
-        mock_check_azure_openai_client.return_value = False
-        mock_check_azure_text_analytics_client.return_value = True
-        mock_check_azure_speech_synthesis_client.return_value = True
+        mock_health_monitor.status.return_value = self._status(False, True, True)
 
         response = client.get("/health/")
         assert response.status_code == 500
         assert response.json()["detail"]["message"] == "One or more Azure services are unavailable"
-        assert response.json()["detail"]["status"] == {
-            "azure_open_ai_client": False,
-            "azure_text_analytics_client": True,
-            "azure_speech_synthesis_client": True,
-        }
+        status = response.json()["detail"]["status"]
+        assert (
+            status["azure_open_ai_client"],
+            status["azure_text_analytics_client"],
+            status["azure_speech_synthesis_client"],
+        ) == (False, True, True)
+        assert status["checks"]["azure_open_ai_client"]["error"] == "Connection refused"
 
     def test_health_check_all_services_unavailable(
-        self,
-        client: TestClient,
-        mock_check_azure_openai_client: MagicMock,
-        mock_check_azure_text_analytics_client: MagicMock,
-        mock_check_azure_speech_synthesis_client: MagicMock
+        self, client: TestClient, mock_health_monitor: MagicMock
     ):
         """Test health check when all services are unavailable."""
-        mock_check_azure_openai_client.return_value = False
-        mock_check_azure_text_analytics_client.return_value = False
-        mock_check_azure_speech_synthesis_client.return_value = False
+        mock_health_monitor.status.return_value = self._status(False, False, False)
 
         response = client.get("/health/")
         assert response.status_code == 500
         assert response.json()["detail"]["message"] == "One or more Azure services are unavailable"
-        assert response.json()["detail"]["status"] == {
-            "azure_open_ai_client": False,
-            "azure_text_analytics_client": False,
-            "azure_speech_synthesis_client": False,
-        }
+        status = response.json()["detail"]["status"]
+        assert not any(
+            [
+                status["azure_open_ai_client"],
+                status["azure_text_analytics_client"],
+                status["azure_speech_synthesis_client"],
+            ]
+        )
+
+    def test_liveness_check(self, client: TestClient, mock_health_monitor: MagicMock):
+        """Test that the liveness check never looks at the dependencies."""
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        mock_health_monitor.status.assert_not_called()
@@ -0,0 +1,54 @@
+from typing import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from src.api import api
+from src.dtos import JobResponse
+
+
+class TestGetJob:
+    """
+    GET /jobs/{job_id} endpoint test.
+    """
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        return TestClient(app=api)
+
+    @pytest.fixture
+    def mock_job_runner(self) -> Generator[MagicMock, None, None]:
+        with patch("src.controllers.get_jobs.job_runner") as mock:
+            mock.get = AsyncMock(return_value=JobResponse(id="job", status="running"))
+            mock.wait = AsyncMock(return_value=JobResponse(id="job", status="failed", error="boom"))
+            yield mock
+
+    def test_get_job(self, client: TestClient, mock_job_runner: MagicMock):
+        response = client.get("/jobs/job")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "running"
+        mock_job_runner.get.assert_awaited_once_with("job")
+        mock_job_runner.wait.assert_not_called()
+
+    def test_long_poll_job(self, client: TestClient, mock_job_runner: MagicMock):
+        response = client.get("/jobs/job?wait=10")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"id": "job", "status": "failed", "result": None, "error": "boom"}
+        mock_job_runner.wait.assert_awaited_once_with("job", 10)
+
+    def test_long_poll_is_capped(self, client: TestClient, mock_job_runner: MagicMock):
+        response = client.get("/jobs/job?wait=60")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_job_not_found(self, client: TestClient, mock_job_runner: MagicMock):
+        mock_job_runner.get.return_value = None
+
+        response = client.get("/jobs/unknown")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "Job not found"
@@ -0,0 +1,24 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from src.api import api
+
+
+class TestGetMetrics:
+    """
+    GET /metrics endpoint test.
+    """
+
+    def test_get_metrics(self):
+        response = TestClient(app=api).get("/metrics/")
+
+        assert response.status_code == status.HTTP_200_OK
+        metrics = response.json()
+        assert metrics["azure_open_ai_client"]["breaker"]["state"] == "closed"
+        assert metrics["azure_open_ai_client"]["limiter"] is None
+        assert metrics["azure_open_ai_client"]["cache"] is None
+        assert metrics["azure_open_ai_client"]["hedger"] is None
+        assert metrics["azure_text_analytics_client"]["batcher"] is None
+        assert metrics["azure_speech_synthesis_client"]["pool"] is None
+        assert metrics["audio_store"] == {"type": "LocalAudioStore", "retention": None}
+        assert metrics["jobs"] == {"pending": 0, "max_pending": 100}
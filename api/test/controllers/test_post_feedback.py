@@ -1,7 +1,11 @@
+import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 from src.api import api
+from src.dtos import FeedbackBatchResponse, FeedbackBatchResult, JobResponse
+from src.jobs import JobQueueFullError
+from src.utils import DependencyUnavailableError
 
 
 class TestFeedbackEndpoint:
@@ -15,9 +19,12 @@ class TestFeedbackEndpoint:
     @pytest.fixture
     def mock_text_analytics(self):
         """
-        Patch azure_text_analytics_client.analyze_sentiment to return 'positive'.
+        Patch azure_text_analytics_client.analyze_sentiment_async to return 'positive'.
         """
-        with patch("src.actions.generate_feedback_response.azure_text_analytics_client.analyze_sentiment") as mock:
+        with patch(
+            "src.actions.generate_feedback_response.azure_text_analytics_client.analyze_sentiment_async",
+            new_callable=AsyncMock,
+        ) as mock:
             mock.return_value = "positive"
             yield mock
 
@@ -27,7 +34,7 @@ class TestFeedbackEndpoint:
         Patch azure_openai_client to return a simple string response.
         """
         with patch("src.actions.generate_feedback_response.azure_openai_client") as mock:
-            mock.return_value = "Thank you!"
+            mock.call_async = AsyncMock(return_value="Thank you!")
             yield mock
 
     @pytest.fixture
@@ -36,7 +43,7 @@ class TestFeedbackEndpoint:
         Patch azure_speech_synthesis_client to return an audio file path.
         """
         with patch("src.actions.generate_feedback_response.azure_speech_synthesis_client") as mock:
-            mock.return_value = "audio.mp3"
+            mock.call_async = AsyncMock(return_value="audio.mp3")
             yield mock
 
     @pytest.fixture
@@ -67,11 +74,247 @@ class TestFeedbackEndpoint:
             "feedback": "I love SentioVoice!",
             "response": "Thank you!",
             "sentiment": "positive",
-            "audio": "audio.mp3"
+            "audio": "audio.mp3",
+            "audio_url": "/audio/audio.mp3"
         }
 
-        mock_text_analytics.assert_called_once_with("I love SentioVoice!")
+        mock_text_analytics.assert_awaited_once_with("I love SentioVoice!")
         mock_prompt.assert_called_once()
         mock_prompt.return_value.assert_called_once_with("positive", "I love SentioVoice!")
-        mock_openai_client.assert_called_once_with("Generated prompt")
-        mock_speech_synthesis_client.assert_called_once_with("Thank you!", "positive")
+        mock_openai_client.call_async.assert_awaited_once_with("Generated prompt")
+        mock_speech_synthesis_client.call_async.assert_awaited_once_with("Thank you!", "positive", None)
+
+    def test_process_feedback_inline_audio_base64(
+        self,
+        client: TestClient,
+        mock_text_analytics,
+        mock_openai_client,
+        mock_speech_synthesis_client,
+        mock_prompt,
+    ):
+        with patch("src.controllers.post_feedback.azure_speech_synthesis_client") as mock:
+            mock.read_async = AsyncMock(return_value=b"audio")
+            response = client.post(
+                "/feedback/?inline_audio=base64", json={"feedback": "I love SentioVoice!"}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "feedback": "I love SentioVoice!",
+            "response": "Thank you!",
+            "sentiment": "positive",
+            "audio": "audio.mp3",
+            "audio_url": "/audio/audio.mp3",
+            "audio_data": "YXVkaW8=",
+        }
+        mock.read_async.assert_awaited_once_with("audio.mp3")
+
+    def test_process_feedback_inline_audio_multipart(
+        self,
+        client: TestClient,
+        mock_text_analytics,
+        mock_openai_client,
+        mock_speech_synthesis_client,
+        mock_prompt,
+    ):
+        with patch("src.controllers.post_feedback.azure_speech_synthesis_client") as mock:
+            mock.read_async = AsyncMock(return_value=b"audio")
+            response = client.post(
+                "/feedback/?inline_audio=multipart", json={"feedback": "I love SentioVoice!"}
+            )
+
+        assert response.status_code == 200
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/mixed; boundary=")
+        boundary = content_type.split("boundary=")[1].encode()
+
+        parts = response.content.split(b"--" + boundary)
+        assert parts[0] == b"" and parts[-1] == b"--\r\n"
+        json_headers, json_body = parts[1].strip().split(b"\r\n\r\n", 1)
+        audio_headers, audio_body = parts[2].strip().split(b"\r\n\r\n", 1)
+        assert json_headers == b"Content-Type: application/json"
+        assert json.loads(json_body)["audio"] == "audio.mp3"
+        assert b"Content-Type: audio/mpeg" in audio_headers
+        assert b'filename="audio.mp3"' in audio_headers
+        assert audio_body == b"audio"
+
+    def test_process_feedback_inline_audio_async_mode(self, client: TestClient):
+        with patch("src.controllers.post_feedback.job_runner") as mock_job_runner:
+            response = client.post(
+                "/feedback/?mode=async&inline_audio=base64", json={"feedback": "Great!"}
+            )
+
+        assert response.status_code == 400
+        mock_job_runner.submit.assert_not_called()
+
+    def test_process_feedback_batch_endpoint(self, client: TestClient):
+        batch_response = FeedbackBatchResponse(
+            results=[
+                FeedbackBatchResult(
+                    feedback="Great!", sentiment="POSITIVE", response="Thanks!", audio="a.mp3"
+                ),
+                FeedbackBatchResult(feedback="Hmm", error="Text Analytics API error"),
+            ]
+        )
+
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.batch_async",
+            new_callable=AsyncMock,
+            return_value=batch_response,
+        ) as mock_batch:
+            response = client.post(
+                "/feedback/batch",
+                json={"items": [{"feedback": "Great!"}, {"feedback": "Hmm"}]},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == batch_response.model_dump()
+        (feedbacks,), _ = mock_batch.call_args
+        assert [feedback.feedback for feedback in feedbacks] == ["Great!", "Hmm"]
+
+    def test_process_feedback_batch_endpoint_empty(self, client: TestClient):
+        response = client.post("/feedback/batch", json={"items": []})
+
+        assert response.status_code == 422
+
+    def test_stream_feedback_endpoint(self, client: TestClient):
+        async def stream_async(self, feedback):
+            yield "sentiment", {"sentiment": "POSITIVE"}
+            yield "token", {"token": "Thanks"}
+            yield "audio", {"response": "Thanks", "audio": "a.mp3"}
+
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.stream_async",
+            stream_async,
+        ):
+            response = client.post("/feedback/stream", json={"feedback": "Great!"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'event: sentiment\ndata: {"sentiment": "POSITIVE"}\n\n'
+            'event: token\ndata: {"token": "Thanks"}\n\n'
+            'event: audio\ndata: {"response": "Thanks", "audio": "a.mp3"}\n\n'
+        )
+
+    def test_stream_feedback_endpoint_error(self, client: TestClient):
+        async def stream_async(self, feedback):
+            yield "sentiment", {"sentiment": "POSITIVE"}
+            raise Exception("LLM response generation failed: API Error")
+
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.stream_async",
+            stream_async,
+        ):
+            response = client.post("/feedback/stream", json={"feedback": "Great!"})
+
+        events = response.text.strip().split("\n\n")
+        assert events[-1] == "event: error\ndata: " + json.dumps(
+            {"detail": "LLM response generation failed: API Error"}
+        )
+
+    def test_speak_feedback_endpoint(self, client: TestClient):
+        async def audio():
+            yield b"au"
+            raise Exception("Speech synthesis failed")
+
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.speech_async",
+            new_callable=AsyncMock,
+            return_value=("POSITIVE", audio()),
+        ):
+            response = client.post("/feedback/speech", json={"feedback": "Great!"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["x-sentiment"] == "POSITIVE"
+        assert response.content == b"au"
+
+    @pytest.mark.parametrize(
+        "body, accept, audio_format, content_type",
+        [
+            ({}, None, "mp3-high", "audio/mpeg"),
+            ({}, "audio/ogg, audio/mpeg;q=0.5", "opus", "audio/ogg"),
+            ({"audio_format": "mp3-low"}, "audio/ogg", "mp3-low", "audio/mpeg"),
+        ],
+    )
+    def test_speak_feedback_audio_format(
+        self,
+        client: TestClient,
+        body: dict,
+        accept: str,
+        audio_format: str,
+        content_type: str,
+    ):
+        async def audio():
+            yield b"audio"
+
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.speech_async",
+            new_callable=AsyncMock,
+            return_value=("POSITIVE", audio()),
+        ) as mock_speech_async:
+            response = client.post(
+                "/feedback/speech",
+                json={"feedback": "Great!", **body},
+                headers={"Accept": accept} if accept else {},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == content_type
+        assert mock_speech_async.await_args[0][1] == audio_format
+
+    @pytest.mark.parametrize(
+        "body, accept, status_code",
+        [
+            ({"audio_format": "pcm"}, None, 400),
+            ({}, "audio/wav", 400),
+            ({}, "audio/flac", 406),
+        ],
+    )
+    def test_speak_feedback_unsupported_audio_format(
+        self, client: TestClient, body: dict, accept: str, status_code: int
+    ):
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.speech_async",
+            new_callable=AsyncMock,
+        ) as mock_speech_async:
+            response = client.post(
+                "/feedback/speech",
+                json={"feedback": "Great!", **body},
+                headers={"Accept": accept} if accept else {},
+            )
+
+        assert response.status_code == status_code
+        mock_speech_async.assert_not_awaited()
+
+    def test_process_feedback_async_mode(self, client: TestClient):
+        with patch("src.controllers.post_feedback.job_runner") as mock_job_runner:
+            mock_job_runner.submit = AsyncMock(return_value=JobResponse(id="job", status="pending"))
+            response = client.post("/feedback/?mode=async", json={"feedback": "Great!"})
+
+        assert response.status_code == 202
+        assert response.headers["location"] == "/jobs/job"
+        assert response.json() == {"id": "job", "status": "pending", "result": None, "error": None}
+        assert mock_job_runner.submit.call_args[0][0].feedback == "Great!"
+
+    def test_process_feedback_async_mode_queue_full(self, client: TestClient):
+        with patch("src.controllers.post_feedback.job_runner") as mock_job_runner:
+            mock_job_runner.submit = AsyncMock(side_effect=JobQueueFullError("Too many pending jobs"))
+            response = client.post("/feedback/?mode=async", json={"feedback": "Great!"})
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+        assert response.json()["detail"] == "Too many pending jobs"
+
+    def test_process_feedback_dependency_unavailable(self, client: TestClient):
+        with patch(
+            "src.controllers.post_feedback.GenerateFeedbackResponse.call_async",
+            new_callable=AsyncMock,
+            side_effect=DependencyUnavailableError("Azure OpenAI", "circuit open", 12.4),
+        ):
+            response = client.post("/feedback/", json={"feedback": "Great!"})
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "12"
+        assert response.json() == {"detail": "Azure OpenAI is unavailable: circuit open"}
@@ -21,3 +21,12 @@ class TestFeedbackModel:
         with pytest.raises(ValidationError) as exc_info:
             Feedback(feedback=123)
         assert "type=string_type" in str(exc_info.value)
+
+    def test_audio_format(self):
+        assert Feedback(feedback="Great!").audio_format is None
+        assert Feedback(feedback="Great!", audio_format="opus").audio_format == "opus"
+
+    def test_invalid_audio_format(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Feedback(feedback="Great!", audio_format="flac")
+        assert "type=literal_error" in str(exc_info.value)
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+from src.dtos import FeedbackBatch, FeedbackBatchResult
+
+
+class TestFeedbackBatchModel:
+    """
+    Unit tests for FeedbackBatch and FeedbackBatchResult DTOs.
+    """
+
+    def test_valid_feedback_batch(self):
+        batch = FeedbackBatch(items=[{"feedback": "One"}, {"feedback": "Two"}])
+        assert [item.feedback for item in batch.items] == ["One", "Two"]
+
+    def test_empty_feedback_batch(self):
+        with pytest.raises(ValidationError) as exc_info:
+            FeedbackBatch(items=[])
+        assert "type=too_short" in str(exc_info.value)
+
+    def test_too_large_feedback_batch(self):
+        with pytest.raises(ValidationError) as exc_info:
+            FeedbackBatch(items=[{"feedback": "Text"}] * 101)
+        assert "type=too_long" in str(exc_info.value)
+
+    def test_feedback_batch_result_defaults(self):
+        result = FeedbackBatchResult(feedback="Text")
+        assert result.sentiment is None
+        assert result.response is None
+        assert result.audio is None
+        assert result.error is None
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.dtos import Feedback, SentimentResponse
+from src.jobs import JobQueueFullError, job_runner
+from src.jobs.job_runner import JobRunner
+from src.jobs.job_store import MemoryJobStore
+
+
+class TestJobRunner:
+    """
+    Feedback job runner tests.
+    """
+
+    @pytest.fixture
+    def feedback(self) -> Feedback:
+        return Feedback(feedback="Great!")
+
+    @pytest.fixture
+    def result(self) -> SentimentResponse:
+        return SentimentResponse(
+            feedback="Great!", sentiment="POSITIVE", response="Thanks!", audio="a.mp3"
+        )
+
+    @pytest.fixture
+    def mock_action(self) -> Generator[MagicMock, None, None]:
+        with patch("src.jobs.job_runner.GenerateFeedbackResponse") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def runner(self) -> JobRunner:
+        return JobRunner(store=MemoryJobStore(ttl=10), max_workers=2, max_pending=2)
+
+    def test_job_succeeds(
+        self,
+        runner: JobRunner,
+        feedback: Feedback,
+        result: SentimentResponse,
+        mock_action: MagicMock,
+    ):
+        mock_action.return_value = result
+
+        job = asyncio.run(runner.submit(feedback))
+        assert job.status == "pending"
+
+        finished = asyncio.run(runner.wait(job.id, timeout=5))
+
+        assert finished.status == "succeeded"
+        assert finished.result == result
+        assert runner.pending == 0
+        mock_action.assert_called_once_with(feedback)
+
+    def test_job_fails(self, runner: JobRunner, feedback: Feedback, mock_action: MagicMock):
+        mock_action.side_effect = Exception("LLM response generation failed")
+
+        job = asyncio.run(runner.submit(feedback))
+        finished = asyncio.run(runner.wait(job.id, timeout=5))
+
+        assert finished.status == "failed"
+        assert finished.error == "LLM response generation failed"
+        assert runner.pending == 0
+
+    def test_queue_is_bounded(
+        self,
+        runner: JobRunner,
+        feedback: Feedback,
+        result: SentimentResponse,
+        mock_action: MagicMock,
+    ):
+        release = threading.Event()
+        mock_action.side_effect = lambda _: release.wait(5) and result
+
+        jobs = [asyncio.run(runner.submit(feedback)) for _ in range(2)]
+
+        with pytest.raises(JobQueueFullError):
+            asyncio.run(runner.submit(feedback))
+
+        release.set()
+        for job in jobs:
+            assert asyncio.run(runner.wait(job.id, timeout=5)).status == "succeeded"
+        assert asyncio.run(runner.submit(feedback)).status == "pending"
+
+    def test_wait_times_out(self, runner: JobRunner, feedback: Feedback, mock_action: MagicMock):
+        release = threading.Event()
+        mock_action.side_effect = lambda _: release.wait(5)
+
+        job = asyncio.run(runner.submit(feedback))
+
+        assert asyncio.run(runner.wait(job.id, timeout=0.01)).status in ("pending", "running")
+        assert asyncio.run(runner.wait("unknown", timeout=1)) is None
+        release.set()
+
+    def test_singleton_instance(self):
+        assert isinstance(job_runner, JobRunner)
+        assert isinstance(job_runner.store, MemoryJobStore)
+
+    def test_store_is_used_off_the_event_loop(self, runner: JobRunner, feedback: Feedback):
+        async def run():
+            with patch(
+                "src.jobs.job_runner.asyncio.to_thread", wraps=asyncio.to_thread
+            ) as to_thread:
+                job = await runner.submit(feedback)
+                await runner.get(job.id)
+            return [call.args[0] for call in to_thread.call_args_list]
+
+        with patch("src.jobs.job_runner.GenerateFeedbackResponse"):
+            assert asyncio.run(run()) == [runner.store.set, runner.store.get]
@@ -0,0 +1,45 @@
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.dtos import JobResponse, SentimentResponse
+from src.jobs.job_store import JobStore, MemoryJobStore, SQLiteJobStore
+
+
+class TestJobStores:
+    """
+    Memory and SQLite job store tests.
+    """
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path) -> JobStore:
+        if request.param == "sqlite":
+            return SQLiteJobStore(path=str(tmp_path / "jobs" / "jobs.db"), ttl=10)
+        return MemoryJobStore(ttl=10)
+
+    @pytest.fixture
+    def mock_time(self) -> Generator[MagicMock, None, None]:
+        with patch("src.jobs.job_store.time.time", return_value=100.0) as mock:
+            yield mock
+
+    def test_set_and_get(self, store: JobStore):
+        assert store.get("job") is None
+
+        store.set(JobResponse(id="job", status="pending"))
+        result = SentimentResponse(
+            feedback="Great!", sentiment="POSITIVE", response="Thanks!", audio="a.mp3"
+        )
+        store.set(JobResponse(id="job", status="succeeded", result=result))
+
+        assert store.get("job") == JobResponse(id="job", status="succeeded", result=result)
+
+    def test_sqlite_jobs_are_shared_and_expire(self, tmp_path, mock_time: MagicMock):
+        path = str(tmp_path / "jobs.db")
+        SQLiteJobStore(path=path, ttl=10).set(JobResponse(id="job", status="running"))
+
+        other_process = SQLiteJobStore(path=path, ttl=10)
+        assert other_process.get("job").status == "running"
+
+        mock_time.return_value = 110.0
+        assert other_process.get("job") is None
@@ -14,6 +14,16 @@ class TestAzureAIServices:
         assert settings.endpoint == "test_ai_services_endpoint"
         assert settings.region == "test_ai_services_region"
         assert settings.audio_path == "test_audio_path"
+        assert settings.audio_format == "mp3-high"
+        assert settings.audio_content_addressed is False
+        assert settings.audio_streaming is False
+        assert settings.audio_stream_save is True
+        assert settings.speech_max_concurrency == 4
+        assert settings.speech_pool_size == 0
+        assert settings.sentiment_batch_window_ms == 0
+        assert settings.sentiment_cache_enabled is False
+        assert settings.sentiment_cache_max_entries == 10000
+        assert settings.sentiment_cache_ttl == 3600
 
     def test_settings_immutability(self) -> None:
         """Ensure settings are immutable after creation."""
@@ -18,6 +18,16 @@ class TestAzureOpenAI:
         assert settings.temperature == 0.7
         assert settings.max_tokens == 50
         assert settings.system_prompt == "test_system_prompt"
+        assert settings.max_concurrency == 5
+        assert settings.cache_enabled is False
+        assert settings.cache_max_entries == 1000
+        assert settings.cache_ttl == 86400
+        assert settings.cache_path is None
+        assert settings.hedge_enabled is False
+        assert settings.hedge_percentile == 95
+        assert settings.hedge_max_rate == 0.05
+        assert settings.hedge_initial_delay == 2
+        assert settings.hedge_deployment is None
 
     def test_settings_immutability(self) -> None:
         """Ensure settings are immutable after creation."""
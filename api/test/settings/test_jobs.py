@@ -0,0 +1,29 @@
+import pytest
+from pydantic import ValidationError
+from src.settings.jobs import Jobs
+
+
+class TestJobs:
+    """Unit tests for Jobs settings."""
+
+    def test_settings(self) -> None:
+        """Test that the job settings defaults are being loaded as expected."""
+        settings = Jobs()
+
+        assert settings.store == "memory"
+        assert settings.sqlite_path == "jobs.db"
+        assert settings.max_workers == 4
+        assert settings.max_pending == 100
+        assert settings.ttl == 3600
+
+    def test_invalid_store(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Ensure only the supported job stores are accepted."""
+        monkeypatch.setenv("JOBS_STORE", "redis")
+        with pytest.raises(ValidationError):
+            Jobs()
+
+    def test_settings_immutability(self) -> None:
+        """Ensure settings are immutable after creation."""
+        settings = Jobs()
+        with pytest.raises(ValidationError):
+            settings.max_workers = 8
@@ -0,0 +1,26 @@
+import pytest
+from pydantic import ValidationError
+from src.settings.resilience import Resilience
+
+
+class TestResilience:
+    """Unit tests for Resilience settings."""
+
+    def test_settings(self) -> None:
+        """Test that the resilience settings defaults are being loaded as expected."""
+        settings = Resilience()
+
+        assert settings.enabled is True
+        assert settings.load_shedding is False
+        assert settings.failure_threshold == 5
+        assert settings.reset_timeout == 30
+        assert settings.initial_limit == 20
+        assert settings.min_limit == 1
+        assert settings.max_limit == 100
+        assert settings.latency_target == 0
+
+    def test_settings_immutability(self) -> None:
+        """Ensure settings are immutable after creation."""
+        settings = Resilience()
+        with pytest.raises(ValidationError):
+            settings.enabled = False
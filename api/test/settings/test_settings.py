@@ -3,6 +3,10 @@ from pydantic import ValidationError
 from src.settings.settings import Settings
 from src.settings.azure_openai import AzureOpenAI
 from src.settings.azure_ai_services import AzureAIServices
+from src.settings.jobs import Jobs
+from src.settings.health import Health
+from src.settings.resilience import Resilience
+from src.settings.storage import Storage
 
 
 class TestSettings:
@@ -13,6 +17,13 @@ class TestSettings:
         settings = Settings()
         assert isinstance(settings.azure_openai, AzureOpenAI)
         assert isinstance(settings.azure_ai_services, AzureAIServices)
+        assert isinstance(settings.jobs, Jobs)
+        assert isinstance(settings.health, Health)
+        assert isinstance(settings.resilience, Resilience)
+        assert isinstance(settings.storage, Storage)
+        assert settings.health.interval == 30
+        assert settings.health.timeout == 5
+        assert settings.health.text_analytics_probe is False
         assert settings.prompt == "test_prompt_file"
 
     def test_settings_immutability(self) -> None:
@@ -0,0 +1,28 @@
+import pytest
+from pydantic import ValidationError
+from src.settings.storage import Storage
+
+
+class TestStorage:
+    """Unit tests for Storage settings."""
+
+    def test_settings(self) -> None:
+        """Test that the audio store settings defaults are being loaded as expected."""
+        settings = Storage()
+
+        assert settings.backend == "local"
+        assert settings.hot_tier is False
+        assert settings.memory_max_mb == 64
+        assert settings.blob_connection_string is None
+        assert settings.blob_container == "audio"
+        assert settings.retention_max_age == 0
+        assert settings.retention_max_mb == 0
+        assert settings.retention_interval == 300
+        assert settings.url_signing_key is None
+        assert settings.url_ttl == 300
+
+    def test_settings_immutability(self) -> None:
+        """Ensure settings are immutable after creation."""
+        settings = Storage()
+        with pytest.raises(ValidationError):
+            settings.backend = "blob"
@@ -0,0 +1,37 @@
+from urllib.parse import parse_qs, urlsplit
+
+from src.settings.storage import Storage
+from src.storage import AudioLinks
+from src.storage.store import _get_audio_links
+
+
+class TestAudioLinks:
+    """Unit tests for the audio download links."""
+
+    def test_unsigned_links(self):
+        links = AudioLinks(key=None, ttl=300)
+
+        assert links.url("a.mp3") == "/audio/a.mp3"
+        assert links.verify("a.mp3", None, None)
+
+    def test_signed_links(self):
+        links = AudioLinks(key="secret", ttl=300)
+
+        url = urlsplit(links.url("a.mp3", now=1000))
+        query = parse_qs(url.query)
+        expires, signature = int(query["expires"][0]), query["signature"][0]
+
+        assert url.path == "/audio/a.mp3"
+        assert expires == 1300
+        assert links.verify("a.mp3", expires, signature, now=1300)
+        assert not links.verify("a.mp3", expires, signature, now=1301)
+        assert not links.verify("b.mp3", expires, signature, now=1000)
+        assert not links.verify("a.mp3", expires + 1, signature, now=1000)
+        assert not links.verify("a.mp3", None, None, now=1000)
+        assert not AudioLinks(key="other", ttl=300).verify("a.mp3", expires, signature, now=1000)
+
+    def test_links_from_settings(self):
+        assert not _get_audio_links(Storage()).signed
+        links = _get_audio_links(Storage(AUDIO_URL_SIGNING_KEY="secret", AUDIO_URL_TTL=60))
+        assert links.signed
+        assert links.ttl == 60
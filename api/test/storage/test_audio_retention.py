@@ -0,0 +1,152 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.settings.storage import Storage
+from src.storage import AudioRetention, LocalAudioStore, MemoryAudioStore
+from src.storage.store import _get_audio_retention
+
+
+class TestAudioRetention:
+    """
+    Local audio retention sweep tests.
+    """
+
+    @pytest.fixture
+    def store(self, tmp_path) -> LocalAudioStore:
+        return LocalAudioStore(path=str(tmp_path))
+
+    def _write(self, store: LocalAudioStore, partition: str, name: str, size: int, age: float):
+        directory = os.path.join(store.path, partition)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, name)
+        with open(path, "wb") as audio_file:
+            audio_file.write(b"a" * size)
+        accessed = time.time() - age
+        os.utime(path, (accessed, accessed))
+        return path
+
+    def _hour(self, hours_ago: int) -> str:
+        hour = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        return hour.strftime("%Y-%m-%dT%H")
+
+    def test_expired_partitions_and_files_are_removed(self, store: LocalAudioStore):
+        old = self._hour(3)
+        recent = self._hour(0)
+        self._write(store, old, "a.mp3", 10, age=3 * 3600)
+        self._write(store, old, "b.mp3", 20, age=3 * 3600)
+        kept = self._write(store, recent, "c.mp3", 30, age=0)
+        self._write(store, "shared", "expired.mp3", 40, age=3 * 3600)
+        shared = self._write(store, "shared", "fresh.mp3", 50, age=0)
+        self._write(store, "", "legacy.mp3", 60, age=3 * 3600)
+        self._write(store, "shared", "x.mp3.0123.part", 70, age=3 * 3600)
+
+        retention = AudioRetention(store=store, max_age=7200, max_bytes=0, interval=60)
+        retention.sweep()
+
+        assert not os.path.exists(os.path.join(store.path, old))
+        assert sorted(os.listdir(store.path)) == sorted([recent, "shared"])
+        assert os.listdir(os.path.join(store.path, "shared")) == ["fresh.mp3"]
+        assert os.path.isfile(kept) and os.path.isfile(shared)
+        stats = retention.stats()
+        assert stats["partitions_removed"] == 1
+        assert stats["files_removed"] == 5
+        assert stats["bytes_reclaimed"] == 10 + 20 + 40 + 60 + 70
+        assert stats["bytes"] == 30 + 50
+
+    def test_quota_evicts_least_recently_accessed(self, store: LocalAudioStore):
+        partition = self._hour(1)
+        self._write(store, partition, "oldest.mp3", 100, age=300)
+        self._write(store, "shared", "older.mp3", 100, age=200)
+        self._write(store, partition, "newer.mp3", 100, age=100)
+        self._write(store, "shared", "newest.mp3", 100, age=0)
+
+        retention = AudioRetention(store=store, max_age=0, max_bytes=250, interval=60)
+        retention.sweep()
+
+        remaining = sorted(
+            name for _, _, names in os.walk(store.path) for name in names
+        )
+        assert remaining == ["newer.mp3", "newest.mp3"]
+        assert retention.stats()["bytes"] == 200
+        assert retention.stats()["bytes_reclaimed"] == 200
+
+    def test_emptied_past_partitions_are_removed(self, store: LocalAudioStore):
+        partition = self._hour(1)
+        self._write(store, partition, "a.mp3", 100, age=0)
+
+        AudioRetention(store=store, max_age=0, max_bytes=10, interval=60).sweep()
+
+        assert os.listdir(store.path) == []
+
+    def test_removed_files_are_evicted_from_the_hot_tier(self, store: LocalAudioStore):
+        hot_tier = MemoryAudioStore(max_bytes=1000)
+        for filename in ["partitioned.mp3", "expired.mp3", "kept.mp3"]:
+            hot_tier.put(filename, b"a" * 10)
+        self._write(store, self._hour(3), "partitioned.mp3", 10, age=3 * 3600)
+        self._write(store, "shared", "expired.mp3", 10, age=3 * 3600)
+
+        retention = AudioRetention(
+            store=store, max_age=7200, max_bytes=0, interval=60, hot_tier=hot_tier
+        )
+        retention.sweep()
+
+        assert not hot_tier.exists("partitioned.mp3")
+        assert not hot_tier.exists("expired.mp3")
+        assert hot_tier.get("kept.mp3") == b"a" * 10
+        assert hot_tier.stats()["bytes"] == 10
+
+    def test_missing_directory(self, tmp_path):
+        retention = AudioRetention(
+            store=LocalAudioStore(path=str(tmp_path / "missing")),
+            max_age=60,
+            max_bytes=0,
+            interval=60,
+        )
+
+        retention.sweep()
+
+        assert retention.stats()["sweeps"] == 1
+
+    def test_background_sweeps(self, store: LocalAudioStore):
+        self._write(store, "shared", "expired.mp3", 10, age=3600)
+        retention = AudioRetention(store=store, max_age=60, max_bytes=0, interval=0.01)
+
+        retention.start()
+        try:
+            deadline = time.monotonic() + 5
+            while retention.stats()["files_removed"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            retention.stop()
+
+        assert retention.stats()["files_removed"] == 1
+
+
+class TestGetAudioRetention:
+    """
+    Audio retention factory tests.
+    """
+
+    def test_disabled_without_limits(self):
+        assert _get_audio_retention(Storage(), LocalAudioStore(path="audio")) is None
+
+    def test_local_store_behind_the_hot_tier(self):
+        backend = LocalAudioStore(path="audio")
+        hot_tier = MemoryAudioStore(max_bytes=10, backend=backend)
+        retention = _get_audio_retention(
+            Storage(AUDIO_RETENTION_MAX_AGE=60, AUDIO_RETENTION_MAX_MB=1), hot_tier
+        )
+
+        assert retention.store is backend
+        assert retention.hot_tier is hot_tier
+        assert retention.max_age == 60
+        assert retention.max_bytes == 1024 * 1024
+
+    def test_not_for_memory_store(self):
+        assert (
+            _get_audio_retention(Storage(AUDIO_RETENTION_MAX_AGE=60), MemoryAudioStore(max_bytes=10))
+            is None
+        )
@@ -0,0 +1,186 @@
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from uuid_extensions import uuid7str
+
+from src.settings.storage import Storage
+from src.storage import LocalAudioStore, MemoryAudioStore
+from src.storage.store import _get_audio_store
+
+
+class TestLocalAudioStore:
+    """
+    Local directory audio store tests.
+    """
+
+    @pytest.fixture
+    def store(self, tmp_path) -> LocalAudioStore:
+        return LocalAudioStore(path=str(tmp_path / "audio"))
+
+    def test_put_get_delete(self, store: LocalAudioStore):
+        assert not store.exists("a.mp3")
+        assert store.get("a.mp3") is None
+
+        store.put("a.mp3", b"audio")
+        store.put("a.mp3", b"new audio")
+
+        assert store.exists("a.mp3")
+        assert store.get("a.mp3") == b"new audio"
+        assert os.listdir(os.path.join(store.path, "shared")) == ["a.mp3"]
+
+        store.delete("a.mp3")
+        store.delete("a.mp3")
+
+        assert not store.exists("a.mp3")
+
+    def test_uuid7_files_are_partitioned_by_hour(self, store: LocalAudioStore):
+        before = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+        filename = f"{uuid7str()}.mp3"
+        after = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+
+        store.put(filename, b"audio")
+
+        assert store.partition(filename) in (before, after)
+        assert os.path.isfile(os.path.join(store.path, store.partition(filename), filename))
+        assert store.partition(f"{uuid.uuid4()}.mp3") == "shared"
+        assert store.partition(f"{'0' * 64}.mp3") == "shared"
+
+    def test_reads_unpartitioned_files(self, store: LocalAudioStore):
+        os.makedirs(store.path)
+        with open(os.path.join(store.path, "old.mp3"), "wb") as audio_file:
+            audio_file.write(b"audio")
+
+        assert store.exists("old.mp3")
+        assert store.get("old.mp3") == b"audio"
+
+        store.delete("old.mp3")
+
+        assert not store.exists("old.mp3")
+
+    def test_reads_update_the_access_time(self, store: LocalAudioStore):
+        store.put("a.mp3", b"audio")
+        path = os.path.join(store.path, "shared", "a.mp3")
+        os.utime(path, (1000, 1000))
+
+        store.get("a.mp3")
+
+        assert os.stat(path).st_atime > 1000
+        assert os.stat(path).st_mtime == 1000
+
+    def test_open_file(self, store: LocalAudioStore):
+        assert store.open_file("a.mp3") is None
+
+        store.put("a.mp3", b"audio")
+        path = os.path.join(store.path, "shared", "a.mp3")
+        os.utime(path, (1000, 1000))
+
+        with store.open_file("a.mp3") as audio_file:
+            assert audio_file.read() == b"audio"
+        assert os.stat(path).st_atime > 1000
+
+
+class TestMemoryAudioStore:
+    """
+    In-memory LRU audio store tests.
+    """
+
+    def test_evicts_least_recently_used(self):
+        store = MemoryAudioStore(max_bytes=10)
+
+        store.put("a.mp3", b"aaaa")
+        store.put("b.mp3", b"bbbb")
+        assert store.get("a.mp3") == b"aaaa"
+        store.put("c.mp3", b"cccc")
+
+        assert store.get("b.mp3") is None
+        assert store.exists("a.mp3") and store.exists("c.mp3")
+        assert store.stats() == {
+            "type": "MemoryAudioStore",
+            "entries": 2,
+            "bytes": 8,
+            "max_bytes": 10,
+            "hits": 1,
+            "misses": 1,
+        }
+
+    def test_oversized_audio_is_not_kept(self):
+        store = MemoryAudioStore(max_bytes=4)
+
+        store.put("a.mp3", b"aaaaa")
+
+        assert not store.exists("a.mp3")
+        assert store.stats()["bytes"] == 0
+
+    def test_hot_tier_writes_through(self, tmp_path):
+        backend = LocalAudioStore(path=str(tmp_path))
+        store = MemoryAudioStore(max_bytes=4, backend=backend)
+
+        store.put("a.mp3", b"aaaa")
+        store.put("b.mp3", b"bbbb")
+
+        assert backend.get("a.mp3") == b"aaaa"
+        assert store.get("a.mp3") == b"aaaa"
+        assert store.get("b.mp3") == b"bbbb"
+        assert (store.hits, store.misses) == (1, 1)
+        assert store.stats()["backend"] == {"type": "LocalAudioStore"}
+
+        store.delete("b.mp3")
+
+        assert not store.exists("b.mp3")
+        assert not backend.exists("b.mp3")
+
+    def test_hot_tier_reads_update_the_backend_access_time(self, tmp_path):
+        backend = LocalAudioStore(path=str(tmp_path))
+        store = MemoryAudioStore(max_bytes=4, backend=backend)
+        store.put("a.mp3", b"aaaa")
+        path = os.path.join(backend.path, "shared", "a.mp3")
+        os.utime(path, (1000, 1000))
+
+        assert store.get("a.mp3") == b"aaaa"
+
+        assert store.hits == 1
+        assert os.stat(path).st_atime > 1000
+        assert os.stat(path).st_mtime == 1000
+
+    def test_hot_tier_opens_backend_files_missing_from_memory(self, tmp_path):
+        backend = LocalAudioStore(path=str(tmp_path))
+        store = MemoryAudioStore(max_bytes=4, backend=backend)
+
+        store.put("a.mp3", b"aaaa")
+        store.put("b.mp3", b"bbbb")
+
+        assert store.open_file("b.mp3") is None
+        with store.open_file("a.mp3") as audio_file:
+            assert audio_file.read() == b"aaaa"
+        assert MemoryAudioStore(max_bytes=4).open_file("a.mp3") is None
+
+
+class TestGetAudioStore:
+    """
+    Audio store factory tests.
+    """
+
+    def test_local_store(self):
+        store = _get_audio_store(Storage(), "audio")
+
+        assert isinstance(store, LocalAudioStore)
+        assert store.path == "audio"
+
+    def test_memory_store(self):
+        store = _get_audio_store(Storage(AUDIO_STORE="memory", AUDIO_STORE_MEMORY_MAX_MB=1), "audio")
+
+        assert isinstance(store, MemoryAudioStore)
+        assert store.max_bytes == 1024 * 1024
+        assert store.backend is None
+
+    def test_hot_tier(self):
+        store = _get_audio_store(Storage(AUDIO_STORE_HOT_TIER=True), "audio")
+
+        assert isinstance(store, MemoryAudioStore)
+        assert isinstance(store.backend, LocalAudioStore)
+
+    def test_blob_store_requires_connection_string(self):
+        with pytest.raises(ValueError, match="AUDIO_STORE_BLOB_CONNECTION_STRING"):
+            _get_audio_store(Storage(AUDIO_STORE="blob"), "audio")
@@ -0,0 +1,49 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from uuid_extensions import uuid7str
+
+from src.storage import BlobAudioStore
+
+AZURITE_CONNECTION_STRING = os.environ.get("AZURITE_CONNECTION_STRING")
+
+
+class TestBlobAudioStore:
+    """
+    Azure Blob Storage audio store tests.
+
+    The round trip runs against the Azurite emulator when AZURITE_CONNECTION_STRING is set:
+
+        docker run -p 10000:10000 mcr.microsoft.com/azure-storage/azurite azurite-blob --blobHost 0.0.0.0
+    """
+
+    def test_requires_the_blob_package(self):
+        with patch("src.storage.blob_audio_store.BlobServiceClient", None):
+            with pytest.raises(ImportError, match="azure-storage-blob"):
+                BlobAudioStore(connection_string="UseDevelopmentStorage=true", container="audio")
+
+    @pytest.mark.skipif(
+        not AZURITE_CONNECTION_STRING, reason="AZURITE_CONNECTION_STRING is not set"
+    )
+    def test_put_get_delete(self):
+        pytest.importorskip("azure.storage.blob")
+        store = BlobAudioStore(
+            connection_string=AZURITE_CONNECTION_STRING, container=f"test-{uuid7str()}"
+        )
+
+        try:
+            assert not store.exists("a.mp3")
+            assert store.get("a.mp3") is None
+
+            store.put("a.mp3", b"audio")
+
+            assert store.exists("a.mp3")
+            assert store.get("a.mp3") == b"audio"
+
+            store.delete("a.mp3")
+            store.delete("a.mp3")
+
+            assert not store.exists("a.mp3")
+        finally:
+            store.container.delete_container()
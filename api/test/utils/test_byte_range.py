@@ -0,0 +1,58 @@
+import pytest
+
+from src.utils.byte_range import (
+    RangeNotSatisfiableError,
+    etag_matches,
+    parse_byte_range,
+)
+
+
+class TestParseByteRange:
+    """
+    Range header parsing tests.
+    """
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=900-5000", (900, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=0-0", (0, 0)),
+        ],
+    )
+    def test_single_ranges(self, header: str, expected):
+        assert parse_byte_range(header, 1000) == expected
+
+    @pytest.mark.parametrize(
+        "header", ["bytes=0-1,5-9", "items=0-1", "bytes=-", "bytes=9-1", "bytes=a-b"]
+    )
+    def test_unsupported_ranges_are_ignored(self, header: str):
+        assert parse_byte_range(header, 1000) is None
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+    def test_unsatisfiable_ranges(self, header: str):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_byte_range(header, 1000)
+
+
+class TestEtagMatches:
+    """
+    If-None-Match comparison tests.
+    """
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, False),
+            ('"other"', False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"other", "abc"', True),
+            ("*", True),
+        ],
+    )
+    def test_matches(self, header, expected: bool):
+        assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,85 @@
+import time
+import threading
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.health_monitor import HealthMonitor
+
+
+class TestHealthMonitor:
+    """
+    Background health monitor tests.
+    """
+
+    @pytest.fixture
+    def mock_logger(self) -> Generator[MagicMock, None, None]:
+        with patch("src.utils.health_monitor.logger") as mock:
+            yield mock
+
+    def test_status_before_first_check(self):
+        monitor = HealthMonitor(probes={"service": MagicMock()}, interval=10, timeout=1)
+
+        assert monitor.status() == {
+            "service": {"healthy": False, "age": None, "latency": None, "error": "Not checked yet"}
+        }
+
+    def test_probes_run_in_parallel_with_timeout(self, mock_logger: MagicMock):
+        release = threading.Event()
+        healthy = MagicMock()
+        failing = MagicMock(side_effect=Exception("Connection refused"))
+
+        monitor = HealthMonitor(
+            probes={
+                "healthy": healthy,
+                "failing": failing,
+                "hanging": lambda timeout: release.wait(5),
+            },
+            interval=10,
+            timeout=0.05,
+        )
+
+        start = time.monotonic()
+        monitor.check()
+        elapsed = time.monotonic() - start
+        release.set()
+
+        status = monitor.status()
+        assert elapsed < 1
+        healthy.assert_called_once_with(0.05)
+        assert status["healthy"]["healthy"] is True
+        assert status["healthy"]["age"] >= 0
+        assert status["failing"] == {
+            **status["failing"], "healthy": False, "error": "Connection refused"
+        }
+        assert status["hanging"]["healthy"] is False
+        assert status["hanging"]["error"] == "Timed out after 0.05 s"
+        assert mock_logger.error.call_count == 2
+
+    def test_stale_results_are_unhealthy(self):
+        monitor = HealthMonitor(probes={"service": MagicMock()}, interval=1, timeout=1)
+        monitor.check()
+
+        with patch("src.utils.health_monitor.time.monotonic", return_value=time.monotonic() + 5):
+            status = monitor.status()
+
+        assert status["service"]["healthy"] is False
+        assert status["service"]["error"] == "Result is stale"
+
+    def test_background_probing(self):
+        probed = threading.Event()
+        monitor = HealthMonitor(
+            probes={"service": lambda timeout: probed.set()}, interval=10, timeout=1
+        )
+
+        monitor.start()
+        monitor.start()
+
+        assert probed.wait(1)
+        deadline = time.monotonic() + 1
+        while not monitor.status()["service"]["healthy"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        monitor.stop()
+
+        assert monitor.status()["service"]["healthy"] is True
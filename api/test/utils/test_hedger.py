@@ -0,0 +1,113 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.utils.hedger import MIN_SAMPLES, Hedger
+
+
+class TestHedger:
+    """
+    Request hedging utility tests.
+    """
+
+    @pytest.fixture
+    def calls(self) -> List[str]:
+        return []
+
+    def _call(self, calls: List[str], name: str, delay: float, error: bool = False):
+        async def call():
+            calls.append(name)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                calls.append(f"{name} cancelled")
+                raise
+            if error:
+                raise ValueError(f"{name} failed")
+            return name
+
+        return call
+
+    def test_fast_call_is_not_hedged(self, calls: List[str]):
+        hedger = Hedger(percentile=95, max_rate=1, initial_delay=0.1)
+
+        result = asyncio.run(
+            hedger(self._call(calls, "first", 0), self._call(calls, "hedge", 0))
+        )
+
+        assert result == "first"
+        assert calls == ["first"]
+        assert hedger.stats() == {"calls": 1, "hedged": 0, "hedge_wins": 0, "delay": 0.1}
+
+    def test_slow_call_is_hedged_and_cancelled(self, calls: List[str]):
+        hedger = Hedger(percentile=95, max_rate=1, initial_delay=0.01)
+
+        result = asyncio.run(
+            hedger(self._call(calls, "first", 1), self._call(calls, "hedge", 0))
+        )
+
+        assert result == "hedge"
+        assert calls == ["first", "hedge", "first cancelled"]
+        assert (hedger.hedged, hedger.hedge_wins) == (1, 1)
+
+    def test_failed_hedge_waits_for_the_first_call(self, calls: List[str]):
+        hedger = Hedger(percentile=95, max_rate=1, initial_delay=0.01)
+
+        result = asyncio.run(
+            hedger(self._call(calls, "first", 0.05), self._call(calls, "hedge", 0, error=True))
+        )
+
+        assert result == "first"
+        assert (hedger.hedged, hedger.hedge_wins) == (1, 0)
+
+    def test_raises_the_first_error_when_every_call_fails(self, calls: List[str]):
+        hedger = Hedger(percentile=95, max_rate=1, initial_delay=0.01)
+
+        with pytest.raises(ValueError, match="first failed"):
+            asyncio.run(
+                hedger(
+                    self._call(calls, "first", 0.02, error=True),
+                    self._call(calls, "hedge", 0, error=True),
+                )
+            )
+
+    def test_hedge_rate_is_capped(self, calls: List[str]):
+        hedger = Hedger(percentile=95, max_rate=0.25, initial_delay=0.001)
+
+        async def run():
+            for _ in range(8):
+                await hedger(self._call(calls, "first", 0.01), self._call(calls, "hedge", 1))
+
+        asyncio.run(run())
+
+        assert hedger.calls == 8
+        assert hedger.hedged == 2
+
+    def test_delay_follows_the_latency_percentile(self):
+        hedger = Hedger(percentile=90, max_rate=0, initial_delay=5)
+
+        async def run(latency: float):
+            async def call():
+                return latency
+
+            await hedger(call, call)
+
+        for _ in range(MIN_SAMPLES):
+            asyncio.run(run(0))
+        assert hedger.delay() < 5
+
+        hedger._latencies.extend(i / 100 for i in range(100))
+        assert hedger.delay() == 0.9
+
+    def test_hedge_wins_do_not_shrink_the_delay(self, calls: List[str]):
+        hedger = Hedger(percentile=50, max_rate=1, initial_delay=0.02)
+
+        for _ in range(MIN_SAMPLES):
+            result = asyncio.run(
+                hedger(self._call(calls, "first", 1), self._call(calls, "hedge", 0))
+            )
+            assert result == "hedge"
+
+        assert hedger.hedge_wins == MIN_SAMPLES
+        assert hedger.delay() >= 0.02
@@ -0,0 +1,73 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.utils.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """
+    Micro-batching utility tests.
+    """
+
+    @pytest.fixture
+    def sent_batches(self) -> List[List[str]]:
+        return []
+
+    @pytest.fixture
+    def batcher(self, sent_batches: List[List[str]]) -> MicroBatcher:
+        async def process_batch(items: List[str]):
+            sent_batches.append(items)
+            return [
+                ValueError(f"bad {item}") if item.startswith("bad") else item.upper()
+                for item in items
+            ]
+
+        return MicroBatcher(process_batch, window=0.01, max_batch_size=3)
+
+    def test_coalesces_concurrent_items(
+        self, batcher: MicroBatcher, sent_batches: List[List[str]]
+    ):
+        async def run():
+            return await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+        assert asyncio.run(run()) == ["A", "B"]
+        assert sent_batches == [["a", "b"]]
+        assert (batcher.batches, batcher.items) == (1, 2)
+
+    def test_flushes_full_batches_immediately(
+        self, batcher: MicroBatcher, sent_batches: List[List[str]]
+    ):
+        async def run():
+            return await asyncio.gather(*(batcher.submit(item) for item in "abcde"))
+
+        assert asyncio.run(run()) == ["A", "B", "C", "D", "E"]
+        assert sent_batches == [["a", "b", "c"], ["d", "e"]]
+
+    def test_each_caller_gets_its_own_error(self, batcher: MicroBatcher):
+        async def run():
+            return await asyncio.gather(
+                batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+            )
+
+        good, bad = asyncio.run(run())
+
+        assert good == "GOOD"
+        assert isinstance(bad, ValueError)
+        assert str(bad) == "bad bad"
+
+    def test_batch_failure_reaches_every_caller(self):
+        async def process_batch(items: List[str]):
+            raise RuntimeError("Service unavailable")
+
+        batcher = MicroBatcher(process_batch, window=0.01, max_batch_size=10)
+
+        async def run():
+            return await asyncio.gather(
+                batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, RuntimeError) for result in results)
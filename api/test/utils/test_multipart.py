@@ -0,0 +1,30 @@
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from src.utils import encode_multipart
+
+
+class TestEncodeMultipart:
+    def test_encode_multipart(self):
+        content_type, body = encode_multipart(
+            [
+                ({"Content-Type": "application/json"}, b'{"a": 1}'),
+                ({"Content-Type": "audio/mpeg"}, b"\r\n--audio\r\n"),
+            ]
+        )
+
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        parts = list(message.iter_parts())
+
+        assert message.get_content_type() == "multipart/mixed"
+        assert [part.get_content_type() for part in parts] == ["application/json", "audio/mpeg"]
+        assert parts[0].get_payload(decode=True) == b'{"a": 1}'
+        assert parts[1].get_payload(decode=True) == b"\r\n--audio\r\n"
+
+    def test_boundary_is_unique(self):
+        first, _ = encode_multipart([({}, b"")])
+        second, _ = encode_multipart([({}, b"")])
+
+        assert first != second
@@ -1,7 +1,8 @@
+import os
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
-from src.utils.prompt import Prompt
 import yaml
+from src.utils.prompt import Prompt
+from src.utils.prompt_registry import PromptRegistry
 
 
 class TestPrompt:
@@ -11,7 +12,7 @@ class TestPrompt:
     @pytest.fixture
     def mock_prompts_dict(self):
         """
-        Mocked _load_prompts() data.
+        Prompt templates written to the test prompts file.
         """
         return {
             "POSITIVE": "Positive: {feedback_text}",
@@ -20,16 +21,17 @@ class TestPrompt:
         }
 
     @pytest.fixture
-    def mock_file_load(self, mock_prompts_dict):
+    def prompts_file(self, tmp_path, mock_prompts_dict) -> str:
         """
-        Patches 'open' so that any attempt to open a file in 'src.utils.prompt'
-        will read from a mock YAML string instead of disk.
+        Prompts YAML file in a temporary directory.
         """
-        mock_yaml_dict = {"llm_prompts": mock_prompts_dict}
-        mock_yaml_str = yaml.safe_dump(mock_yaml_dict)
+        path = tmp_path / "prompts.yaml"
+        path.write_text(yaml.safe_dump({"llm_prompts": mock_prompts_dict}))
+        return str(path)
 
-        with patch("src.utils.prompt.open", mock_open(read_data=mock_yaml_str)) as mocked_file:
-            yield mocked_file
+    @pytest.fixture
+    def registry(self, prompts_file: str) -> PromptRegistry:
+        return PromptRegistry(path=prompts_file)
 
     @pytest.mark.parametrize(
         "sentiment, feedback_text, expected",
@@ -42,9 +44,61 @@ class TestPrompt:
     )
     def test_prompt_call(
         self,
-        mock_file_load: MagicMock,
+        registry: PromptRegistry,
         sentiment: str,
         feedback_text: str,
         expected: str
     ):
-        assert Prompt()(sentiment, feedback_text) == expected
+        assert Prompt(registry)(sentiment, feedback_text) == expected
+
+    def test_prompts_are_loaded_once(self, registry: PromptRegistry):
+        for _ in range(3):
+            Prompt(registry)("POSITIVE", "{not a field}")
+
+        assert registry.reloads == 1
+        assert Prompt(registry)("POSITIVE", "{not a field}") == "Positive: {not a field}"
+
+    def test_prompts_reload_when_file_changes(
+        self, registry: PromptRegistry, prompts_file: str, mock_prompts_dict
+    ):
+        Prompt(registry)("POSITIVE", "Great job!")
+
+        mock_prompts_dict["POSITIVE"] = "Thanks for {feedback_text}"
+        with open(prompts_file, "w") as file:
+            yaml.safe_dump({"llm_prompts": mock_prompts_dict}, file)
+        os.utime(prompts_file, ns=(0, os.stat(prompts_file).st_mtime_ns + 1))
+
+        assert Prompt(registry)("POSITIVE", "the feedback") == "Thanks for the feedback"
+        assert registry.reloads == 2
+
+    def test_invalid_reload_keeps_previous_prompts(
+        self, registry: PromptRegistry, prompts_file: str, mock_prompts_dict
+    ):
+        registry.load()
+
+        mock_prompts_dict["POSITIVE"] = "Positive: {feedback}"
+        with open(prompts_file, "w") as file:
+            yaml.safe_dump({"llm_prompts": mock_prompts_dict}, file)
+        os.utime(prompts_file, ns=(0, os.stat(prompts_file).st_mtime_ns + 1))
+
+        assert Prompt(registry)("POSITIVE", "Great job!") == "Positive: Great job!"
+        assert registry.reloads == 1
+
+    @pytest.mark.parametrize(
+        "prompts, error",
+        [
+            ({"POSITIVE": "{feedback_text}", "NEGATIVE": "{feedback_text}"}, "Missing prompts: NEUTRAL"),
+            ({"POSITIVE": "{sentiment}", "NEGATIVE": "", "NEUTRAL": ""}, "Unsupported prompt field: {sentiment}"),
+            ({"POSITIVE": "{feedback_text!r}", "NEGATIVE": "", "NEUTRAL": ""}, "Unsupported prompt field"),
+        ],
+    )
+    def test_invalid_prompts_are_rejected(self, tmp_path, prompts, error: str):
+        path = tmp_path / "prompts.yaml"
+        path.write_text(yaml.safe_dump({"llm_prompts": prompts}))
+
+        with pytest.raises(ValueError, match=error):
+            PromptRegistry(path=str(path)).load()
+
+    def test_missing_file_is_rejected(self, tmp_path):
+        with pytest.raises(OSError):
+            PromptRegistry(path=str(tmp_path / "missing.yaml")).load()
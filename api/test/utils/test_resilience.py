@@ -0,0 +1,182 @@
+import asyncio
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DependencyGuard,
+    DependencyUnavailableError,
+)
+
+
+class TestCircuitBreaker:
+    """
+    Circuit breaker tests.
+    """
+
+    @pytest.fixture
+    def mock_monotonic(self) -> Generator[MagicMock, None, None]:
+        with patch("src.utils.resilience.time.monotonic", return_value=100.0) as mock:
+            yield mock
+
+    @pytest.fixture
+    def breaker(self, mock_monotonic: MagicMock) -> CircuitBreaker:
+        return CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    def test_opens_after_consecutive_failures(self, breaker: CircuitBreaker):
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow() is None
+
+        breaker.record_failure()
+
+        assert breaker.allow() == 10
+        assert breaker.stats() == {"state": "open", "failures": 2, "rejected": 1, "opened": 1}
+
+    def test_half_open_trial(self, breaker: CircuitBreaker, mock_monotonic: MagicMock):
+        breaker.record_failure()
+        breaker.record_failure()
+        mock_monotonic.return_value = 110.0
+
+        assert breaker.allow() is None
+        assert breaker.state == "half_open"
+        assert breaker.allow() is not None
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.opened == 2
+
+        mock_monotonic.return_value = 120.0
+        assert breaker.allow() is None
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+
+class TestAdaptiveLimiter:
+    """
+    AIMD concurrency limiter tests.
+    """
+
+    def test_rejects_over_the_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=1, max_limit=10)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.stats() == {"limit": 2, "in_flight": 2, "rejected": 1}
+
+    def test_additive_increase_multiplicative_decrease(self):
+        limiter = AdaptiveLimiter(initial_limit=4, min_limit=1, max_limit=5)
+
+        for _ in range(8):
+            limiter.try_acquire()
+            limiter.release(success=True)
+        assert limiter.stats()["limit"] == 5
+
+        limiter.try_acquire()
+        limiter.release(success=False)
+        assert limiter.stats()["limit"] == 2
+
+        for _ in range(3):
+            limiter.try_acquire()
+            limiter.release(success=False)
+        assert limiter.stats()["limit"] == 1
+
+    def test_slow_calls_decrease_the_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=8, min_limit=1, max_limit=10, latency_target=1)
+
+        limiter.try_acquire()
+        limiter.release(success=True, latency=0.5)
+        assert limiter.stats()["limit"] == 8
+
+        limiter.try_acquire()
+        limiter.release(success=True, latency=2)
+        assert limiter.stats()["limit"] == 4
+
+        limiter.try_acquire()
+        limiter.release(success=None)
+        assert limiter.stats() == {"limit": 4, "in_flight": 0, "rejected": 0}
+
+
+class TestDependencyGuard:
+    """
+    Dependency guard tests.
+    """
+
+    @pytest.fixture
+    def guard(self) -> DependencyGuard:
+        return DependencyGuard(
+            name="Service",
+            breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30),
+            limiter=AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1),
+        )
+
+    def test_failure_opens_the_circuit(self, guard: DependencyGuard):
+        with pytest.raises(ValueError):
+            with guard():
+                raise ValueError("boom")
+
+        with pytest.raises(DependencyUnavailableError, match="Service is unavailable: circuit open") as error:
+            with guard():
+                pytest.fail("The dependency must not be called")
+
+        assert 29 < error.value.retry_after <= 30
+        assert guard.stats()["limiter"]["in_flight"] == 0
+
+    def test_concurrency_limit_fails_fast(self, guard: DependencyGuard):
+        with guard():
+            with pytest.raises(DependencyUnavailableError, match="concurrency limit reached"):
+                with guard():
+                    pass
+
+        assert guard.stats()["breaker"]["state"] == "closed"
+
+    def test_cancellation_is_not_a_failure(self, guard: DependencyGuard):
+        async def call():
+            with guard():
+                await asyncio.sleep(1)
+
+        async def run():
+            task = asyncio.ensure_future(call())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert guard.stats()["breaker"]["state"] == "closed"
+        assert guard.stats()["limiter"]["in_flight"] == 0
+
+    def test_no_limiter_never_sheds_load(self):
+        guard = DependencyGuard(
+            name="Service",
+            breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30),
+            limiter=None,
+        )
+
+        with guard():
+            with guard():
+                pass
+
+        assert guard.stats()["limiter"] is None
+        assert guard.stats()["breaker"]["state"] == "closed"
+
+    def test_disabled_guard(self):
+        guard = DependencyGuard(
+            name="Service",
+            breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30),
+            limiter=AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1),
+            enabled=False,
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                with guard():
+                    raise ValueError("boom")
+
+        assert guard.stats()["breaker"]["state"] == "closed"
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import sqlite3
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """
+    Two-tier response cache utility tests.
+    """
+
+    @pytest.fixture
+    def cache_path(self, tmp_path) -> str:
+        return os.path.join(tmp_path, "cache", "responses.sqlite")
+
+    @pytest.fixture
+    def mock_time(self) -> Generator[MagicMock, None, None]:
+        with patch("src.utils.response_cache.time.time", return_value=1000.0) as mock:
+            yield mock
+
+    def test_memory_only(self):
+        cache = ResponseCache(max_entries=10, ttl=60)
+
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "disk_hits": 0}
+
+    def test_disk_tier_survives_restarts(self, cache_path: str):
+        ResponseCache(max_entries=10, ttl=60, path=cache_path).set("key", "value")
+
+        restarted = ResponseCache(max_entries=10, ttl=60, path=cache_path)
+
+        assert restarted.get("key") == "value"
+        assert restarted.get("key") == "value"
+        assert restarted.stats() == {"entries": 1, "hits": 1, "misses": 1, "disk_hits": 1}
+
+    def test_disk_entries_expire(self, cache_path: str, mock_time: MagicMock):
+        ResponseCache(max_entries=10, ttl=60, path=cache_path).set("key", "value")
+
+        mock_time.return_value = 1060.0
+        restarted = ResponseCache(max_entries=10, ttl=60, path=cache_path)
+
+        assert restarted.get("key") is None
+
+    def test_async_disk_access_runs_off_the_event_loop(self, cache_path: str):
+        ResponseCache(max_entries=10, ttl=60, path=cache_path)
+        restarted = ResponseCache(max_entries=10, ttl=60, path=cache_path)
+
+        async def run():
+            with patch(
+                "src.utils.response_cache.asyncio.to_thread", wraps=asyncio.to_thread
+            ) as to_thread:
+                await ResponseCache(max_entries=10, ttl=60, path=cache_path).set_async(
+                    "key", "value"
+                )
+                value = await restarted.get_async("key")
+                assert await restarted.get_async("key") == "value"
+            return value, to_thread.call_count
+
+        # One write and one disk read; the second read is a memory hit.
+        assert asyncio.run(run()) == ("value", 2)
+
+    def test_expired_rows_are_purged_periodically(self, cache_path: str, mock_time: MagicMock):
+        cache = ResponseCache(max_entries=10, ttl=30, path=cache_path)
+        cache.set("old", "value")
+
+        mock_time.return_value = 1040.0
+        cache.set("new", "value")
+        assert self._disk_keys(cache_path) == ["new", "old"]
+
+        mock_time.return_value = 1060.0
+        cache.set("newer", "value")
+        assert self._disk_keys(cache_path) == ["new", "newer"]
+
+    def test_expiry_index(self, cache_path: str):
+        ResponseCache(max_entries=10, ttl=60, path=cache_path)
+
+        with sqlite3.connect(cache_path) as connection:
+            indexes = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'responses'"
+            ).fetchall()
+
+        assert ("responses_expires_at",) in indexes
+
+    @staticmethod
+    def _disk_keys(cache_path: str) -> list:
+        with sqlite3.connect(cache_path) as connection:
+            rows = connection.execute("SELECT key FROM responses ORDER BY key").fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,22 @@
+from src.utils.sentence_splitter import SentenceSplitter
+
+
+class TestSentenceSplitter:
+    """
+    Streamed sentence splitting tests.
+    """
+
+    def test_sentences_are_emitted_once_complete(self):
+        splitter = SentenceSplitter()
+
+        assert splitter.feed("Thank you") == []
+        assert splitter.feed("! It costs 3") == ["Thank you!"]
+        assert splitter.feed(".5 euros. Really?") == ["It costs 3.5 euros."]
+        assert splitter.feed(' "Yes." Bye') == ["Really?", '"Yes."']
+        assert splitter.flush() == "Bye"
+        assert splitter.flush() is None
+
+    def test_short_sentences_are_joined(self):
+        splitter = SentenceSplitter(min_length=10)
+
+        assert splitter.feed("Hi! Thanks for writing. ") == ["Hi! Thanks for writing."]
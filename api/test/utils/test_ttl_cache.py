@@ -0,0 +1,69 @@
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """
+    TTL and LRU cache utility tests.
+    """
+
+    @pytest.fixture
+    def mock_monotonic(self) -> Generator[MagicMock, None, None]:
+        with patch("src.utils.ttl_cache.time.monotonic", return_value=100.0) as mock:
+            yield mock
+
+    @pytest.fixture
+    def cache(self, mock_monotonic: MagicMock) -> TTLCache:
+        return TTLCache(max_entries=2, ttl=10)
+
+    def test_get_and_set(self, cache: TTLCache):
+        assert cache.get("key") is None
+
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_entries_expire(self, cache: TTLCache, mock_monotonic: MagicMock):
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 110.0
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+    def test_least_recently_used_entry_is_evicted(self, cache: TTLCache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop(self, cache: TTLCache, mock_monotonic: MagicMock):
+        cache.set("key", "value")
+        cache.set("expired", "value")
+
+        assert cache.pop("key") == "value"
+        assert cache.pop("key") is None
+
+        mock_monotonic.return_value = 110.0
+
+        assert cache.pop("expired") is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache: TTLCache):
+        cache.set("key", "value")
+        cache.get("key")
+
+        cache.clear()
+
+        assert cache.stats() == {"entries": 0, "hits": 0, "misses": 0}
@@ -0,0 +1,98 @@
+"""
+Latency of API calls with a fresh connection per call and with the shared session.
+
+A local stub API answers every request right away, so the numbers show the cost
+of opening a connection per call, which the shared connection pool avoids. Over
+TLS, and with the real API on another host, each new connection costs more.
+
+Usage (from the ui directory):
+    python -m benchmarks.api_client --requests 500 --concurrency 10
+"""
+import os
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from unittest.mock import patch
+
+os.environ.setdefault("API_URL", "http://127.0.0.1")
+
+import requests  # noqa: E402
+
+from src.api_client import APIClient  # noqa: E402
+from src.settings import settings  # noqa: E402
+
+AUDIO = b"\0" * 16 * 1024
+
+
+class StubAPI(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's algorithm
+    # delays every response on a kept-alive connection by the delayed ACK timer.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(AUDIO)))
+        self.end_headers()
+        self.wfile.write(AUDIO)
+
+    def log_message(self, *args):
+        pass
+
+
+def fresh_connection(api_url: str) -> Callable[[str], None]:
+    def get_audio(filename: str) -> None:
+        requests.get(f"{api_url}/audio/{filename}").raise_for_status()
+
+    return get_audio
+
+
+def shared_session(api_url: str) -> Callable[[str], None]:
+    with patch("src.api_client.settings", settings.model_copy(update={"api_url": api_url})):
+        client = APIClient()
+
+    def get_audio(filename: str) -> None:
+        client.get_audio(filename).raise_for_status()
+
+    return get_audio
+
+
+def run(get_audio: Callable[[str], None], requests: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    if concurrency == 1:
+        for _ in range(requests):
+            get_audio("audio.mp3")
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(get_audio, ["audio.mp3"] * requests))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}"
+
+    print(f"{args.requests} GET /audio requests, {len(AUDIO) // 1024} KiB each")
+    for concurrency in (1, args.concurrency):
+        for name, build in (("fresh", fresh_connection), ("shared", shared_session)):
+            elapsed = run(build(api_url), args.requests, concurrency)
+            print(
+                f"concurrency {concurrency:<3} {name:<7} {elapsed:7.2f} s  "
+                f"{elapsed / args.requests * 1000:6.2f} ms/request"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,44 @@
+import json
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.settings import settings
 
+# Gateway errors and throttling are worth another try; the API asks clients to
+# back off with Retry-After when a dependency is unavailable.
+RETRY_STATUSES = (429, 502, 503, 504)
+
 
 class APIClient():
+    """
+    SentioVoice API client shared by every Streamlit session.
+
+    Requests go through a single connection pool, so connections to the API are
+    kept alive and reused across reruns and sessions. `requests.Session` is not
+    thread safe, so each script thread gets its own session mounted on the shared
+    adapter and its pool.
+    """
     def __init__(self):
         self.api_url = settings.api_url
+        self.public_url = settings.api_public_url or settings.api_url
+        self.timeout = (settings.api_connect_timeout, settings.api_read_timeout)
+        self.adapter = self._get_adapter()
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, on the shared connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+        return session
 
     def post_feedback(
         self,
@@ -27,25 +60,118 @@ class APIClient():
             }
         """
         feedback_url = f"{self.api_url}/feedback"
-        response = requests.post(feedback_url, json={"feedback": feedback})
+        response = self.session.post(
+            feedback_url, json={"feedback": feedback}, timeout=self.timeout
+        )
         return response
 
+    def stream_feedback(
+        self,
+        feedback: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Send the feedback to the API and read its server-sent events as they arrive.
+
+        Args:
+            feedback (str): The feedback message.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: The event name and data, in order:
+            ("sentiment", {"sentiment": ...}), one ("token", {"token": ...}) per
+            response token, then ("audio", {"response": ..., "audio": ..., "audio_url": ...}),
+            or ("error", {"detail": ...}) on failure.
+
+        Raises:
+            requests.HTTPError: If the API refuses the feedback.
+        """
+        feedback_url = f"{self.api_url}/feedback/stream"
+        with self.session.post(
+            feedback_url, json={"feedback": feedback}, timeout=self.timeout, stream=True
+        ) as response:
+            response.raise_for_status()
+
+            event, data = None, []
+            for line in response.iter_lines():
+                line = line.decode("utf-8")
+                if not line:
+                    if data:
+                        yield event or "message", json.loads("\n".join(data))
+                    event, data = None, []
+                elif line.startswith(":"):
+                    continue
+                else:
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+
     def get_audio(
         self,
-        filename: str
+        filename: str,
+        stream: bool = False,
+        audio_url: Optional[str] = None
     ) -> requests.Response:
         """
         Download the audio file from the API.
 
         Args:
             audio_filename (str): The audio file name.
+            stream (bool): Leave the body to be read with `iter_content`; the caller
+                must close the response.
+            audio_url (Optional[str]): The audio link returned by the API, required
+                when the API signs its audio links.
 
         Returns:
             requests.Response: The response from the API with the audio file.
         """
-        audio_url = f"{self.api_url}/audio/{filename}"
-        response = requests.get(audio_url)
+        if audio_url:
+            audio_url = f"{self.api_url.rstrip('/')}{audio_url}"
+        else:
+            audio_url = f"{self.api_url}/audio/{filename}"
+        response = self.session.get(audio_url, timeout=self.timeout, stream=stream)
         return response
 
+    def public_audio_url(
+        self,
+        audio_url: str
+    ) -> str:
+        """
+        Get the absolute audio link for the browser.
+
+        Args:
+            audio_url (str): The audio link returned by the API.
+
+        Returns:
+            str: The link on the public API URL.
+        """
+        return f"{self.public_url.rstrip('/')}{audio_url}"
+
+    def _get_adapter(self) -> HTTPAdapter:
+        """
+        Build the connection pool adapter.
+
+        Connection failures are retried for every request, since nothing was sent;
+        failed responses are only retried for GET, as a feedback POST is not
+        idempotent.
+
+        Returns:
+            HTTPAdapter: The adapter, with a pool of `API_POOL_SIZE` connections.
+        """
+        retry = Retry(
+            total=settings.api_retries,
+            backoff_factor=settings.api_retry_backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+
+        return HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.api_pool_size,
+            max_retries=retry,
+        )
+
 
 api_client = APIClient()
@@ -1,67 +1,124 @@
-import os
+from collections import OrderedDict
+from typing import Optional
+
+import requests
 import streamlit as st
-from typing import Union
 
 from src.api_client import APIClient, api_client
 from src.settings import settings
 
+MEDIA_TYPES = {"mp3": "audio/mpeg", "ogg": "audio/ogg", "wav": "audio/wav"}
+CHUNK_SIZE = 64 * 1024
+
 
 class Audio():
-    def __init__(self):
-        self.audio_dir = settings.audio_path
-        self.api_client: APIClient = api_client
+    """
+    Downloads the response audio and keeps it in memory, scoped to the Streamlit session.
 
-    def clear(self):
-        """
-        Deletes the existing audio files in the local folder.
-        """
+    Each session keeps its clips in `st.session_state`, least recently played
+    first, within `AUDIO_SESSION_MAX_MB`.
+    """
+    state_key = "audio_clips"
 
-        if os.path.exists(self.audio_dir):
-            for file in os.listdir(self.audio_dir):
-                file_path = os.path.join(self.audio_dir, file)
-                os.remove(file_path)
-        else:
-            os.makedirs(self.audio_dir)
+    def __init__(self):
+        self.max_bytes = int(settings.audio_session_max_mb * 1024 * 1024)
+        self.api_client: APIClient = api_client
 
     def download(
         self,
-        filename: str
-    ) -> Union[str, None]:
+        filename: str,
+        audio_url: Optional[str] = None
+    ) -> Optional[bytes]:
         """
-        Downloads the audio file from the API and saves it locally.
+        Downloads the audio file from the API, streaming it into the session memory.
+
+        Args:
+            filename (str): The audio file name.
+            audio_url (Optional[str]): The audio link returned by the API.
+
+        Returns:
+            Optional[bytes]: The audio, or None if it could not be downloaded.
         """
+        clips = self._clips()
+        if filename in clips:
+            clips.move_to_end(filename)
+            return clips[filename]
 
-        response = self.api_client.get_audio(filename)
+        try:
+            response = self.api_client.get_audio(filename, stream=True, audio_url=audio_url)
+        except requests.RequestException:
+            st.error("Failed to download the audio file.")
+            return None
 
-        audio_path = self._audio_file(filename)
+        try:
+            if response.status_code != 200:
+                st.error("Failed to download the audio file.")
+                return None
 
-        if response.status_code == 200:
-            with open(audio_path, "wb") as audio_file:
-                audio_file.write(response.content)
-            return audio_path
-        else:
+            audio = bytearray()
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                audio += chunk
+                if len(audio) > self.max_bytes:
+                    st.error("The audio file is too large to play.")
+                    return None
+        except requests.RequestException:
             st.error("Failed to download the audio file.")
             return None
+        finally:
+            response.close()
+
+        self._keep(filename, bytes(audio))
+
+        return clips[filename]
 
     def play(
         self,
-        audio_filename: str
+        audio_filename: str,
+        audio_data: Optional[bytes] = None
     ):
         """
-        Plays the downloaded audio file from the local directory.
+        Plays the given audio, or a downloaded audio file from the session memory.
         """
+        audio = audio_data if audio_data is not None else self._clips().get(audio_filename)
 
-        audio_path = self._audio_file(audio_filename)
-
-        if os.path.exists(audio_path):
-            with open(audio_path, "rb") as audio_file:
-                st.audio(audio_file.read(), format="audio/mpeg")
+        if audio is not None:
+            st.audio(audio, format=self._media_type(audio_filename))
         else:
             st.error("Audio file not found.")
 
-    def _audio_file(self, audio_filename: str):
-        """Returns the audio file path."""
-        return os.path.join(self.audio_dir, audio_filename)
+    def play_link(
+        self,
+        audio_filename: str,
+        audio_url: str
+    ):
+        """
+        Plays the audio straight from the API, so the browser streams it and the
+        UI server never holds the bytes.
+        """
+        st.audio(
+            self.api_client.public_audio_url(audio_url),
+            format=self._media_type(audio_filename),
+        )
+
+    def _keep(self, filename: str, audio: bytes) -> None:
+        """Keeps a clip, dropping the least recently played ones over the memory cap."""
+        clips = self._clips()
+        clips[filename] = audio
+
+        total = sum(len(clip) for clip in clips.values())
+        while total > self.max_bytes and len(clips) > 1:
+            _, evicted = clips.popitem(last=False)
+            total -= len(evicted)
+
+    def _clips(self) -> "OrderedDict[str, bytes]":
+        """Returns the session's clips, by file name."""
+        if self.state_key not in st.session_state:
+            st.session_state[self.state_key] = OrderedDict()
+        return st.session_state[self.state_key]
+
+    def _media_type(self, audio_filename: str) -> str:
+        """Returns the audio media type, from the file extension."""
+        return MEDIA_TYPES.get(audio_filename.rsplit(".", 1)[-1], "audio/mpeg")
 
 
 audio = Audio()
@@ -1,16 +1,29 @@
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
 import streamlit as st
 
 from src.audio import Audio, audio
 from src.api_client import APIClient, api_client
+from src.result_cache import ResultCache, result_cache
+from src.settings import settings
 
 
 class Feedback():
     """
     Process the user feedback, display the sentiment, AI-generated response, and handle audio output.
+
+    Results are reused from the shared result cache for the same feedback text, and
+    the last one is kept in the session state so reruns show it again. In direct
+    audio mode a result is not reused past the expiry of its signed audio link.
     """
+    state_key = "feedback_result"
+
     def __init__(self):
         self.api_client: APIClient = api_client
         self.audio: Audio = audio
+        self.cache: ResultCache = result_cache
         self.colors = {
             "POSITIVE": "#1B5E20",  # Green
             "NEGATIVE": "#B71C1C",  # Red
@@ -28,15 +41,61 @@ class Feedback():
         Args:
             feedback (str): The user's feedback text.
         """
-        self.audio.clear()
+        result = self.cache.get(feedback)
+
+        if result is not None:
+            st.session_state[self.state_key] = result
+            self.render_result(result)
+            return
+
+        if settings.feedback_streaming:
+            result = self._stream_feedback(feedback)
+        else:
+            result = self._post_feedback(feedback)
+
+        if result is None:
+            return
+
+        st.session_state[self.state_key] = result
+        if self._process_audio(result):
+            self.cache.set(feedback, result, expires=self._link_expires(result))
+
+    def render_result(
+        self,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Displays a previous result again, without calling the API.
+
+        Args:
+            result (Dict[str, Any]): The sentiment, response and audio.
+        """
+        self.display_sentiment(result.get('sentiment', 'NEUTRAL').upper())
+
+        st.write(result.get('response', 'No response provided.'))
+
+        self._play_audio(result)
 
+    def _post_feedback(
+        self,
+        feedback: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sends the user feedback to the API and displays the sentiment and response.
+
+        Args:
+            feedback (str): The user's feedback text.
+
+        Returns:
+            Optional[Dict[str, Any]]: The result, or None on failure.
+        """
         try:
             with st.spinner("Processing feedback..."):
                 response = self.api_client.post_feedback(feedback)
                 response.raise_for_status()
         except Exception:
             st.error("Error processing feedback. Please try again.")
-            return
+            return None
 
         result = response.json()
 
@@ -44,7 +103,53 @@ class Feedback():
 
         st.write(result.get('response', 'No response provided.'))
 
-        self._process_audio(result.get('audio', ''))
+        return result
+
+    def _stream_feedback(
+        self,
+        feedback: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Processes the user feedback as the API streams it: the sentiment is shown
+        as soon as it is analyzed, and the response token by token.
+
+        Args:
+            feedback (str): The user's feedback text.
+
+        Returns:
+            Optional[Dict[str, Any]]: The result, or None on failure.
+        """
+        result: Dict[str, Any] = {}
+
+        try:
+            with st.spinner("Processing feedback..."):
+                events = self.api_client.stream_feedback(feedback)
+                event, data = next(events, ("error", {}))
+                if event != "sentiment":
+                    raise RuntimeError(data.get("detail", "No sentiment returned"))
+
+            self.display_sentiment(data.get('sentiment', 'NEUTRAL').upper())
+
+            def tokens():
+                for event, data in events:
+                    if event == "token":
+                        yield data["token"]
+                    elif event == "audio":
+                        result.update(data)
+                    elif event == "error":
+                        raise RuntimeError(data.get("detail"))
+
+            st.write_stream(tokens())
+
+            if not result:
+                raise RuntimeError("The feedback stream ended early")
+        except Exception:
+            st.error("Error processing feedback. Please try again.")
+            return None
+
+        result["sentiment"] = data.get('sentiment', 'NEUTRAL')
+
+        return result
 
     def submit_feedback(self):
         """
@@ -81,22 +186,91 @@ class Feedback():
 
     def _process_audio(
         self,
-        audio_filename: str
-    ):
+        result: Dict[str, Any]
+    ) -> bool:
         """
-        Downloads and plays the audio file from the API response.
+        Downloads the audio file of the API response into the result, unless the
+        browser plays it from the API in direct mode, and plays it.
 
         Args:
-            audio_filename (str): Audio filename.
-        """
-        if audio_filename:
-            audio_path = self.audio.download(audio_filename)
-            if audio_path:
-                self.audio.play(audio_filename)
-            else:
-                st.warning("Audio file could not be downloaded.")
-        else:
+            result (Dict[str, Any]): The API response.
+
+        Returns:
+            bool: Whether the result is complete and can be reused.
+        """
+        audio_filename = result.get('audio', '')
+
+        if audio_filename and settings.audio_mode != "direct":
+            result['audio_data'] = self.audio.download(audio_filename, result.get('audio_url'))
+
+        self._play_audio(result)
+
+        return result.get('audio_data', b"") is not None
+
+    def _play_audio(
+        self,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Plays the audio of a result.
+
+        Args:
+            result (Dict[str, Any]): The result, with the downloaded audio, or its
+                link in direct mode.
+        """
+        audio_filename = result.get('audio', '')
+
+        if not audio_filename:
             st.info("No audio file returned by the API.")
+        elif settings.audio_mode == "direct" and self._link_expired(result):
+            st.info("The audio link has expired. Submit the feedback again to listen to it.")
+        elif settings.audio_mode == "direct":
+            self.audio.play_link(
+                audio_filename, result.get('audio_url') or f"/audio/{audio_filename}"
+            )
+        elif result.get('audio_data') is not None:
+            self.audio.play(audio_filename, result['audio_data'])
+        else:
+            st.warning("Audio file could not be downloaded.")
+
+    def _link_expires(
+        self,
+        result: Dict[str, Any]
+    ) -> Optional[float]:
+        """
+        Gets when the signed audio link of a result expires, in direct mode.
+
+        Args:
+            result (Dict[str, Any]): The result.
+
+        Returns:
+            Optional[float]: The link expiry as a Unix timestamp, or None if the audio
+                is downloaded by the UI or the link is not signed.
+        """
+        if settings.audio_mode != "direct":
+            return None
+
+        expires = parse_qs(urlsplit(result.get('audio_url') or "").query).get('expires')
+        try:
+            return float(expires[0]) if expires else None
+        except ValueError:
+            return None
+
+    def _link_expired(
+        self,
+        result: Dict[str, Any]
+    ) -> bool:
+        """
+        Checks whether the signed audio link of a result has expired, in direct mode.
+
+        Args:
+            result (Dict[str, Any]): The result.
+
+        Returns:
+            bool: Whether the link can no longer be played.
+        """
+        expires = self._link_expires(result)
+        return expires is not None and expires <= time.time()
 
 
 feedback = Feedback()
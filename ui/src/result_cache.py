@@ -0,0 +1,116 @@
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.settings import settings
+
+
+class ResultCache:
+    """
+    Bounded, thread-safe cache of feedback results, shared by every Streamlit session.
+
+    Results are keyed by the normalized feedback text, so resubmitting the same
+    feedback, even with different case or spacing, is answered without calling the
+    API again. Entries expire after `ttl` seconds and the least recently used are
+    evicted to keep the results, audio included, within `max_bytes`.
+
+    Attributes:
+        max_bytes (int): Maximum bytes of results kept.
+        ttl (float): Seconds a result stays valid.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found or expired.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, int, Dict[str, Any]]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, feedback: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached result of a feedback and mark it as recently used.
+
+        Args:
+            feedback (str): The feedback text.
+
+        Returns:
+            Optional[Dict[str, Any]]: The result, or None if missing or expired.
+        """
+        key = self._key(feedback)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(
+        self, feedback: str, result: Dict[str, Any], expires: Optional[float] = None
+    ) -> None:
+        """
+        Store the result of a feedback, evicting the least recently used results
+        over the memory cap. Results larger than the cap are not kept.
+
+        Args:
+            feedback (str): The feedback text.
+            result (Dict[str, Any]): The result: sentiment, response and audio.
+            expires (Optional[float]): Unix time after which the result is no longer
+                valid, such as the expiry of its signed audio link, if sooner than
+                the cache TTL.
+        """
+        ttl = self.ttl
+        if expires is not None:
+            ttl = min(ttl, expires - time.time())
+
+        if ttl <= 0:
+            return
+
+        key = self._key(feedback)
+        size = self._size(result)
+
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (time.monotonic() + ttl, size, result)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry; the caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _key(self, feedback: str) -> str:
+        """Normalize the feedback text: Unicode form, case and whitespace."""
+        return " ".join(unicodedata.normalize("NFKC", feedback).casefold().split())
+
+    def _size(self, result: Dict[str, Any]) -> int:
+        """Approximate the memory held by a result."""
+        return sum(
+            len(value) for value in result.values() if isinstance(value, (str, bytes))
+        )
+
+
+result_cache = ResultCache(
+    max_bytes=int(settings.result_cache_max_mb * 1024 * 1024),
+    ttl=settings.result_cache_ttl,
+)
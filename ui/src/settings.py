@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,10 +13,78 @@ class Settings(BaseSettings):
         alias=AliasChoices("API_URL"), description="API URL"
     )
 
-    audio_path: str = Field(
-        alias=AliasChoices("AUDIO_PATH"),
-        description="Path to save and retrieve audio files",
-        default="audio",
+    api_public_url: Optional[str] = Field(
+        alias=AliasChoices("API_PUBLIC_URL"),
+        description="API URL reachable from the browser, for direct audio playback",
+        default=None,
+    )
+
+    feedback_streaming: bool = Field(
+        alias=AliasChoices("FEEDBACK_STREAMING"),
+        description="Show the sentiment and the response as the API streams them",
+        default=False,
+    )
+
+    audio_mode: Literal["proxy", "direct"] = Field(
+        alias=AliasChoices("AUDIO_MODE"),
+        description="Download the audio through the UI server, or let the browser stream it from the API",
+        default="proxy",
+    )
+
+    audio_session_max_mb: float = Field(
+        alias=AliasChoices("AUDIO_SESSION_MAX_MB"),
+        description="Maximum megabytes of audio kept in memory per session",
+        default=10,
+        gt=0,
+    )
+
+    api_pool_size: int = Field(
+        alias=AliasChoices("API_POOL_SIZE"),
+        description="Connections kept open to the API, shared by every session",
+        default=10,
+        gt=0,
+    )
+
+    api_connect_timeout: float = Field(
+        alias=AliasChoices("API_CONNECT_TIMEOUT"),
+        description="Seconds to wait for a connection to the API",
+        default=3.05,
+        gt=0,
+    )
+
+    api_read_timeout: float = Field(
+        alias=AliasChoices("API_READ_TIMEOUT"),
+        description="Seconds to wait for the API to answer",
+        default=60,
+        gt=0,
+    )
+
+    api_retries: int = Field(
+        alias=AliasChoices("API_RETRIES"),
+        description="Retries of failed connections and idempotent API requests",
+        default=3,
+        ge=0,
+    )
+
+    api_retry_backoff: float = Field(
+        alias=AliasChoices("API_RETRY_BACKOFF"),
+        description="Backoff factor between retries, in seconds",
+        default=0.5,
+        ge=0,
+    )
+
+    result_cache_ttl: float = Field(
+        alias=AliasChoices("RESULT_CACHE_TTL"),
+        description="Seconds a feedback result is reused for the same feedback text (0 disables the cache)",
+        default=240,
+        ge=0,
+    )
+
+    result_cache_max_mb: float = Field(
+        alias=AliasChoices("RESULT_CACHE_MAX_MB"),
+        description="Maximum megabytes of cached feedback results, audio included",
+        default=64,
+        gt=0,
     )
 
     model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
@@ -44,6 +44,8 @@ class UI:
                 self.feedback.process_feedback(feedback_text)
             else:
                 st.warning("Please enter some feedback before submitting.")
+        elif self.feedback.state_key in st.session_state:
+            self.feedback.render_result(st.session_state[self.feedback.state_key])
 
 
 ui = UI()
@@ -1,7 +1,11 @@
+import threading
 import pytest
-from typing import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List
 from unittest.mock import patch, MagicMock
 
+import requests
+
 from src.api_client import APIClient
 from src.settings import settings
 
@@ -10,7 +14,7 @@ class TestAPIClient:
     """Test suite for the API Client"""
     @pytest.fixture
     def mock_get_audio(self) -> Generator[MagicMock, None, None]:
-        with patch("requests.get") as mock:
+        with patch.object(requests.Session, "get") as mock:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"audio_data"
@@ -19,7 +23,7 @@ class TestAPIClient:
 
     @pytest.fixture
     def mock_post_feedback(self) -> Generator[MagicMock, None, None]:
-        with patch("requests.post") as mock:
+        with patch.object(requests.Session, "post") as mock:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -35,6 +39,49 @@ class TestAPIClient:
     def client(self) -> APIClient:
         return APIClient()
 
+    @pytest.fixture
+    def stub_api(self) -> Generator[tuple, None, None]:
+        """Local API answering 503 to the first request of each path, then 200."""
+        requests_seen: List[str] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _answer(self):
+                requests_seen.append(f"{self.command} {self.path}")
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                first = requests_seen.count(f"{self.command} {self.path}") == 1
+                body = b"busy" if first else b"audio_data"
+                self.send_response(503 if first else 200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _answer
+            do_POST = _answer
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        with patch(
+            "src.api_client.settings",
+            settings.model_copy(
+                update={
+                    "api_url": f"http://127.0.0.1:{server.server_port}",
+                    "api_retry_backoff": 0,
+                }
+            ),
+        ):
+            yield APIClient(), requests_seen
+
+        server.shutdown()
+        server.server_close()
+
     def test_get_audio(
         self,
         mock_get_audio: MagicMock,
@@ -43,10 +90,65 @@ class TestAPIClient:
         """Test if get_audio correctly requests the audio file."""
         response = client.get_audio("test_audio.mp3")
 
-        mock_get_audio.assert_called_once_with(f"{settings.api_url}/audio/test_audio.mp3")
+        mock_get_audio.assert_called_once_with(
+            f"{settings.api_url}/audio/test_audio.mp3",
+            timeout=(settings.api_connect_timeout, settings.api_read_timeout),
+            stream=False,
+        )
         assert response.status_code == 200
         assert response.content == b"audio_data"
 
+    def test_stream_feedback(self, client: APIClient):
+        """Test that stream_feedback parses the server-sent events as they arrive."""
+        lines = [
+            b"event: sentiment", b'data: {"sentiment": "positive"}', b"",
+            b": keep-alive", b"",
+            b"event: token", b'data: {"token": "Thank you!"}', b"",
+            b"event: audio", b'data: {"response": "Thank you!", "audio": "a.mp3"}', b"",
+        ]
+        with patch.object(requests.Session, "post") as mock_post:
+            response = mock_post.return_value.__enter__.return_value
+            response.iter_lines.return_value = iter(lines)
+
+            events = list(client.stream_feedback("Great app!"))
+
+        mock_post.assert_called_once_with(
+            f"{settings.api_url}/feedback/stream",
+            json={"feedback": "Great app!"},
+            timeout=(settings.api_connect_timeout, settings.api_read_timeout),
+            stream=True,
+        )
+        response.raise_for_status.assert_called_once()
+        assert events == [
+            ("sentiment", {"sentiment": "positive"}),
+            ("token", {"token": "Thank you!"}),
+            ("audio", {"response": "Thank you!", "audio": "a.mp3"}),
+        ]
+
+    def test_get_audio_link(self, mock_get_audio: MagicMock):
+        """Test that get_audio follows the audio link returned by the API."""
+        with patch(
+            "src.api_client.settings", settings.model_copy(update={"api_url": "http://api/"})
+        ):
+            client = APIClient()
+
+        client.get_audio("a.mp3", audio_url="/audio/a.mp3?expires=1&signature=s")
+
+        assert mock_get_audio.call_args.args[0] == "http://api/audio/a.mp3?expires=1&signature=s"
+
+    def test_public_audio_url(self):
+        """Test that browser links use the public API URL when set."""
+        with patch(
+            "src.api_client.settings",
+            settings.model_copy(
+                update={"api_url": "http://api", "api_public_url": "https://sentiovoice/api/"}
+            ),
+        ):
+            client = APIClient()
+
+        assert client.public_audio_url("/audio/a.mp3") == "https://sentiovoice/api/audio/a.mp3"
+        assert APIClient().public_audio_url("/audio/a.mp3") == f"{settings.api_url}/audio/a.mp3"
+
     def test_post_feedback(
         self,
         mock_post_feedback: MagicMock,
@@ -57,10 +159,44 @@ class TestAPIClient:
         response = client.post_feedback(feedback)
 
         mock_post_feedback.assert_called_once_with(
-            f"{settings.api_url}/feedback", json={"feedback": feedback}
+            f"{settings.api_url}/feedback",
+            json={"feedback": feedback},
+            timeout=(settings.api_connect_timeout, settings.api_read_timeout),
         )
         assert response.status_code == 200
         assert response.json()["feedback"] == "Great app!"
         assert response.json()["sentiment"] == "positive"
         assert response.json()["response"] == "Thank you!"
         assert response.json()["audio"] == "response_audio.mp3"
+
+    def test_sessions_share_the_connection_pool(self, client: APIClient):
+        """Test that each thread gets its own session on the same adapter."""
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(client.session))
+        thread.start()
+        thread.join()
+
+        assert client.session is client.session
+        assert sessions[0] is not client.session
+        assert sessions[0].get_adapter("http://api/") is client.adapter
+        assert client.session.get_adapter("https://api/") is client.adapter
+        assert client.adapter._pool_maxsize == settings.api_pool_size
+
+    def test_get_is_retried(self, stub_api: tuple):
+        """Test that a failed GET is retried."""
+        client, requests_seen = stub_api
+
+        response = client.get_audio("test_audio.mp3")
+
+        assert response.status_code == 200
+        assert response.content == b"audio_data"
+        assert requests_seen == ["GET /audio/test_audio.mp3"] * 2
+
+    def test_post_is_not_retried(self, stub_api: tuple):
+        """Test that a failed feedback POST is not sent twice."""
+        client, requests_seen = stub_api
+
+        response = client.post_feedback("Great app!")
+
+        assert response.status_code == 503
+        assert requests_seen == ["POST /feedback"]
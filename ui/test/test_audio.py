@@ -1,42 +1,30 @@
 import pytest
-import os
 from typing import Generator
 from unittest.mock import patch, MagicMock
 
+import requests
+import streamlit as st
+
 from src.audio import Audio
 
 
 class TestAudio:
     """Test suite for the Audio module."""
+    @pytest.fixture(autouse=True)
+    def clear_session_state(self) -> Generator[None, None, None]:
+        st.session_state.pop(Audio.state_key, None)
+        yield
+        st.session_state.pop(Audio.state_key, None)
+
     @pytest.fixture
     def mock_get(self) -> Generator[MagicMock, None, None]:
-        with patch("requests.get") as mock:
+        with patch.object(requests.Session, "get") as mock:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"audio_data"
+            mock_response.iter_content.return_value = iter([b"audio", b"_data"])
             mock.return_value = mock_response
             yield mock
 
-    @pytest.fixture
-    def mock_os_exists(self) -> Generator[MagicMock, None, None]:
-        with patch("os.path.exists", return_value=True) as mock:
-            yield mock
-
-    @pytest.fixture
-    def mock_os_listdir(self) -> Generator[MagicMock, None, None]:
-        with patch("os.listdir", return_value=["test_audio.mp3"]) as mock:
-            yield mock
-
-    @pytest.fixture
-    def mock_os_remove(self) -> Generator[MagicMock, None, None]:
-        with patch("os.remove") as mock:
-            yield mock
-
-    @pytest.fixture
-    def mock_os_makedirs(self) -> Generator[MagicMock, None, None]:
-        with patch("os.makedirs") as mock:
-            yield mock
-
     @pytest.fixture
     def mock_streamlit_error(self) -> Generator[MagicMock, None, None]:
         with patch("streamlit.error") as mock:
@@ -51,28 +39,19 @@ class TestAudio:
     def audio(self) -> Audio:
         return Audio()
 
-    def test_clear(
-        self,
-        mock_os_exists: MagicMock,
-        mock_os_listdir: MagicMock,
-        mock_os_remove: MagicMock,
-        mock_os_makedirs: MagicMock,
-        audio: Audio
-    ):
-        """Test that clear method correctly removes files and creates the audio directory."""
-        audio.clear()
-        mock_os_remove.assert_called_once_with(os.path.join(audio.audio_dir, "test_audio.mp3"))
-
     def test_download_success(
         self,
         mock_get: MagicMock,
         audio: Audio
     ):
-        """Test that download method correctly saves the audio file."""
-        with patch("builtins.open", new_callable=MagicMock) as mock_open:
-            file_path = audio.download("test_audio.mp3")
-            mock_open.assert_called_once_with(os.path.join(audio.audio_dir, "test_audio.mp3"), "wb")
-            assert file_path == os.path.join(audio.audio_dir, "test_audio.mp3")
+        """Test that download streams the audio into the session memory."""
+        assert audio.download("test_audio.mp3") == b"audio_data"
+        assert audio.download("test_audio.mp3") == b"audio_data"
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["stream"] is True
+        mock_get.return_value.close.assert_called_once()
+        assert st.session_state[Audio.state_key] == {"test_audio.mp3": b"audio_data"}
 
     def test_download_failure(
         self,
@@ -82,28 +61,110 @@ class TestAudio:
     ):
         """Test that download method handles API failure properly."""
         mock_get.return_value.status_code = 500
-        file_path = audio.download("test_audio.mp3")
+        assert audio.download("test_audio.mp3") is None
+        mock_streamlit_error.assert_called_once_with("Failed to download the audio file.")
+        mock_get.return_value.close.assert_called_once()
+
+    def test_download_connection_error(
+        self,
+        mock_get: MagicMock,
+        mock_streamlit_error: MagicMock,
+        audio: Audio
+    ):
+        """Test that download handles connection errors properly."""
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
+        assert audio.download("test_audio.mp3") is None
         mock_streamlit_error.assert_called_once_with("Failed to download the audio file.")
-        assert file_path is None
 
+    def test_download_too_large(
+        self,
+        mock_get: MagicMock,
+        mock_streamlit_error: MagicMock,
+        audio: Audio
+    ):
+        """Test that download stops reading a clip over the session memory cap."""
+        audio.max_bytes = 6
+        mock_get.return_value.iter_content.return_value = iter([b"audio", b"_data", b"more"])
+
+        assert audio.download("test_audio.mp3") is None
+        mock_streamlit_error.assert_called_once_with("The audio file is too large to play.")
+        assert Audio.state_key not in st.session_state or not st.session_state[Audio.state_key]
+
+    def test_download_evicts_least_recently_played(
+        self,
+        mock_get: MagicMock,
+        audio: Audio
+    ):
+        """Test that older clips are dropped to keep the session under the memory cap."""
+        audio.max_bytes = 25
+        mock_get.return_value.iter_content.side_effect = lambda chunk_size: iter([b"x" * 10])
+
+        audio.download("a.mp3")
+        audio.download("b.mp3")
+        audio.download("a.mp3")
+        audio.download("c.mp3")
+
+        assert list(st.session_state[Audio.state_key]) == ["a.mp3", "c.mp3"]
+
+    def test_sessions_do_not_share_audio(
+        self,
+        mock_get: MagicMock,
+        audio: Audio
+    ):
+        """Test that the clips are kept in the session state."""
+        audio.download("test_audio.mp3")
+        st.session_state.pop(Audio.state_key)
+
+        assert audio.download("test_audio.mp3") is not None
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize(
+        "filename, media_type",
+        [("test_audio.mp3", "audio/mpeg"), ("test_audio.ogg", "audio/ogg")],
+    )
     def test_play_success(
         self,
-        mock_os_exists: MagicMock,
+        mock_get: MagicMock,
+        mock_streamlit_audio: MagicMock,
+        audio: Audio,
+        filename: str,
+        media_type: str
+    ):
+        """Test that play passes the downloaded bytes straight to the player."""
+        audio.download(filename)
+        audio.play(filename)
+        mock_streamlit_audio.assert_called_once_with(b"audio_data", format=media_type)
+
+    def test_download_signed_link(
+        self,
+        mock_get: MagicMock,
+        audio: Audio
+    ):
+        """Test that download follows the audio link returned by the API."""
+        audio.download("test_audio.mp3", "/audio/test_audio.mp3?expires=1&signature=s")
+        assert mock_get.call_args.args[0].endswith("/audio/test_audio.mp3?expires=1&signature=s")
+
+    def test_play_link(
+        self,
         mock_streamlit_audio: MagicMock,
         audio: Audio
     ):
-        """Test that play plays an existing file."""
-        with patch("builtins.open", new_callable=MagicMock) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = b"audio_data"
-            audio.play("test_audio.mp3")
-            mock_streamlit_audio.assert_called_once_with(b"audio_data", format="audio/mpeg")
+        """Test that direct playback hands the browser the API link."""
+        audio.api_client = MagicMock()
+        audio.api_client.public_audio_url.return_value = "https://api/audio/a.ogg?signature=s"
+
+        audio.play_link("a.ogg", "/audio/a.ogg?signature=s")
+
+        audio.api_client.public_audio_url.assert_called_once_with("/audio/a.ogg?signature=s")
+        mock_streamlit_audio.assert_called_once_with(
+            "https://api/audio/a.ogg?signature=s", format="audio/ogg"
+        )
 
     def test_play_failure(
         self,
         mock_streamlit_error: MagicMock,
         audio: Audio
     ):
-        """Test that play handles missing file properly."""
-        with patch("os.path.exists", return_value=False):
-            audio.play("test_audio.mp3")
-            mock_streamlit_error.assert_called_once_with("Audio file not found.")
+        """Test that play handles a missing clip properly."""
+        audio.play("test_audio.mp3")
+        mock_streamlit_error.assert_called_once_with("Audio file not found.")
@@ -1,10 +1,14 @@
+import time
 import pytest
 from typing import Generator
 
 from unittest.mock import patch, MagicMock
 
+import streamlit as st
+
 from src.feedback import Feedback
 from src.audio import Audio
+from src.result_cache import ResultCache
 
 
 class TestFeedback:
@@ -17,19 +21,15 @@ class TestFeedback:
             mock_response.json.return_value = {
                 "sentiment": "POSITIVE",
                 "response": "Thank you for your feedback!",
-                "audio": "feedback_audio.mp3"
+                "audio": "feedback_audio.mp3",
+                "audio_url": "/audio/feedback_audio.mp3?expires=4102444800&signature=s"
             }
             mock_post_feedback.return_value = mock_response
             yield mock_post_feedback
 
-    @pytest.fixture
-    def mock_audio_clear(self) -> Generator[MagicMock, None, None]:
-        with patch.object(Audio, "clear") as mock_clear:
-            yield mock_clear
-
     @pytest.fixture
     def mock_audio_download(self) -> Generator[MagicMock, None, None]:
-        with patch.object(Audio, "download", return_value="/path/to/audio.mp3") as mock_download:
+        with patch.object(Audio, "download", return_value=b"audio_data") as mock_download:
             yield mock_download
 
     @pytest.fixture
@@ -63,13 +63,35 @@ class TestFeedback:
             yield mock_markdown
 
     @pytest.fixture
-    def feedback(self) -> Feedback:
-        return Feedback()
+    def mock_stream_feedback(self) -> Generator[MagicMock, None, None]:
+        with patch("src.api_client.APIClient.stream_feedback") as mock_stream_feedback, \
+                patch("src.feedback.settings") as mock_settings, \
+                patch("streamlit.write_stream", side_effect=lambda stream: "".join(stream)):
+            mock_settings.feedback_streaming = True
+            mock_settings.audio_mode = "proxy"
+            mock_stream_feedback.return_value = iter([
+                ("sentiment", {"sentiment": "positive"}),
+                ("token", {"token": "Thank you"}),
+                ("token", {"token": "!"}),
+                ("audio", {
+                    "response": "Thank you!",
+                    "audio": "feedback_audio.mp3",
+                    "audio_url": "/audio/feedback_audio.mp3",
+                }),
+            ])
+            yield mock_stream_feedback
+
+    @pytest.fixture
+    def feedback(self) -> Generator[Feedback, None, None]:
+        feedback = Feedback()
+        feedback.cache = ResultCache(max_bytes=1024 * 1024, ttl=60)
+        st.session_state.pop(Feedback.state_key, None)
+        yield feedback
+        st.session_state.pop(Feedback.state_key, None)
 
     def test_process_feedback_success(
         self,
         mock_api_post_feedback: MagicMock,
-        mock_audio_clear: MagicMock,
         mock_audio_download: MagicMock,
         mock_audio_play: MagicMock,
         mock_streamlit_write: MagicMock,
@@ -79,9 +101,10 @@ class TestFeedback:
         feedback.process_feedback("Great job!")
 
         mock_api_post_feedback.assert_called_once_with("Great job!")
-        mock_audio_clear.assert_called_once()
-        mock_audio_download.assert_called_once_with("feedback_audio.mp3")
-        mock_audio_play.assert_called_once_with("feedback_audio.mp3")
+        mock_audio_download.assert_called_once_with(
+            "feedback_audio.mp3", "/audio/feedback_audio.mp3?expires=4102444800&signature=s"
+        )
+        mock_audio_play.assert_called_once_with("feedback_audio.mp3", b"audio_data")
         mock_streamlit_write.assert_called_with("Thank you for your feedback!")
         mock_streamlit_markdown.assert_called()
 
@@ -110,3 +133,176 @@ class TestFeedback:
         mock_streamlit_write.assert_called_with("Thank you for your feedback!")
         mock_streamlit_info.assert_called_once_with("No audio file returned by the API.")
         mock_streamlit_warning.assert_not_called()
+
+    def test_process_feedback_audio_download_failure(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_audio_play: MagicMock,
+        mock_streamlit_write: MagicMock,
+        mock_streamlit_warning: MagicMock,
+        feedback: Feedback
+    ):
+        mock_audio_download.return_value = None
+        feedback.process_feedback("Great job!")
+
+        mock_audio_play.assert_not_called()
+        mock_streamlit_warning.assert_called_once_with("Audio file could not be downloaded.")
+
+    def test_process_feedback_direct_audio(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_streamlit_write: MagicMock,
+        feedback: Feedback
+    ):
+        with patch("src.feedback.settings") as mock_settings, \
+                patch.object(Audio, "play_link") as mock_play_link:
+            mock_settings.feedback_streaming = False
+            mock_settings.audio_mode = "direct"
+            feedback.process_feedback("Great job!")
+
+        mock_play_link.assert_called_once_with(
+            "feedback_audio.mp3", "/audio/feedback_audio.mp3?expires=4102444800&signature=s"
+        )
+        mock_audio_download.assert_not_called()
+
+    def test_process_feedback_direct_audio_cached_until_link_expiry(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_streamlit_write: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        mock_streamlit_info: MagicMock,
+        feedback: Feedback
+    ):
+        expires = time.time() + 30
+        mock_api_post_feedback.return_value.json.return_value["audio_url"] = (
+            f"/audio/feedback_audio.mp3?expires={expires}&signature=s"
+        )
+
+        with patch("src.feedback.settings") as mock_settings, \
+                patch.object(Audio, "play_link") as mock_play_link:
+            mock_settings.feedback_streaming = False
+            mock_settings.audio_mode = "direct"
+            feedback.process_feedback("Great job!")
+
+            with patch("src.result_cache.time.monotonic", return_value=time.monotonic() + 31):
+                assert feedback.cache.get("Great job!") is None
+
+            with patch("src.feedback.time.time", return_value=expires + 1):
+                feedback.render_result(st.session_state[Feedback.state_key])
+
+        mock_play_link.assert_called_once()
+        mock_streamlit_info.assert_called_once_with(
+            "The audio link has expired. Submit the feedback again to listen to it."
+        )
+
+    def test_stream_feedback_success(
+        self,
+        mock_stream_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_audio_play: MagicMock,
+        feedback: Feedback
+    ):
+        order = []
+        with patch.object(
+            Feedback, "display_sentiment", side_effect=lambda s: order.append(("sentiment", s))
+        ), patch(
+            "streamlit.write_stream",
+            side_effect=lambda stream: order.append(("response", "".join(stream))),
+        ):
+            feedback.process_feedback("Great job!")
+
+        mock_stream_feedback.assert_called_once_with("Great job!")
+        assert order == [("sentiment", "POSITIVE"), ("response", "Thank you!")]
+        mock_audio_download.assert_called_once_with(
+            "feedback_audio.mp3", "/audio/feedback_audio.mp3"
+        )
+        mock_audio_play.assert_called_once_with("feedback_audio.mp3", b"audio_data")
+
+    def test_stream_feedback_error_event(
+        self,
+        mock_stream_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        mock_streamlit_error: MagicMock,
+        feedback: Feedback
+    ):
+        mock_stream_feedback.return_value = iter([
+            ("sentiment", {"sentiment": "positive"}),
+            ("token", {"token": "Thank"}),
+            ("error", {"detail": "LLM response generation failed"}),
+        ])
+        feedback.process_feedback("Great job!")
+
+        mock_streamlit_error.assert_called_once_with("Error processing feedback. Please try again.")
+        mock_audio_download.assert_not_called()
+
+    def test_stream_feedback_ended_early(
+        self,
+        mock_stream_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        mock_streamlit_error: MagicMock,
+        feedback: Feedback
+    ):
+        mock_stream_feedback.return_value = iter([("sentiment", {"sentiment": "positive"})])
+        feedback.process_feedback("Great job!")
+
+        mock_streamlit_error.assert_called_once_with("Error processing feedback. Please try again.")
+        mock_audio_download.assert_not_called()
+
+    def test_process_feedback_cached(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_audio_play: MagicMock,
+        mock_streamlit_write: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        feedback: Feedback
+    ):
+        feedback.process_feedback("Great job!")
+        feedback.process_feedback("  great   JOB! ")
+
+        mock_api_post_feedback.assert_called_once_with("Great job!")
+        mock_audio_download.assert_called_once()
+        assert mock_audio_play.call_count == 2
+        assert mock_audio_play.call_args.args == ("feedback_audio.mp3", b"audio_data")
+        assert mock_streamlit_write.call_count == 2
+        assert st.session_state[Feedback.state_key]["audio_data"] == b"audio_data"
+
+    def test_process_feedback_not_cached_without_audio(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_audio_download: MagicMock,
+        mock_streamlit_write: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        mock_streamlit_warning: MagicMock,
+        feedback: Feedback
+    ):
+        mock_audio_download.return_value = None
+
+        feedback.process_feedback("Great job!")
+        feedback.process_feedback("Great job!")
+
+        assert mock_api_post_feedback.call_count == 2
+
+    def test_render_result(
+        self,
+        mock_api_post_feedback: MagicMock,
+        mock_audio_play: MagicMock,
+        mock_streamlit_write: MagicMock,
+        mock_streamlit_markdown: MagicMock,
+        feedback: Feedback
+    ):
+        feedback.render_result({
+            "sentiment": "negative",
+            "response": "Sorry to hear that.",
+            "audio": "a.mp3",
+            "audio_data": b"audio",
+        })
+
+        mock_api_post_feedback.assert_not_called()
+        mock_streamlit_write.assert_called_once_with("Sorry to hear that.")
+        assert "Negative feedback" in mock_streamlit_markdown.call_args.args[0]
+        mock_audio_play.assert_called_once_with("a.mp3", b"audio")
@@ -0,0 +1,62 @@
+import time
+from unittest.mock import patch
+
+from src.result_cache import ResultCache
+
+
+class TestResultCache:
+    """Test suite for the feedback result cache."""
+
+    def test_get_set(self):
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        result = {"sentiment": "POSITIVE", "response": "Thanks!", "audio_data": b"audio"}
+
+        assert cache.get("Great app!") is None
+        cache.set("Great app!", result)
+
+        assert cache.get("Great app!") is result
+        assert cache.get("  great\tAPP! ") is result
+        assert cache.get("Great app") is None
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_expired_results(self):
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        cache.set("Great app!", {"response": "Thanks!"})
+
+        with patch("src.result_cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("Great app!") is None
+
+        assert cache._bytes == 0
+
+    def test_expiry_caps_the_ttl(self):
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        cache.set("a", {"response": "Thanks!"}, expires=time.time() + 10)
+        cache.set("b", {"response": "Thanks!"}, expires=time.time() - 1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        with patch("src.result_cache.time.monotonic", return_value=time.monotonic() + 11):
+            assert cache.get("a") is None
+
+    def test_evicts_least_recently_used_over_the_memory_cap(self):
+        cache = ResultCache(max_bytes=25, ttl=60)
+        cache.set("a", {"audio_data": b"x" * 10})
+        cache.set("b", {"audio_data": b"x" * 10})
+        cache.get("a")
+        cache.set("c", {"audio_data": b"x" * 10})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_oversized_results_are_not_kept(self):
+        cache = ResultCache(max_bytes=5, ttl=60)
+        cache.set("a", {"audio_data": b"x" * 10})
+
+        assert cache.get("a") is None
+
+    def test_disabled_without_ttl(self):
+        cache = ResultCache(max_bytes=1024, ttl=0)
+        cache.set("a", {"response": "Thanks!"})
+
+        assert cache.get("a") is None
@@ -10,7 +10,17 @@ class TestSettings:
         """Test that the UI settings are being loaded as expected."""
         settings = Settings()
         assert settings.api_url == "test_api_url"
-        assert settings.audio_path == "test_audio_path"
+        assert settings.audio_session_max_mb == 10
+        assert settings.audio_mode == "proxy"
+        assert settings.feedback_streaming is False
+        assert settings.result_cache_ttl == 240
+        assert settings.result_cache_max_mb == 64
+        assert settings.api_public_url is None
+        assert settings.api_pool_size == 10
+        assert settings.api_connect_timeout == 3.05
+        assert settings.api_read_timeout == 60
+        assert settings.api_retries == 3
+        assert settings.api_retry_backoff == 0.5
 
     def test_settings_immutability(self) -> None:
         """Ensure settings are immutable after creation."""
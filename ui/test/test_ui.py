@@ -108,3 +108,21 @@ class TestUI:
                 on_click=ui.feedback.submit_feedback,
                 disabled=True
             )
+
+    def test_render_app_rerun_shows_last_result(
+        self,
+        mock_process_feedback: MagicMock,
+        mock_streamlit: MagicMock,
+        ui: UI
+    ):
+        # Simulate a rerun after a processed feedback
+        result = {"sentiment": "POSITIVE", "response": "Thanks!", "audio": ""}
+        st.session_state["submitted"] = False
+        st.session_state[ui.feedback.state_key] = result
+
+        with patch("src.feedback.feedback.render_result") as mock_render_result:
+            ui.render_app()
+
+        mock_render_result.assert_called_once_with(result)
+        mock_process_feedback.assert_not_called()
+        del st.session_state[ui.feedback.state_key]